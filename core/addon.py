@@ -3,6 +3,7 @@ import bpy
 # Import all operator and UI classes to register
 from ..ui.panel_main import ARTISTANT_PT_panel
 from ..ops.modeling.smart_group import ARTISTANT_OT_smart_group_operator
+from ..ops.modeling.auto_smart_group import ARTISTANT_OT_auto_smart_group
 from ..ops.modeling.floor_pivot import ARTISTANT_OT_floor_pivot
 from ..ops.modeling.floor_object import ARTISTANT_OT_floor_object
 from ..ops.export.unity_fbx import ARTISTANT_OT_export_unity_fbx
@@ -10,6 +11,9 @@ from ..ops.util.reload_images import ARTISTANT_OT_reload_images
 from ..ops.visualization.visualize_normals import ARTISTANT_OT_visualize_normals
 from ..ops.selection.select_by_name import ARTISTANT_OT_select_by_name
 from ..ops.selection.select_orphans import ARTISTANT_OT_select_orphans
+from ..ops.common.bounds import register_bounds_cache, unregister_bounds_cache
+from ..ops.common.ground_bvh import register_ground_cache, unregister_ground_cache
+from ..ops.selection.name_index import register_name_index, unregister_name_index
 from .properties import register_scene_properties, unregister_scene_properties
 
 
@@ -17,6 +21,7 @@ from .properties import register_scene_properties, unregister_scene_properties
 classes = (
     ARTISTANT_PT_panel,
     ARTISTANT_OT_smart_group_operator,
+    ARTISTANT_OT_auto_smart_group,
     ARTISTANT_OT_floor_pivot,
     ARTISTANT_OT_floor_object,
     ARTISTANT_OT_export_unity_fbx,
@@ -34,11 +39,18 @@ def register():
         bpy.utils.register_class(cls)
     # Register custom scene properties (export folder, export mode, etc.)
     register_scene_properties()
+    # Keep cached object bounds, ground BVHs and the name index in sync with scene edits
+    register_bounds_cache()
+    register_ground_cache()
+    register_name_index()
 
 
 def unregister():
     """Unregister all scene properties and operator/panel classes from Blender."""
-    # Unregister in reverse order: properties first, then classes
+    # Unregister in reverse order: handlers and properties first, then classes
+    unregister_name_index()
+    unregister_ground_cache()
+    unregister_bounds_cache()
     unregister_scene_properties()
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
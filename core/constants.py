@@ -5,7 +5,43 @@
 EXPORT_FOLDER_PROP = "export_folder"
 EXPORT_INDIVIDUAL_PROP = "export_individual"
 EXPORT_ONLY_ORPHANS_PROP = "export_only_orphans"
+EXPORT_SKIP_UNCHANGED_PROP = "export_skip_unchanged"
+EXPORT_PARALLEL_PROP = "export_parallel"
+EXPORT_WORKERS_PROP = "export_workers"
+EXPORT_ZERO_DUPLICATE_PROP = "export_zero_duplicate"
+EXPORT_NATIVE_FBX_PROP = "export_native_fbx"
+EXPORT_INSTANCE_AWARE_PROP = "export_instance_aware"
+EXPORT_PROFILE_PROP = "export_profile"
+EXPORT_TEXTURE_STORE_PROP = "export_texture_store"
+EXPORT_VALIDATE_PROP = "export_validate"
+EXPORT_VALIDATE_FAIL_PROP = "export_validate_fail"
+EXPORT_LODS_PROP = "export_lods"
+EXPORT_LOD_RATIOS_PROP = "export_lod_ratios"
+EXPORT_COLLISION_PROP = "export_collision"
+EXPORT_COLLISION_HULLS_PROP = "export_collision_hulls"
+EXPORT_COLLISION_MAX_VERTS_PROP = "export_collision_max_verts"
+EXPORT_MERGE_BY_MATERIAL_PROP = "export_merge_by_material"
+EXPORT_MERGE_MAX_VERTS_PROP = "export_merge_max_verts"
+EXPORT_ATLAS_PROP = "export_atlas"
+EXPORT_ATLAS_SIZE_PROP = "export_atlas_size"
+EXPORT_VERTEX_CACHE_PROP = "export_vertex_cache"
+EXPORT_ANIMATION_PROP = "export_animation"
+EXPORT_ANIM_REDUCE_PROP = "export_anim_reduce"
+EXPORT_ANIM_POSITION_TOLERANCE_PROP = "export_anim_position_tolerance"
+EXPORT_ANIM_ROTATION_TOLERANCE_PROP = "export_anim_rotation_tolerance"
+EXPORT_ANIM_SCALE_TOLERANCE_PROP = "export_anim_scale_tolerance"
+EXPORT_SKIN_OPTIMIZE_PROP = "export_skin_optimize"
+EXPORT_SKIN_MAX_INFLUENCES_PROP = "export_skin_max_influences"
+EXPORT_SKIN_PRUNE_THRESHOLD_PROP = "export_skin_prune_threshold"
+
+# Export operator runtime state (WindowManager properties, not saved in .blend)
+EXPORT_PROGRESS_PROP = "artistant_export_progress"
+EXPORT_STATUS_PROP = "artistant_export_status"
 
 # Select by Name operator scene properties
 SELECT_BY_NAME_QUERY_PROP = "select_by_name_query"
-SELECT_BY_NAME_EXACT_PROP = "select_by_name_exact"
+SELECT_BY_NAME_MATCH_PROP = "select_by_name_match"
+SELECT_BY_NAME_ACTION_PROP = "select_by_name_action"
+
+# Floor Object operator scene properties
+FLOOR_GROUND_PROP = "floor_ground_collection"
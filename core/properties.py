@@ -5,9 +5,49 @@ from .constants import (
     EXPORT_FOLDER_PROP,
     EXPORT_INDIVIDUAL_PROP,
     EXPORT_ONLY_ORPHANS_PROP,
+    EXPORT_SKIP_UNCHANGED_PROP,
+    EXPORT_PARALLEL_PROP,
+    EXPORT_WORKERS_PROP,
+    EXPORT_ZERO_DUPLICATE_PROP,
+    EXPORT_NATIVE_FBX_PROP,
+    EXPORT_INSTANCE_AWARE_PROP,
+    EXPORT_PROFILE_PROP,
+    EXPORT_TEXTURE_STORE_PROP,
+    EXPORT_VALIDATE_PROP,
+    EXPORT_VALIDATE_FAIL_PROP,
+    EXPORT_LODS_PROP,
+    EXPORT_LOD_RATIOS_PROP,
+    EXPORT_COLLISION_PROP,
+    EXPORT_COLLISION_HULLS_PROP,
+    EXPORT_COLLISION_MAX_VERTS_PROP,
+    EXPORT_MERGE_BY_MATERIAL_PROP,
+    EXPORT_MERGE_MAX_VERTS_PROP,
+    EXPORT_ATLAS_PROP,
+    EXPORT_ATLAS_SIZE_PROP,
+    EXPORT_VERTEX_CACHE_PROP,
+    EXPORT_ANIMATION_PROP,
+    EXPORT_ANIM_REDUCE_PROP,
+    EXPORT_ANIM_POSITION_TOLERANCE_PROP,
+    EXPORT_ANIM_ROTATION_TOLERANCE_PROP,
+    EXPORT_ANIM_SCALE_TOLERANCE_PROP,
+    EXPORT_SKIN_OPTIMIZE_PROP,
+    EXPORT_SKIN_MAX_INFLUENCES_PROP,
+    EXPORT_SKIN_PRUNE_THRESHOLD_PROP,
+    EXPORT_PROGRESS_PROP,
+    EXPORT_STATUS_PROP,
     SELECT_BY_NAME_QUERY_PROP,
-    SELECT_BY_NAME_EXACT_PROP,
+    SELECT_BY_NAME_MATCH_PROP,
+    SELECT_BY_NAME_ACTION_PROP,
+    FLOOR_GROUND_PROP,
 )
+from ..ops.export.atlas import ATLAS_SIZES
+from ..ops.export.collision import MAX_HULL_VERTICES
+from ..ops.export.merge import UINT16_VERTEX_LIMIT
+from ..ops.export.lods import DEFAULT_LOD_RATIOS
+from ..ops.export.skin_weights import DEFAULT_MAX_INFLUENCES, DEFAULT_PRUNE_THRESHOLD
+from ..ops.export.workers import default_worker_count
+from ..ops.selection.name_index import MATCH_CONTAINS, MATCH_ITEMS
+from ..ops.selection.select_by_name import ACTION_ITEMS, ACTION_SET
 
 
 def register_scene_properties():
@@ -41,6 +81,334 @@ def register_scene_properties():
             default=False
         ),
     )
+    # Export settings: skip files whose content hash matches the export manifest
+    setattr(
+        bpy.types.Scene,
+        EXPORT_SKIP_UNCHANGED_PROP,
+        bpy.props.BoolProperty(
+            name="Skip Unchanged",
+            description="Only rewrite FBX files whose objects, materials, textures or export settings changed since the last export into this folder",
+            default=False
+        ),
+    )
+    # Export settings: spread individual exports over background Blender processes
+    setattr(
+        bpy.types.Scene,
+        EXPORT_PARALLEL_PROP,
+        bpy.props.BoolProperty(
+            name="Parallel",
+            description="Individual mode only: export files in background Blender worker processes from a temporary snapshot of the scene",
+            default=False
+        ),
+    )
+    # Export settings: number of background worker processes for parallel export
+    setattr(
+        bpy.types.Scene,
+        EXPORT_WORKERS_PROP,
+        bpy.props.IntProperty(
+            name="Workers",
+            description="Maximum number of background Blender processes used by parallel export",
+            default=default_worker_count(),
+            min=1,
+            max=64
+        ),
+    )
+    # Export settings: export lightweight copies that share data instead of full duplicates
+    setattr(
+        bpy.types.Scene,
+        EXPORT_ZERO_DUPLICATE_PROP,
+        bpy.props.BoolProperty(
+            name="Zero-Duplicate",
+            description="Export data-API copies that share mesh data with the originals instead of running Duplicate/Delete per file. Faster and lighter on memory; originals are never modified",
+            default=False
+        ),
+    )
+    # Export settings: built-in binary FBX writer for static mesh/empty hierarchies
+    setattr(
+        bpy.types.Scene,
+        EXPORT_NATIVE_FBX_PROP,
+        bpy.props.BoolProperty(
+            name="Fast Static FBX",
+            description="Write static MESH/EMPTY hierarchies with the built-in bulk FBX writer. Rigs, shape keys, color attributes, image textures and other object types fall back to the stock exporter automatically",
+            default=False
+        ),
+    )
+    # Export settings: write shared meshes / instanced collections once plus a placement manifest
+    setattr(
+        bpy.types.Scene,
+        EXPORT_INSTANCE_AWARE_PROP,
+        bpy.props.BoolProperty(
+            name="Instance Aware",
+            description="Individual mode only: export each shared mesh or instanced collection once (named after the mesh/collection) and write artistant_instances.json with every instance's world transform",
+            default=False
+        ),
+    )
+    # Export settings: per-phase timing profile written next to the exported files
+    setattr(
+        bpy.types.Scene,
+        EXPORT_PROFILE_PROP,
+        bpy.props.BoolProperty(
+            name="Profile",
+            description="Time every pipeline phase (hash, duplicate, prepare, validate, atlas, merge, lod, reorder, keys, skin, write, cleanup) per file, count objects/vertices/triangles and write artistant_export_profile.csv to the export folder. Exports run in this process (Parallel is ignored)",
+            default=False
+        ),
+    )
+    # Export settings: shared, content-hashed texture folder instead of per-file copies
+    setattr(
+        bpy.types.Scene,
+        EXPORT_TEXTURE_STORE_PROP,
+        bpy.props.EnumProperty(
+            name="Texture Store",
+            description="Write each texture once into the export folder's Textures/ store instead of copying or embedding it into every FBX",
+            items=(
+                ('OFF', "Off", "Use the exporter's own texture handling (Embed Textures copies per file)"),
+                ('REFERENCE', "Reference", "FBX files reference the shared Textures/ folder by relative path"),
+                ('HARDLINK', "Hardlink", "Hardlink stored textures next to the FBX files (copies if links are unsupported)"),
+            ),
+            default='OFF'
+        ),
+    )
+    # Export settings: geometry validation of the export duplicates before writing
+    setattr(
+        bpy.types.Scene,
+        EXPORT_VALIDATE_PROP,
+        bpy.props.EnumProperty(
+            name="Validate",
+            description="Check exported meshes for degenerate faces, loose vertices, non-manifold edges, NaN coordinates and missing UVs, and write artistant_validation.json",
+            items=(
+                ('OFF', "Off", "Do not validate meshes"),
+                ('REPORT', "Report", "Report problems without changing the exported geometry"),
+                ('FIX', "Fix", "Merge by distance, dissolve degenerate faces and delete loose vertices on the export copies (originals are never modified)"),
+            ),
+            default='OFF'
+        ),
+    )
+    # Export settings: files with remaining validation problems fail instead of being written
+    setattr(
+        bpy.types.Scene,
+        EXPORT_VALIDATE_FAIL_PROP,
+        bpy.props.BoolProperty(
+            name="Fail on Issues",
+            description="Do not write files whose meshes still have validation problems (after fixing, in Fix mode)",
+            default=False
+        ),
+    )
+    # Export settings: decimated LOD levels written into the same FBX
+    setattr(
+        bpy.types.Scene,
+        EXPORT_LODS_PROP,
+        bpy.props.BoolProperty(
+            name="LODs",
+            description="Add decimated copies of every exported mesh, named <name>_LOD1, _LOD2, ... (the original becomes _LOD0) for Unity's LOD Group import",
+            default=False
+        ),
+    )
+    # Export settings: triangle percentage of each extra LOD level
+    setattr(
+        bpy.types.Scene,
+        EXPORT_LOD_RATIOS_PROP,
+        bpy.props.StringProperty(
+            name="Levels",
+            description="Comma-separated triangle percentages of LOD0 for LOD1, LOD2, ... (e.g. 50,25,10)",
+            default=DEFAULT_LOD_RATIOS
+        ),
+    )
+    # Export settings: generate UCX_ convex collision hulls per exported root
+    setattr(
+        bpy.types.Scene,
+        EXPORT_COLLISION_PROP,
+        bpy.props.BoolProperty(
+            name="Collision Hulls",
+            description="Add UCX_<root>_01, _02, ... convex hull meshes under every exported root, in the same FBX",
+            default=False
+        ),
+    )
+    # Export settings: number of convex hulls per root (more fits concave props better)
+    setattr(
+        bpy.types.Scene,
+        EXPORT_COLLISION_HULLS_PROP,
+        bpy.props.IntProperty(
+            name="Hulls",
+            description="Convex hulls per root; above 1 the geometry is split into slabs along its longest axis",
+            default=1,
+            min=1,
+            max=16
+        ),
+    )
+    # Export settings: vertex cap of each collision hull
+    setattr(
+        bpy.types.Scene,
+        EXPORT_COLLISION_MAX_VERTS_PROP,
+        bpy.props.IntProperty(
+            name="Max Vertices",
+            description="Maximum vertices per hull (Unity allows up to 255 for convex mesh colliders)",
+            default=32,
+            min=8,
+            max=MAX_HULL_VERTICES
+        ),
+    )
+    # Export settings: batch export merges static meshes into one mesh per material
+    setattr(
+        bpy.types.Scene,
+        EXPORT_MERGE_BY_MATERIAL_PROP,
+        bpy.props.BoolProperty(
+            name="Merge by Material",
+            description="Batch mode only: combine static meshes (no rig, shape keys or exported children) into one world-space mesh per material to cut draw calls. Originals are not modified",
+            default=False
+        ),
+    )
+    # Export settings: vertex limit per merged mesh (16-bit index buffers)
+    setattr(
+        bpy.types.Scene,
+        EXPORT_MERGE_MAX_VERTS_PROP,
+        bpy.props.IntProperty(
+            name="Max Vertices",
+            description="Split a material's merged mesh between objects when it would exceed this many vertices (65535 fits 16-bit index buffers, 0 = no limit)",
+            default=UINT16_VERTEX_LIMIT,
+            min=0
+        ),
+    )
+    # Export settings: pack base color textures into atlases with one shared material
+    setattr(
+        bpy.types.Scene,
+        EXPORT_ATLAS_PROP,
+        bpy.props.BoolProperty(
+            name="Texture Atlas",
+            description="Pack the base color textures (and flat colors) of each file's materials into <file>_atlasN.png with one shared material, remapping UVs on the export copies",
+            default=False
+        ),
+    )
+    # Export settings: maximum atlas edge length in pixels
+    setattr(
+        bpy.types.Scene,
+        EXPORT_ATLAS_SIZE_PROP,
+        bpy.props.EnumProperty(
+            name="Atlas Size",
+            description="Maximum atlas size; textures that do not fit in one atlas go to additional atlases",
+            items=[(size, size, f"Atlases up to {size}x{size} pixels") for size in ATLAS_SIZES],
+            default='2048'
+        ),
+    )
+    # Export settings: reorder faces/vertices of the export copies for GPU vertex cache locality
+    setattr(
+        bpy.types.Scene,
+        EXPORT_VERTEX_CACHE_PROP,
+        bpy.props.BoolProperty(
+            name="Optimize Vertex Cache",
+            description="Reorder faces along a space-filling curve and vertices by first use on the export copies, and report ACMR before and after per mesh",
+            default=False
+        ),
+    )
+    # Export settings: bake object and armature animation into the FBX
+    setattr(
+        bpy.types.Scene,
+        EXPORT_ANIMATION_PROP,
+        bpy.props.BoolProperty(
+            name="Animation",
+            description="Export the active action of animated objects and rigs over the scene frame range",
+            default=False
+        ),
+    )
+    # Export settings: write only the transform keys needed within the tolerances
+    setattr(
+        bpy.types.Scene,
+        EXPORT_ANIM_REDUCE_PROP,
+        bpy.props.BoolProperty(
+            name="Reduce Keys",
+            description="Sample object and bone transforms every frame and write the fewest linear keys that stay within the tolerances below (rigs and other content the built-in writer cannot take are reduced after the stock export; shape key curves keep every frame)",
+            default=True
+        ),
+    )
+    # Export settings: maximum location error of key reduction
+    setattr(
+        bpy.types.Scene,
+        EXPORT_ANIM_POSITION_TOLERANCE_PROP,
+        bpy.props.FloatProperty(
+            name="Position Tolerance",
+            description="Maximum location error introduced by key reduction",
+            default=0.001,
+            min=0.0,
+            subtype='DISTANCE'
+        ),
+    )
+    # Export settings: maximum rotation error of key reduction
+    setattr(
+        bpy.types.Scene,
+        EXPORT_ANIM_ROTATION_TOLERANCE_PROP,
+        bpy.props.FloatProperty(
+            name="Rotation Tolerance",
+            description="Maximum rotation error introduced by key reduction",
+            default=0.001,
+            min=0.0,
+            subtype='ANGLE'
+        ),
+    )
+    # Export settings: maximum scale error of key reduction
+    setattr(
+        bpy.types.Scene,
+        EXPORT_ANIM_SCALE_TOLERANCE_PROP,
+        bpy.props.FloatProperty(
+            name="Scale Tolerance",
+            description="Maximum scale error introduced by key reduction",
+            default=0.001,
+            min=0.0
+        ),
+    )
+    # Export settings: fit skin weights of the export copies to a per-vertex influence budget
+    setattr(
+        bpy.types.Scene,
+        EXPORT_SKIN_OPTIMIZE_PROP,
+        bpy.props.BoolProperty(
+            name="Optimize Skin Weights",
+            description="On the export copies of skinned meshes, keep the strongest bone influences per vertex, prune small weights, renormalize and remove empty vertex groups",
+            default=False
+        ),
+    )
+    # Export settings: bone influences kept per vertex
+    setattr(
+        bpy.types.Scene,
+        EXPORT_SKIN_MAX_INFLUENCES_PROP,
+        bpy.props.IntProperty(
+            name="Max Influences",
+            description="Bone influences kept per vertex (Unity skins with up to 4 by default)",
+            default=DEFAULT_MAX_INFLUENCES,
+            min=1,
+            max=32
+        ),
+    )
+    # Export settings: weights below this are dropped before renormalizing
+    setattr(
+        bpy.types.Scene,
+        EXPORT_SKIN_PRUNE_THRESHOLD_PROP,
+        bpy.props.FloatProperty(
+            name="Prune Below",
+            description="Drop bone weights below this value (each vertex keeps at least its strongest bone)",
+            default=DEFAULT_PRUNE_THRESHOLD,
+            min=0.0,
+            max=1.0
+        ),
+    )
+    # Export runtime state: progress of the modal export queue shown in the panel
+    setattr(
+        bpy.types.WindowManager,
+        EXPORT_PROGRESS_PROP,
+        bpy.props.FloatProperty(
+            name="Export Progress",
+            subtype='FACTOR',
+            min=0.0,
+            max=1.0,
+            default=0.0
+        ),
+    )
+    # Export runtime state: status line of the modal export queue (empty when idle)
+    setattr(
+        bpy.types.WindowManager,
+        EXPORT_STATUS_PROP,
+        bpy.props.StringProperty(
+            name="Export Status",
+            default=""
+        ),
+    )
     # Selection settings: query string for "Select by Name" operator
     setattr(
         bpy.types.Scene,
@@ -51,14 +419,36 @@ def register_scene_properties():
             default=""
         ),
     )
-    # Selection settings: use exact name match vs contains match
+    # Selection settings: how the query is matched (contains, exact, glob, regex)
     setattr(
         bpy.types.Scene,
-        SELECT_BY_NAME_EXACT_PROP,
-        bpy.props.BoolProperty(
-            name="Exact",
-            description="Use exact name match instead of contains",
-            default=False
+        SELECT_BY_NAME_MATCH_PROP,
+        bpy.props.EnumProperty(
+            name="Match",
+            description="How the query is matched against object names",
+            items=MATCH_ITEMS,
+            default=MATCH_CONTAINS
+        ),
+    )
+    # Selection settings: replace, extend or restrict the current selection
+    setattr(
+        bpy.types.Scene,
+        SELECT_BY_NAME_ACTION_PROP,
+        bpy.props.EnumProperty(
+            name="Selection",
+            description="What to do with the current selection",
+            items=ACTION_ITEMS,
+            default=ACTION_SET
+        ),
+    )
+    # Floor Object settings: collection whose meshes "Drop to Surface" lands on
+    setattr(
+        bpy.types.Scene,
+        FLOOR_GROUND_PROP,
+        bpy.props.PointerProperty(
+            name="Ground",
+            description="Collection of ground meshes (terrain) that Floor Object drops selected objects onto",
+            type=bpy.types.Collection
         ),
     )
 
@@ -70,8 +460,44 @@ def unregister_scene_properties():
         EXPORT_FOLDER_PROP,
         EXPORT_INDIVIDUAL_PROP,
         EXPORT_ONLY_ORPHANS_PROP,
+        EXPORT_SKIP_UNCHANGED_PROP,
+        EXPORT_PARALLEL_PROP,
+        EXPORT_WORKERS_PROP,
+        EXPORT_ZERO_DUPLICATE_PROP,
+        EXPORT_NATIVE_FBX_PROP,
+        EXPORT_INSTANCE_AWARE_PROP,
+        EXPORT_PROFILE_PROP,
+        EXPORT_TEXTURE_STORE_PROP,
+        EXPORT_VALIDATE_PROP,
+        EXPORT_VALIDATE_FAIL_PROP,
+        EXPORT_LODS_PROP,
+        EXPORT_LOD_RATIOS_PROP,
+        EXPORT_COLLISION_PROP,
+        EXPORT_COLLISION_HULLS_PROP,
+        EXPORT_COLLISION_MAX_VERTS_PROP,
+        EXPORT_MERGE_BY_MATERIAL_PROP,
+        EXPORT_MERGE_MAX_VERTS_PROP,
+        EXPORT_ATLAS_PROP,
+        EXPORT_ATLAS_SIZE_PROP,
+        EXPORT_VERTEX_CACHE_PROP,
+        EXPORT_ANIMATION_PROP,
+        EXPORT_ANIM_REDUCE_PROP,
+        EXPORT_ANIM_POSITION_TOLERANCE_PROP,
+        EXPORT_ANIM_ROTATION_TOLERANCE_PROP,
+        EXPORT_ANIM_SCALE_TOLERANCE_PROP,
+        EXPORT_SKIN_OPTIMIZE_PROP,
+        EXPORT_SKIN_MAX_INFLUENCES_PROP,
+        EXPORT_SKIN_PRUNE_THRESHOLD_PROP,
         SELECT_BY_NAME_QUERY_PROP,
-        SELECT_BY_NAME_EXACT_PROP,
+        SELECT_BY_NAME_MATCH_PROP,
+        SELECT_BY_NAME_ACTION_PROP,
+        FLOOR_GROUND_PROP,
     ):
         if hasattr(bpy.types.Scene, prop_name):
             delattr(bpy.types.Scene, prop_name)
+    for prop_name in (
+        EXPORT_PROGRESS_PROP,
+        EXPORT_STATUS_PROP,
+    ):
+        if hasattr(bpy.types.WindowManager, prop_name):
+            delattr(bpy.types.WindowManager, prop_name)
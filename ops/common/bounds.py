@@ -1,22 +1,275 @@
-from mathutils import Vector
+import bpy
+import numpy as np
+from mathutils import Matrix, Vector
+
+from .mesh_arrays import matrix_to_array, vertex_positions
+
+
+BOUNDS_LOOSE = 'LOOSE'
+BOUNDS_TIGHT = 'TIGHT'
+BOUNDS_ORIENTED = 'ORIENTED'
+
+BOUNDS_MODE_ITEMS = (
+    (BOUNDS_LOOSE, "Loose", "Transformed bound_box corners of every object (fastest)"),
+    (BOUNDS_TIGHT, "Tight", "Exact world-space extremes of the evaluated vertices"),
+    (BOUNDS_ORIENTED, "Oriented", "Smallest-volume rotated box around the evaluated vertices"),
+)
+
+# Directions used to reduce an object's vertices to extreme points for oriented boxes
+_SUPPORT_DIRECTIONS = 128
+
+# Per-object results keyed by (session_uid, mode); cleared by depsgraph/undo/frame handlers
+_cache = {}
+
+
+class OrientedBounds:
+    """Rotated box: center (3,), axes (3, 3) with one unit axis per row, half_extents (3,)."""
+
+    __slots__ = ("center", "axes", "half_extents")
+
+    def __init__(self, center, axes, half_extents):
+        self.center = center
+        self.axes = axes
+        self.half_extents = half_extents
+
+    @property
+    def volume(self):
+        return float(8.0 * np.prod(self.half_extents))
+
+    def matrix(self):
+        """World matrix of a unit cube (-1..1) fitted to the box."""
+        rotation = Matrix(self.axes.T.tolist()).to_4x4()
+        scale = Matrix.Diagonal((*self.half_extents.tolist(), 1.0))
+        return Matrix.Translation(Vector(self.center.tolist())) @ rotation @ scale
+
+
+def _world_matrices(objects):
+    return np.array([obj.matrix_world for obj in objects], dtype=np.float64).reshape(-1, 4, 4)
+
+
+def _loose_bounds(objects):
+    """Transform all 8 bound_box corners of every object in one batched product."""
+    corners = np.array([obj.bound_box for obj in objects], dtype=np.float64).reshape(-1, 8, 3)
+    matrices = _world_matrices(objects)
+    world = np.einsum("nij,nkj->nki", matrices[:, :3, :3], corners) + matrices[:, None, :3, 3]
+    return world.min(axis=1), world.max(axis=1)
+
+
+def _evaluated_world_points(obj, depsgraph):
+    """World-space vertices of the evaluated object, or its loose corners for non-mesh types."""
+    eval_obj = obj.evaluated_get(depsgraph)
+    matrix = matrix_to_array(eval_obj.matrix_world)
+    if eval_obj.type == 'MESH':
+        co = vertex_positions(eval_obj.data).astype(np.float64)
+    else:
+        co = np.array(eval_obj.bound_box, dtype=np.float64)
+    if not len(co):
+        # Empty meshes collapse to their origin
+        co = np.zeros((1, 3))
+    return co @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def _support_points(points, count=_SUPPORT_DIRECTIONS):
+    """Reduce points to their extremes along count directions (plus the axis extremes)."""
+    if len(points) <= count:
+        return points
+    i = np.arange(count, dtype=np.float64) + 0.5
+    z = 1.0 - 2.0 * i / count
+    r = np.sqrt(np.maximum(0.0, 1.0 - z * z))
+    theta = np.pi * (1.0 + 5.0 ** 0.5) * i
+    directions = np.column_stack((r * np.cos(theta), r * np.sin(theta), z))
+    centered = points - points.mean(axis=0)
+    picked = np.unique(np.concatenate((
+        np.argmax(centered @ directions.T, axis=0),
+        points.argmin(axis=0),
+        points.argmax(axis=0),
+    )))
+    return points[picked]
+
+
+def _hull_2d(points):
+    """Convex hull of (N, 2) points (Andrew's monotone chain), counter-clockwise."""
+    pts = np.unique(points, axis=0)
+    if len(pts) < 3:
+        return pts
+
+    def half(sequence):
+        out = []
+        for p in sequence:
+            while len(out) >= 2:
+                (ax, ay), (bx, by) = out[-2], out[-1]
+                if (bx - ax) * (p[1] - ay) - (by - ay) * (p[0] - ax) > 0.0:
+                    break
+                out.pop()
+            out.append(p)
+        return out
+
+    ordered = pts.tolist()
+    lower = half(ordered)
+    upper = half(reversed(ordered))
+    return np.array(lower[:-1] + upper[:-1])
+
+
+def _min_area_rectangle(points):
+    """Rotating-calipers minimum-area rectangle of 2D points: (area, angle)."""
+    hull = _hull_2d(points)
+    if len(hull) < 3:
+        return 0.0, 0.0
+    edges = np.roll(hull, -1, axis=0) - hull
+    angles = np.unique(np.mod(np.arctan2(edges[:, 1], edges[:, 0]), np.pi / 2.0))
+    cos, sin = np.cos(angles), np.sin(angles)
+    # Hull projected on each candidate frame: (angles, hull points)
+    u = np.outer(cos, hull[:, 0]) + np.outer(sin, hull[:, 1])
+    v = np.outer(-sin, hull[:, 0]) + np.outer(cos, hull[:, 1])
+    areas = (u.max(axis=1) - u.min(axis=1)) * (v.max(axis=1) - v.min(axis=1))
+    best = int(np.argmin(areas))
+    return float(areas[best]), float(angles[best])
+
+
+def _box_from_axes(points, axes):
+    local = points @ axes.T
+    low, high = local.min(axis=0), local.max(axis=0)
+    center = ((low + high) / 2.0) @ axes
+    return OrientedBounds(center, axes, (high - low) / 2.0)
+
+
+def oriented_bounds(points):
+    """Approximate minimum-volume oriented box of (N, 3) world points.
+
+    Each of the three principal axes and world Z is tried as the box's "up"
+    axis; for each, rotating calipers find the minimum-area rectangle of the
+    points projected on the perpendicular plane. The smallest box wins.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if len(points) < 4:
+        return _box_from_axes(points, np.eye(3))
+    centered = points - points.mean(axis=0)
+    _, _, principal = np.linalg.svd(centered, full_matrices=False)
+    candidates = [*principal, np.array([0.0, 0.0, 1.0])]
+
+    best = None
+    for up in candidates:
+        up = up / np.linalg.norm(up)
+        helper = np.array([1.0, 0.0, 0.0]) if abs(up[0]) < 0.9 else np.array([0.0, 1.0, 0.0])
+        a = np.cross(up, helper)
+        a /= np.linalg.norm(a)
+        b = np.cross(up, a)
+        _, angle = _min_area_rectangle(np.column_stack((points @ a, points @ b)))
+        x = np.cos(angle) * a + np.sin(angle) * b
+        y = np.cross(up, x)
+        box = _box_from_axes(points, np.array([x, y, up]))
+        if best is None or box.volume < best.volume:
+            best = box
+    return best
+
+
+def _cached(objects, mode, compute):
+    """Fill missing per-object cache entries with compute(missing) and return all entries."""
+    missing = [obj for obj in objects if (obj.session_uid, mode) not in _cache]
+    if missing:
+        for obj, value in zip(missing, compute(missing)):
+            _cache[(obj.session_uid, mode)] = value
+    return [_cache[(obj.session_uid, mode)] for obj in objects]
+
+
+def object_bounds(objects, mode=BOUNDS_LOOSE, depsgraph=None):
+    """Per-object world AABBs as a list of (min (3,), max (3,)) arrays.
+
+    Loose mode transforms bound_box corners of all uncached objects in one
+    batched product; tight mode reads evaluated vertices with foreach_get.
+    """
+    if mode == BOUNDS_LOOSE:
+        def compute(missing):
+            low, high = _loose_bounds(missing)
+            return list(zip(low, high))
+    else:
+        depsgraph = depsgraph or bpy.context.evaluated_depsgraph_get()
+
+        def compute(missing):
+            out = []
+            for obj in missing:
+                points = _evaluated_world_points(obj, depsgraph)
+                out.append((points.min(axis=0), points.max(axis=0)))
+            return out
+    return _cached(list(objects), BOUNDS_LOOSE if mode == BOUNDS_LOOSE else BOUNDS_TIGHT, compute)
+
+
+def world_bounds(objects, mode=BOUNDS_LOOSE, depsgraph=None):
+    """Bounds of a group of objects.
+
+    Returns:
+        (min Vector, max Vector) for loose/tight modes, OrientedBounds for oriented mode,
+        or None when objects is empty.
+    """
+    objects = list(objects)
+    if not objects:
+        return None
+    if mode == BOUNDS_ORIENTED:
+        depsgraph = depsgraph or bpy.context.evaluated_depsgraph_get()
+        clouds = _cached(
+            objects,
+            BOUNDS_ORIENTED,
+            lambda missing: [_support_points(_evaluated_world_points(obj, depsgraph)) for obj in missing],
+        )
+        return oriented_bounds(np.concatenate(clouds))
+    boxes = object_bounds(objects, mode, depsgraph)
+    low = np.min([box[0] for box in boxes], axis=0)
+    high = np.max([box[1] for box in boxes], axis=0)
+    return Vector(low.tolist()), Vector(high.tolist())
 
 
 def world_bounds_from_objects(objects):
-    min_bound = Vector((float('inf'), float('inf'), float('inf')))
-    max_bound = Vector((float('-inf'), float('-inf'), float('-inf')))
-
-    for obj in objects:
-        for vertex in obj.bound_box:
-            world_vertex = obj.matrix_world @ Vector(vertex)
-            min_bound = Vector((
-                min(min_bound.x, world_vertex.x),
-                min(min_bound.y, world_vertex.y),
-                min(min_bound.z, world_vertex.z),
-            ))
-            max_bound = Vector((
-                max(max_bound.x, world_vertex.x),
-                max(max_bound.y, world_vertex.y),
-                max(max_bound.z, world_vertex.z),
-            ))
-
-    return min_bound, max_bound
+    """Loose world-space AABB of objects as (min Vector, max Vector)."""
+    bounds = world_bounds(objects, BOUNDS_LOOSE)
+    if bounds is None:
+        inf = float('inf')
+        return Vector((inf, inf, inf)), Vector((-inf, -inf, -inf))
+    return bounds
+
+
+def invalidate(obj=None):
+    """Drop cached bounds of one object, or of every object."""
+    if obj is None:
+        _cache.clear()
+        return
+    uid = obj.session_uid
+    for mode in (BOUNDS_LOOSE, BOUNDS_TIGHT, BOUNDS_ORIENTED):
+        _cache.pop((uid, mode), None)
+
+
+@bpy.app.handlers.persistent
+def _on_depsgraph_update(scene, depsgraph):
+    if not _cache:
+        return
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Object):
+            invalidate(update.id)
+        elif update.is_updated_geometry:
+            # Shared data changed (e.g. a mesh): every user may be affected
+            _cache.clear()
+            return
+
+
+@bpy.app.handlers.persistent
+def _on_reset(*_args):
+    _cache.clear()
+
+
+_RESET_HANDLERS = ("frame_change_post", "undo_post", "redo_post", "load_post")
+
+
+def register_bounds_cache():
+    """Install the handlers that keep cached bounds in sync with the scene."""
+    bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    for name in _RESET_HANDLERS:
+        getattr(bpy.app.handlers, name).append(_on_reset)
+
+
+def unregister_bounds_cache():
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    for name in _RESET_HANDLERS:
+        handlers = getattr(bpy.app.handlers, name)
+        if _on_reset in handlers:
+            handlers.remove(_on_reset)
+    _cache.clear()
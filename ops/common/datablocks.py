@@ -0,0 +1,56 @@
+import bpy
+
+
+# bpy.data collections the export pipeline can grow while building a file
+TRACKED_COLLECTIONS = (
+    "meshes",
+    "curves",
+    "armatures",
+    "materials",
+    "images",
+    "textures",
+    "node_groups",
+    "actions",
+    "lights",
+    "cameras",
+)
+
+
+def datablock_counts():
+    """Return {collection_name: len(bpy.data.<collection>)} for every tracked collection."""
+    return {name: len(getattr(bpy.data, name)) for name in TRACKED_COLLECTIONS}
+
+
+def purge_created_datablocks(created, watermark_uid, counts_before):
+    """Remove datablocks created after watermark_uid that nothing uses anymore.
+
+    Every ID gets a session_uid higher than all IDs created before it, so the
+    session_uid of the first ID a pipeline step creates is a cheap watermark.
+    Known creations (e.g. duplicate mesh data) are removed directly; tracked
+    collections that still grew past counts_before are then scanned for any
+    other unused ID above the watermark.
+
+    Args:
+        created: IDs known to be created by the pipeline
+        watermark_uid: session_uid at or below which IDs predate the pipeline step
+        counts_before: Result of datablock_counts() taken before the step
+
+    Returns:
+        Number of datablocks removed.
+    """
+    known = [id_block for id_block in created if id_block.users == 0]
+    if known:
+        bpy.data.batch_remove(known)
+
+    leftovers = []
+    for name, before in counts_before.items():
+        collection = getattr(bpy.data, name)
+        if len(collection) <= before:
+            continue
+        leftovers.extend(
+            id_block for id_block in collection
+            if id_block.session_uid > watermark_uid and id_block.users == 0 and not id_block.use_fake_user
+        )
+    if leftovers:
+        bpy.data.batch_remove(leftovers)
+    return len(known) + len(leftovers)
@@ -0,0 +1,114 @@
+import bpy
+import numpy as np
+from mathutils.bvhtree import BVHTree
+
+from .mesh_arrays import matrix_to_array, vertex_positions
+
+
+class GroundBVH:
+    """World-space BVH over a set of ground meshes, plus their top Z for downward rays."""
+
+    __slots__ = ("tree", "top_z", "uids")
+
+    def __init__(self, tree, top_z, uids):
+        self.tree = tree
+        self.top_z = top_z
+        self.uids = uids
+
+    def ray_down(self, x, y):
+        """Highest surface hit below (x, y): (location, normal) or None."""
+        location, normal, _index, _distance = self.tree.ray_cast((x, y, self.top_z), (0.0, 0.0, -1.0))
+        if location is None:
+            return None
+        # Triangle winding may point down on imported terrain; the surface faces up
+        if normal.z < 0.0:
+            normal = -normal
+        return location, normal
+
+
+# Ground key (sorted object session_uids) -> GroundBVH; cleared when a ground object changes
+_cache = {}
+
+
+def _triangles(mesh):
+    mesh.calc_loop_triangles()
+    tris = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", tris)
+    return tris.reshape(-1, 3)
+
+
+def build_ground_bvh(objects, depsgraph):
+    """Build one world-space BVH from the evaluated meshes of objects (None if no triangles)."""
+    all_co, all_tris, offset = [], [], 0
+    for obj in objects:
+        eval_obj = obj.evaluated_get(depsgraph)
+        mesh = eval_obj.to_mesh()
+        try:
+            co = vertex_positions(mesh).astype(np.float64)
+            tris = _triangles(mesh)
+        finally:
+            eval_obj.to_mesh_clear()
+        if not len(tris):
+            continue
+        matrix = matrix_to_array(eval_obj.matrix_world)
+        all_co.append(co @ matrix[:3, :3].T + matrix[:3, 3])
+        all_tris.append(tris + offset)
+        offset += len(co)
+    if not all_tris:
+        return None
+    co = np.concatenate(all_co)
+    tree = BVHTree.FromPolygons(co.tolist(), np.concatenate(all_tris).tolist(), all_triangles=True)
+    return GroundBVH(tree, float(co[:, 2].max()) + 1.0, frozenset(obj.session_uid for obj in objects))
+
+
+def ground_bvh(objects, depsgraph):
+    """Cached build_ground_bvh: reused until a ground object or its mesh changes."""
+    objects = [obj for obj in objects if obj.type in {'MESH', 'CURVE', 'SURFACE', 'FONT', 'META'}]
+    key = tuple(sorted(obj.session_uid for obj in objects))
+    if key not in _cache:
+        _cache[key] = build_ground_bvh(objects, depsgraph)
+    return _cache[key]
+
+
+@bpy.app.handlers.persistent
+def _on_depsgraph_update(scene, depsgraph):
+    if not _cache:
+        return
+    cached = set()
+    for bvh in _cache.values():
+        if bvh is not None:
+            cached |= bvh.uids
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Object):
+            if update.id.session_uid in cached:
+                _cache.clear()
+                return
+        elif update.is_updated_geometry:
+            # Shared data changed (e.g. a mesh) without knowing which objects use it
+            _cache.clear()
+            return
+
+
+@bpy.app.handlers.persistent
+def _on_reset(*_args):
+    _cache.clear()
+
+
+_RESET_HANDLERS = ("frame_change_post", "undo_post", "redo_post", "load_post")
+
+
+def register_ground_cache():
+    """Install the handlers that drop cached ground BVHs when the ground changes."""
+    bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    for name in _RESET_HANDLERS:
+        getattr(bpy.app.handlers, name).append(_on_reset)
+
+
+def unregister_ground_cache():
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    for name in _RESET_HANDLERS:
+        handlers = getattr(bpy.app.handlers, name)
+        if _on_reset in handlers:
+            handlers.remove(_on_reset)
+    _cache.clear()
@@ -0,0 +1,77 @@
+def root_objects(objs):
+    """Return the objects of objs whose parent is not inside objs, in order."""
+    members = set(objs)
+    return [o for o in objs if o.parent not in members]
+
+
+class HierarchyIndex:
+    """Parent -> children map built in a single pass over a set of objects.
+
+    Object.children scans every object in the file on each access, so walking
+    hierarchies with it is quadratic in large scenes. Build one index per
+    operator run and query it instead.
+    """
+
+    def __init__(self, objects):
+        self._children = {}
+        self._orphans = []
+        for obj in objects:
+            parent = obj.parent
+            if parent is None:
+                self._orphans.append(obj)
+            else:
+                self._children.setdefault(parent, []).append(obj)
+
+    def children(self, obj):
+        """Direct children of obj (empty list if none)."""
+        return self._children.get(obj, [])
+
+    def has_children(self, obj):
+        return obj in self._children
+
+    def descendants(self, root):
+        """Return root and all its descendants in depth-first order."""
+        out, stack, seen = [], [root], set()
+        while stack:
+            obj = stack.pop()
+            if obj in seen:
+                continue
+            seen.add(obj)
+            out.append(obj)
+            stack.extend(self._children.get(obj, ()))
+        return out
+
+    def orphans(self):
+        """Indexed objects without a parent."""
+        return list(self._orphans)
+
+
+def top_level_ancestor(obj):
+    """Walk up the parent chain of obj to its parentless ancestor (obj itself if unparented)."""
+    while obj.parent is not None:
+        obj = obj.parent
+    return obj
+
+
+def parent_keep_transform(children, parent, parent_matrix=None):
+    """Parent children to parent without moving them, like parent_set(keep_transform=True).
+
+    Sets parent and matrix_parent_inverse directly through the data API, so
+    no operator runs and the depsgraph is not re-evaluated per child. Pass
+    parent_matrix when the parent's matrix_world was assigned in this same
+    run and has not been evaluated yet.
+    """
+    parent_matrix = parent.matrix_world if parent_matrix is None else parent_matrix
+    inverse = parent_matrix.inverted_safe()
+    count = 0
+    for child in children:
+        if child is parent:
+            continue
+        world = child.matrix_world.copy()
+        child.parent = parent
+        child.parent_type = 'OBJECT'
+        # world = parent_matrix @ inverse @ basis, so the old world pose becomes the basis
+        child.matrix_parent_inverse = inverse
+        child.matrix_basis = world
+        count += 1
+    return count
@@ -0,0 +1,76 @@
+import numpy as np
+
+
+# Attribute data_type -> (foreach_get key, components per element, NumPy dtype)
+_ATTRIBUTE_LAYOUT = {
+    'FLOAT': ("value", 1, np.float32),
+    'INT': ("value", 1, np.int32),
+    'INT8': ("value", 1, np.int8),
+    'BOOLEAN': ("value", 1, np.bool_),
+    'FLOAT2': ("vector", 2, np.float32),
+    'INT32_2D': ("value", 2, np.int32),
+    'FLOAT_VECTOR': ("vector", 3, np.float32),
+    'FLOAT_COLOR': ("color", 4, np.float32),
+    'BYTE_COLOR': ("color", 4, np.float32),
+    'QUATERNION': ("value", 4, np.float32),
+}
+
+
+def vertex_positions(mesh):
+    """Return mesh vertex coordinates as an (N, 3) float32 array in object space."""
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    return co.reshape(-1, 3)
+
+
+def corner_vertex_indices(mesh):
+    """Return the vertex index of every face corner (loop) as an int32 array."""
+    indices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", indices)
+    return indices
+
+
+def polygon_loop_starts(mesh):
+    """Return (loop_start, loop_total) int32 arrays for every polygon."""
+    count = len(mesh.polygons)
+    starts = np.empty(count, dtype=np.int32)
+    totals = np.empty(count, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", starts)
+    mesh.polygons.foreach_get("loop_total", totals)
+    return starts, totals
+
+
+def polygon_material_indices(mesh):
+    """Return the material slot index of every polygon as an int32 array."""
+    indices = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", indices)
+    return indices
+
+
+def attribute_array(attribute):
+    """Read a generic mesh attribute into a flat NumPy array.
+
+    Returns:
+        A 2D array of shape (elements, components), or None for attribute
+        types that cannot be read in bulk (e.g. strings).
+    """
+    layout = _ATTRIBUTE_LAYOUT.get(attribute.data_type)
+    if layout is None:
+        return None
+    key, components, dtype = layout
+    values = np.empty(len(attribute.data) * components, dtype=dtype)
+    if values.size:
+        attribute.data.foreach_get(key, values)
+    return values.reshape(-1, components)
+
+
+def set_attribute_array(attribute, values):
+    """Write an array shaped like attribute_array()'s result back into the attribute."""
+    key, _components, dtype = _ATTRIBUTE_LAYOUT[attribute.data_type]
+    if values.size:
+        attribute.data.foreach_set(key, np.ascontiguousarray(values, dtype=dtype).ravel())
+
+
+def matrix_to_array(matrix):
+    """Convert a mathutils 4x4 Matrix to a (4, 4) float64 NumPy array."""
+    return np.array(matrix, dtype=np.float64)
@@ -0,0 +1,220 @@
+import numpy as np
+from bpy_extras.io_utils import axis_conversion
+
+from .fbx_native import decode_prop, read_fbx, write_fbx
+
+
+CHANNEL_POSITION = "position"
+CHANNEL_ROTATION = "rotation"
+CHANNEL_SCALE = "scale"
+
+# FBX transform property -> tolerance channel, in the order curves are written
+FBX_TRANSFORM_CHANNELS = (
+    ("Lcl Translation", CHANNEL_POSITION),
+    ("Lcl Rotation", CHANNEL_ROTATION),
+    ("Lcl Scaling", CHANNEL_SCALE),
+)
+_PROPERTY_CHANNELS = dict(FBX_TRANSFORM_CHANNELS)
+
+
+def _file_limits(tolerances):
+    """Tolerances in the units FBX files store (rotation in degrees)."""
+    return {
+        CHANNEL_POSITION: tolerances[CHANNEL_POSITION],
+        CHANNEL_ROTATION: np.degrees(tolerances[CHANNEL_ROTATION]),
+        CHANNEL_SCALE: tolerances[CHANNEL_SCALE],
+    }
+
+
+def reduce_samples(frames, values, tolerance):
+    """Ramer-Douglas-Peucker on sampled values with a vertical (value) error bound.
+
+    Returns:
+        Sorted indices of the samples to keep; linear interpolation between
+        them stays within tolerance of every sample.
+    """
+    count = len(values)
+    if count <= 2:
+        return np.arange(count)
+    keep = np.zeros(count, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, count - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        span = slice(first + 1, last)
+        t = (frames[span] - frames[first]) / (frames[last] - frames[first])
+        line = values[first] + t * (values[last] - values[first])
+        errors = np.abs(values[span] - line)
+        worst = int(np.argmax(errors))
+        if errors[worst] > tolerance:
+            split = first + 1 + worst
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return np.flatnonzero(keep)
+
+
+class ReducedAnimation:
+    """Per-object FBX transform curves after reduction, ready for the native writer.
+
+    curves maps object -> {fbx_property: [(frames, values)] * 3}; sampled_keys
+    is what a per-frame bake would write, written_keys what reaches the file.
+    """
+
+    def __init__(self, frame_start, frame_end, fps):
+        self.frame_start = frame_start
+        self.frame_end = frame_end
+        self.fps = fps
+        self.curves = {}
+        self.sampled_keys = 0
+        self.written_keys = 0
+
+
+def animated_objects(objects):
+    return [obj for obj in objects if obj.animation_data is not None and obj.animation_data.action is not None]
+
+
+def bake_reduced_animation(objects, scene, tolerances, *, axis_forward='-Z', axis_up='Y'):
+    """Sample the local transform of animated objects every frame and reduce it per FBX curve.
+
+    Samples are taken in the FBX file's space (axis conversion applied,
+    rotation in degrees as FBX stores it), so the tolerances bound the error
+    of the keys that are actually written. Positions stay in Blender units;
+    the unit scale is applied through the file's UnitScaleFactor.
+
+    Args:
+        objects: Export copies
+        scene: Scene whose frame range and rate are baked; its current frame is restored
+        tolerances: Dict of CHANNEL_* -> maximum value error (radians for rotation)
+
+    Returns:
+        ReducedAnimation, or None if no object is animated.
+    """
+    animated = animated_objects(objects)
+    if not animated:
+        return None
+    global_matrix = axis_conversion(to_forward=axis_forward, to_up=axis_up).to_4x4()
+    global_matrix_inv = global_matrix.inverted()
+    frames = np.arange(scene.frame_start, scene.frame_end + 1, dtype=np.float64)
+
+    # (objects, frames, 9): translation xyz, rotation xyz (degrees), scale xyz
+    samples = np.empty((len(animated), len(frames), 9), dtype=np.float64)
+    previous = [None] * len(animated)
+    current_frame = scene.frame_current
+    try:
+        for f, frame in enumerate(frames.tolist()):
+            scene.frame_set(int(frame))
+            for i, obj in enumerate(animated):
+                loc, rot, scale = (global_matrix @ obj.matrix_local @ global_matrix_inv).decompose()
+                # Euler compatible with the previous frame avoids 360 degree flips between keys
+                euler = rot.to_euler('XYZ') if previous[i] is None else rot.to_euler('XYZ', previous[i])
+                previous[i] = euler
+                samples[i, f, 0:3] = loc
+                samples[i, f, 3:6] = euler
+                samples[i, f, 6:9] = scale
+    finally:
+        scene.frame_set(current_frame)
+    samples[:, :, 3:6] = np.degrees(samples[:, :, 3:6])
+
+    fps = scene.render.fps / scene.render.fps_base
+    result = ReducedAnimation(int(frames[0]), int(frames[-1]), fps)
+    limits = _file_limits(tolerances)
+    for i, obj in enumerate(animated):
+        per_property = {}
+        for p, (fbx_property, channel) in enumerate(FBX_TRANSFORM_CHANNELS):
+            axes = []
+            for axis in range(3):
+                values = samples[i, :, 3 * p + axis]
+                keep = reduce_samples(frames, values, limits[channel])
+                axes.append((frames[keep], values[keep]))
+                result.sampled_keys += len(frames)
+                result.written_keys += len(keep)
+            per_property[fbx_property] = axes
+        result.curves[obj] = per_property
+    return result
+
+
+class KeyReduction:
+    """Key counts of an FBX file reduced in place by reduce_fbx_keys.
+
+    unreduced lists "<object> <property>" for curves that keep every key
+    (shape keys, camera and light properties, ...): only transform curves have
+    a tolerance.
+    """
+
+    def __init__(self):
+        self.sampled_keys = 0
+        self.written_keys = 0
+        self.unreduced = []
+
+
+def _object_name(fbx_name):
+    return fbx_name.split("\x00\x01")[0]
+
+
+def reduce_fbx_keys(filepath, tolerances):
+    """Reduce the transform curves of a stock-exported FBX file in place.
+
+    The stock exporter bakes every frame of objects and bones (with its own
+    simplification disabled); each Lcl Translation/Rotation/Scaling curve then
+    keeps only the linear keys needed to stay within the tolerances, exactly
+    like files from the native writer.
+
+    Returns:
+        KeyReduction, or None if the file has no animation curves.
+
+    Raises:
+        ValueError: If the file is not a binary FBX 7.4 file.
+    """
+    nodes = read_fbx(filepath)
+    top = {node.name: node for node in nodes}
+    if b"Objects" not in top or b"Connections" not in top:
+        return None
+
+    names = {}
+    curves = {}
+    for node in top[b"Objects"].children:
+        if len(node.props) < 2:
+            continue
+        object_id = decode_prop(node.props[0])
+        names[object_id] = _object_name(decode_prop(node.props[1]))
+        if node.name == b"AnimationCurve":
+            curves[object_id] = node
+    if not curves:
+        return None
+
+    # AnimationCurve -> AnimationCurveNode -> (object or bone, animated property)
+    parents = {}
+    for connection in top[b"Connections"].children:
+        values = [decode_prop(p) for p in connection.props]
+        if len(values) >= 4 and values[0] == "OP":
+            parents[values[1]] = (values[2], values[3])
+
+    limits = _file_limits(tolerances)
+    result = KeyReduction()
+    for curve_id, curve in curves.items():
+        curve_node_id = parents.get(curve_id, (None, None))[0]
+        owner_id, fbx_property = parents.get(curve_node_id, (None, None))
+        channel = _PROPERTY_CHANNELS.get(fbx_property)
+        arrays = {child.name: child for child in curve.children}
+        times = decode_prop(arrays[b"KeyTime"].props[0])
+        result.sampled_keys += len(times)
+        ref_counts = decode_prop(arrays[b"KeyAttrRefCount"].props[0]) if b"KeyAttrRefCount" in arrays else None
+        # Only curves with one shared (linear) key attribute can drop keys safely
+        if channel is None or ref_counts is None or len(ref_counts) != 1:
+            result.written_keys += len(times)
+            label = f"{names.get(owner_id, '?')} {fbx_property}"
+            if label not in result.unreduced:
+                result.unreduced.append(label)
+            continue
+        values = decode_prop(arrays[b"KeyValueFloat"].props[0])
+        keep = reduce_samples(times.astype(np.float64), values.astype(np.float64), limits[channel])
+        result.written_keys += len(keep)
+        arrays[b"KeyTime"].props = (times[keep],)
+        arrays[b"KeyValueFloat"].props = (values[keep],)
+        arrays[b"KeyAttrRefCount"].props = (np.array([len(keep)], dtype=np.int32),)
+
+    write_fbx(filepath, nodes)
+    return result
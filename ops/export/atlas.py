@@ -0,0 +1,251 @@
+import os
+
+import bpy
+import numpy as np
+
+from ..common.mesh_arrays import polygon_loop_starts, polygon_material_indices
+from .rect_pack import pack_rects
+
+
+ATLAS_SIZES = ('1024', '2048', '4096', '8192')
+# Pixels of edge-extended border around every packed texture (avoids mip bleeding)
+ATLAS_PADDING = 4
+# Size of the swatch baked for materials without a base color texture
+SWATCH_SIZE = 4
+# UVs further outside 0..1 than this mean the texture tiles and cannot be atlased
+_UV_TOLERANCE = 1e-3
+
+
+# Principled input name -> default value of a fresh node, filled on first use
+_principled_defaults = {}
+
+
+def _principled_default_values():
+    """Default input values of a new Principled BSDF (read once from a scratch node tree)."""
+    if not _principled_defaults:
+        tree = bpy.data.node_groups.new("_artistant_principled_defaults", 'ShaderNodeTree')
+        try:
+            node = tree.nodes.new('ShaderNodeBsdfPrincipled')
+            for socket in node.inputs:
+                if hasattr(socket, "default_value"):
+                    value = socket.default_value
+                    _principled_defaults[socket.identifier] = tuple(value) if hasattr(value, "__len__") else value
+        finally:
+            bpy.data.node_groups.remove(tree)
+    return _principled_defaults
+
+
+def _only_base_color_used(material, bsdf):
+    """True if bsdf drives the material output and every input but Base Color is unlinked and default.
+
+    The atlas material only carries a base color texture, so anything else
+    (normal maps, roughness/metallic, alpha, emission, displacement) would be
+    lost by atlasing.
+    """
+    output = next(
+        (n for n in material.node_tree.nodes if n.type == 'OUTPUT_MATERIAL' and n.is_active_output),
+        None,
+    )
+    if output is None:
+        return False
+    surface = output.inputs["Surface"]
+    if not surface.is_linked or surface.links[0].from_node != bsdf:
+        return False
+    if any(socket.is_linked for socket in output.inputs if socket.name != "Surface"):
+        return False
+    defaults = _principled_default_values()
+    for socket in bsdf.inputs:
+        if socket.name == "Base Color" or not socket.enabled:
+            continue
+        if socket.is_linked:
+            return False
+        default = defaults.get(socket.identifier)
+        if default is None or not hasattr(socket, "default_value"):
+            continue
+        value = socket.default_value
+        value = tuple(value) if hasattr(value, "__len__") else value
+        if not np.allclose(value, default, atol=1e-4):
+            return False
+    return True
+
+
+def _base_color_source(material):
+    """Return an Image, an RGBA tuple, or None if the base color cannot be atlased.
+
+    Materials using any Principled input besides Base Color are left alone.
+    """
+    if material is None:
+        return None
+    if not (material.use_nodes and material.node_tree):
+        return tuple(material.diffuse_color)
+    bsdf = next((n for n in material.node_tree.nodes if n.type == 'BSDF_PRINCIPLED'), None)
+    if bsdf is None or not _only_base_color_used(material, bsdf):
+        return None
+    base = bsdf.inputs["Base Color"]
+    if not base.is_linked:
+        return tuple(base.default_value)
+    node = base.links[0].from_node
+    image = getattr(node, "image", None) if node.type == 'TEX_IMAGE' else None
+    # Float images are linear while the atlas is an 8-bit sRGB image
+    if image is None or image.is_float or not all(image.size):
+        return None
+    return image
+
+
+def linear_to_srgb(rgba):
+    """Encode the RGB channels of a linear RGBA color with the sRGB transfer curve (alpha unchanged)."""
+    rgba = np.asarray(rgba, dtype=np.float32).copy()
+    rgb = np.clip(rgba[..., :3], 0.0, 1.0)
+    rgba[..., :3] = np.where(rgb <= 0.0031308, rgb * 12.92, 1.055 * np.power(rgb, 1.0 / 2.4) - 0.055)
+    return rgba
+
+
+def _source_pixels(source):
+    """Read an image (or fill a swatch) as an (H, W, 4) float32 array of sRGB-encoded values.
+
+    Byte images already hold sRGB-encoded pixels; flat colors are linear in
+    Blender and are encoded to match the 8-bit sRGB atlas.
+    """
+    if isinstance(source, tuple):
+        return np.broadcast_to(linear_to_srgb(source), (SWATCH_SIZE, SWATCH_SIZE, 4))
+    width, height = source.size
+    pixels = np.empty(width * height * 4, dtype=np.float32)
+    source.pixels.foreach_get(pixels)
+    return pixels.reshape(height, width, 4)
+
+
+def _active_uvs(mesh):
+    """Return the active UV layer (created if missing) and its (corners, 2) array."""
+    layer = mesh.uv_layers.active or mesh.uv_layers.new(name="UVMap")
+    uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+    layer.data.foreach_get("uv", uvs)
+    return layer, uvs.reshape(-1, 2)
+
+
+def _atlas_material(name, image):
+    material = bpy.data.materials.new(name)
+    material.use_nodes = True
+    tree = material.node_tree
+    bsdf = next(n for n in tree.nodes if n.type == 'BSDF_PRINCIPLED')
+    tex = tree.nodes.new('ShaderNodeTexImage')
+    tex.image = image
+    tex.location = (bsdf.location.x - 300.0, bsdf.location.y)
+    tree.links.new(tex.outputs["Color"], bsdf.inputs["Base Color"])
+    return material
+
+
+class AtlasResult:
+    """What one atlas bake produced, for reporting."""
+
+    def __init__(self):
+        self.atlas_paths = []
+        self.materials_atlased = 0
+        self.skipped = []
+
+
+def bake_atlas(dups, *, export_folder, file_stem, max_size):
+    """Pack the base color textures of the copies' materials into atlases.
+
+    Only materials that use nothing but Base Color are atlased; others keep
+    their own material and are listed in AtlasResult.skipped.
+
+    Remaps the active UV layer of every copy into its material's atlas rect
+    and swaps the material slots (object-linked) for one shared material per
+    atlas. Mesh data still shared with an original is copied first. Pixels
+    are read and written in bulk with foreach_get/foreach_set; nothing needs
+    a GPU, so it works in background mode.
+
+    Returns:
+        AtlasResult
+    """
+    result = AtlasResult()
+    meshes = [d for d in dups if d.type == 'MESH' and d.data is not None and d.material_slots]
+
+    # Collect base color sources and check that UVs stay inside 0..1 per material
+    sources = {}
+    corner_data = []
+    for obj in meshes:
+        if obj.data.users > 1:
+            obj.data = obj.data.copy()
+        mesh = obj.data
+        layer, uvs = _active_uvs(mesh)
+        _, totals = polygon_loop_starts(mesh)
+        slot_indices = np.clip(polygon_material_indices(mesh), 0, len(obj.material_slots) - 1)
+        corner_slots = np.repeat(slot_indices, totals)
+        corner_data.append((obj, layer, uvs, corner_slots))
+        for slot_index in np.unique(corner_slots):
+            material = obj.material_slots[int(slot_index)].material
+            if material in sources:
+                if sources[material] is None:
+                    continue
+            else:
+                sources[material] = _base_color_source(material)
+                if sources[material] is None:
+                    result.skipped.append(f"{material.name} (not base color only)" if material else "<empty slot>")
+                    continue
+            if isinstance(sources[material], tuple):
+                continue
+            slot_uvs = uvs[corner_slots == slot_index]
+            if len(slot_uvs) and (slot_uvs.min() < -_UV_TOLERANCE or slot_uvs.max() > 1.0 + _UV_TOLERANCE):
+                sources[material] = None
+                result.skipped.append(f"{material.name} (tiling UVs)")
+
+    materials = [m for m, source in sources.items() if source is not None]
+    pixel_blocks = []
+    sizes = []
+    for material in list(materials):
+        pixels = _source_pixels(sources[material])
+        if max(pixels.shape[:2]) + 2 * ATLAS_PADDING > max_size:
+            materials.remove(material)
+            result.skipped.append(f"{material.name} (texture larger than atlas)")
+            continue
+        pixel_blocks.append(pixels)
+        sizes.append((pixels.shape[1], pixels.shape[0]))
+    if not materials:
+        return result
+
+    placements, bin_sizes = pack_rects(sizes, max_size, ATLAS_PADDING)
+
+    # Bake every bin, extending each texture's edge pixels into its padding
+    atlases = [np.zeros((h, w, 4), dtype=np.float32) for w, h in bin_sizes]
+    for pixels, (b, x, y) in zip(pixel_blocks, placements):
+        padded = np.pad(pixels, ((ATLAS_PADDING, ATLAS_PADDING), (ATLAS_PADDING, ATLAS_PADDING), (0, 0)), mode="edge")
+        h, w = padded.shape[:2]
+        atlases[b][y - ATLAS_PADDING:y - ATLAS_PADDING + h, x - ATLAS_PADDING:x - ATLAS_PADDING + w] = padded
+
+    atlas_materials = []
+    for index, pixels in enumerate(atlases):
+        name = f"{file_stem}_atlas{index}"
+        height, width = pixels.shape[:2]
+        image = bpy.data.images.new(name, width, height, alpha=True)
+        image.pixels.foreach_set(pixels.ravel())
+        path = os.path.join(export_folder, f"{name}.png")
+        image.filepath_raw = path
+        image.file_format = 'PNG'
+        image.save()
+        result.atlas_paths.append(path)
+        atlas_materials.append(_atlas_material(name, image))
+
+    # Remap UVs into each material's rect and swap in the atlas materials
+    rects = {}
+    for material, (w, h), (b, x, y) in zip(materials, sizes, placements):
+        atlas_w, atlas_h = bin_sizes[b]
+        if isinstance(sources[material], tuple):
+            # Flat colors: every UV goes to the swatch center, whatever the original UVs were
+            rects[material] = (b, np.zeros(2), np.array([(x + w / 2) / atlas_w, (y + h / 2) / atlas_h]))
+        else:
+            rects[material] = (b, np.array([w / atlas_w, h / atlas_h]), np.array([x / atlas_w, y / atlas_h]))
+    for obj, layer, uvs, corner_slots in corner_data:
+        for slot_index, slot in enumerate(obj.material_slots):
+            rect = rects.get(slot.material)
+            if rect is None:
+                continue
+            b, scale, offset = rect
+            mask = corner_slots == slot_index
+            uvs[mask] = uvs[mask] * scale + offset
+            slot.link = 'OBJECT'
+            slot.material = atlas_materials[b]
+        layer.data.foreach_set("uv", uvs.ravel())
+        obj.data.update()
+    result.materials_atlased = len(materials)
+    return result
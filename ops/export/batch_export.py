@@ -0,0 +1,136 @@
+"""Fan a directory of .blend files out to parallel headless Blender exports.
+
+Runs with any Python 3 interpreter (it does not import bpy):
+    python batch_export.py --blender /path/to/blender --input blends/ --output fbx/ \\
+        [--jobs 4] [--recursive] [--individual] [--only-orphans] \\
+        [--objects PATTERN ...] [--collection NAME ...] [--force] \\
+        [--timeout SECONDS] [--result batch_result.json]
+
+Each .blend is exported by cli_export.py into its own subfolder of --output
+(named after the .blend), so concurrent processes never share an export
+manifest. The aggregated result file lists per-blend timings, return codes,
+the operator's per-file result and failures.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+CLI_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cli_export.py")
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description="Batch Artistant Unity FBX export across .blend files")
+    parser.add_argument("--blender", required=True, help="Path to the Blender executable")
+    parser.add_argument("--input", required=True, help="Directory containing .blend files")
+    parser.add_argument("--output", required=True, help="Root export folder (one subfolder per .blend)")
+    parser.add_argument("--jobs", type=int, default=max(1, (os.cpu_count() or 2) // 2), help="Concurrent Blender processes")
+    parser.add_argument("--recursive", action="store_true", help="Search --input recursively")
+    parser.add_argument("--individual", action="store_true")
+    parser.add_argument("--only-orphans", action="store_true")
+    parser.add_argument("--objects", nargs="*", default=[], metavar="PATTERN")
+    parser.add_argument("--collection", nargs="*", default=[], metavar="NAME")
+    parser.add_argument("--force", action="store_true")
+    parser.add_argument("--timeout", type=float, default=None, help="Per-file timeout in seconds")
+    parser.add_argument("--result", default="batch_result.json", help="Aggregated JSON result path")
+    return parser.parse_args(argv)
+
+
+def _find_blends(root, recursive):
+    if not recursive:
+        return sorted(
+            os.path.join(root, name) for name in os.listdir(root)
+            if name.lower().endswith(".blend")
+        )
+    found = []
+    for dirpath, _, filenames in os.walk(root):
+        found.extend(os.path.join(dirpath, n) for n in filenames if n.lower().endswith(".blend"))
+    return sorted(found)
+
+
+def _export_folder_for(blend_path, args):
+    relative = os.path.relpath(os.path.splitext(blend_path)[0], args.input)
+    return os.path.join(os.path.abspath(args.output), relative)
+
+
+def _run_one(index, blend_path, args, tmp_dir):
+    export_folder = _export_folder_for(blend_path, args)
+    result_path = os.path.join(tmp_dir, f"result_{index}.json")
+    command = [
+        args.blender, "--background", blend_path, "--factory-startup",
+        "--python", CLI_SCRIPT, "--",
+        "--export-folder", export_folder,
+        "--result", result_path,
+    ]
+    if args.individual:
+        command.append("--individual")
+    if args.only_orphans:
+        command.append("--only-orphans")
+    if args.force:
+        command.append("--force")
+    if args.objects:
+        command += ["--objects", *args.objects]
+    if args.collection:
+        command += ["--collection", *args.collection]
+
+    entry = {"blend": blend_path, "export_folder": export_folder}
+    start = time.perf_counter()
+    try:
+        completed = subprocess.run(command, capture_output=True, text=True, timeout=args.timeout)
+        entry["returncode"] = completed.returncode
+        if completed.returncode != 0:
+            entry["log_tail"] = completed.stderr.strip().splitlines()[-5:] or completed.stdout.strip().splitlines()[-5:]
+    except subprocess.TimeoutExpired:
+        entry["returncode"] = None
+        entry["error"] = f"timed out after {args.timeout}s"
+    entry["seconds"] = time.perf_counter() - start
+
+    try:
+        with open(result_path, "r", encoding="utf-8") as f:
+            entry["result"] = json.load(f)
+    except (OSError, ValueError):
+        entry.setdefault("error", "no result written")
+    entry["ok"] = entry.get("returncode") == 0
+    return entry
+
+
+def main(argv):
+    args = _parse_args(argv)
+    blends = _find_blends(args.input, args.recursive)
+    if not blends:
+        print(f"No .blend files found in {args.input}", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix="artistant_batch_") as tmp_dir:
+        with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+            entries = list(pool.map(lambda item: _run_one(*item, args, tmp_dir), enumerate(blends)))
+
+    failed = [e for e in entries if not e["ok"]]
+    summary = {
+        "blend_files": len(entries),
+        "failed_blend_files": len(failed),
+        "exported_files": sum(len(e.get("result", {}).get("exported", [])) for e in entries),
+        "skipped_files": sum(len(e.get("result", {}).get("skipped", [])) for e in entries),
+        "failed_files": sum(len(e.get("result", {}).get("failures", [])) for e in entries),
+        "seconds": time.perf_counter() - start,
+        "jobs": args.jobs,
+    }
+    with open(args.result, "w", encoding="utf-8") as f:
+        json.dump({"summary": summary, "files": entries}, f, indent=1)
+
+    print(
+        f"{summary['blend_files']} .blend file(s): {summary['exported_files']} exported, "
+        f"{summary['skipped_files']} skipped, {summary['failed_files']} failed file(s), "
+        f"{summary['failed_blend_files']} failed .blend(s) in {summary['seconds']:.1f}s -> {args.result}"
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,107 @@
+"""Headless Unity FBX export for one .blend file.
+
+Usage:
+    blender -b scene.blend --python <addon>/ops/export/cli_export.py -- \\
+        --export-folder OUT [--individual] [--only-orphans] \\
+        [--objects PATTERN ...] [--collection NAME ...] [--force] \\
+        [--no-apply-modifiers] [--embed-textures] [--result result.json]
+
+The add-on is imported straight from its folder and registered, the
+selection is built from the filters (default: every visible object in the
+view layer), and ARTISTANT_OT_export_unity_fbx runs through execute() as it
+does from the panel, minus the modal queue. Other export settings
+(Zero-Duplicate, Fast Static FBX, ...) come from the scene saved in the .blend.
+The exit code is 0 when every file was written or skipped unchanged, 1 otherwise.
+"""
+import argparse
+import fnmatch
+import importlib
+import json
+import os
+import sys
+
+import bpy
+
+
+def _register_addon():
+    addon_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    sys.path.insert(0, os.path.dirname(addon_root))
+    addon = importlib.import_module(os.path.basename(addon_root))
+    addon.register()
+    return addon
+
+
+def _parse_args(argv):
+    args = argv[argv.index("--") + 1:] if "--" in argv else []
+    parser = argparse.ArgumentParser(prog="cli_export.py", description="Headless Artistant Unity FBX export")
+    parser.add_argument("--export-folder", required=True, help="Destination folder for FBX files")
+    parser.add_argument("--individual", action="store_true", help="Export one FBX per object (or per orphan root)")
+    parser.add_argument("--only-orphans", action="store_true", help="Individual mode: export parentless roots with their hierarchy")
+    parser.add_argument("--objects", nargs="*", default=[], metavar="PATTERN", help="Glob patterns on object names")
+    parser.add_argument("--collection", nargs="*", default=[], metavar="NAME", help="Only objects in these collections (recursive)")
+    parser.add_argument("--force", action="store_true", help="Ignore the export manifest and rewrite every file")
+    parser.add_argument("--no-apply-modifiers", action="store_true", help="Export base meshes without modifiers")
+    parser.add_argument("--embed-textures", action="store_true", help="Copy/embed textures into the FBX")
+    parser.add_argument("--result", default="", help="Write a JSON result file (files, timings, failures)")
+    return parser.parse_args(args)
+
+
+def _filtered_objects(view_layer, patterns, collection_names):
+    objects = [o for o in view_layer.objects if o.visible_get()]
+    if collection_names:
+        allowed = set()
+        for name in collection_names:
+            collection = bpy.data.collections.get(name)
+            if collection is None:
+                raise SystemExit(f"Collection '{name}' not found")
+            allowed.update(collection.all_objects)
+        objects = [o for o in objects if o in allowed]
+    if patterns:
+        objects = [o for o in objects if any(fnmatch.fnmatchcase(o.name, p) for p in patterns)]
+    return objects
+
+
+def main(argv):
+    args = _parse_args(argv)
+    _register_addon()
+
+    context = bpy.context
+    scene = context.scene
+    scene.export_folder = os.path.abspath(args.export_folder)
+    scene.export_individual = args.individual
+    scene.export_only_orphans = args.only_orphans
+    # Batch drivers already run one Blender per .blend; keep this export in-process
+    scene.export_parallel = False
+
+    objects = _filtered_objects(context.view_layer, args.objects, args.collection)
+    for o in context.selected_objects:
+        o.select_set(False)
+    for o in objects:
+        o.select_set(True)
+    if objects:
+        context.view_layer.objects.active = objects[0]
+
+    result_path = os.path.abspath(args.result) if args.result else ""
+    try:
+        bpy.ops.artistant.export_unity_fbx(
+            apply_modifiers=not args.no_apply_modifiers,
+            embed_textures=args.embed_textures,
+            force_export=args.force,
+            result_path=result_path,
+        )
+    except RuntimeError as e:
+        # Operator errors (nothing selected, every file failed, ...) surface here
+        print(f"Artistant export failed: {e}", file=sys.stderr)
+        if result_path and not os.path.exists(result_path):
+            with open(result_path, "w", encoding="utf-8") as f:
+                json.dump({"export_folder": scene.export_folder, "error": str(e)}, f, indent=1)
+        sys.exit(1)
+
+    if result_path:
+        with open(result_path, "r", encoding="utf-8") as f:
+            if json.load(f).get("failures"):
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,134 @@
+import bmesh
+import bpy
+import numpy as np
+from mathutils import Matrix
+
+from ..common.mesh_arrays import matrix_to_array, vertex_positions
+from .lods import export_base_name
+
+
+COLLISION_PREFIX = "UCX_"
+# Unity rejects convex mesh colliders with more than 255 vertices
+MAX_HULL_VERTICES = 255
+
+
+def _sphere_directions(count):
+    """Return count roughly uniform unit directions (Fibonacci sphere) as (count, 3)."""
+    i = np.arange(count, dtype=np.float64) + 0.5
+    z = 1.0 - 2.0 * i / count
+    r = np.sqrt(np.maximum(0.0, 1.0 - z * z))
+    theta = np.pi * (1.0 + 5.0 ** 0.5) * i
+    return np.column_stack((r * np.cos(theta), r * np.sin(theta), z))
+
+
+def support_points(points, max_vertices):
+    """Reduce a point cloud to at most max_vertices extreme points.
+
+    Takes the farthest point along max_vertices directions in one matrix
+    product, so the hull of the result has at most max_vertices vertices and
+    its cost no longer depends on the source vertex count.
+    """
+    if len(points) <= max_vertices:
+        return points
+    directions = _sphere_directions(max_vertices)
+    centered = points - points.mean(axis=0)
+    picked = np.unique(np.argmax(centered @ directions.T, axis=0))
+    return points[picked]
+
+
+def _split_along_longest_axis(points, parts):
+    """Split points into slabs of equal vertex count along their longest bounding box axis."""
+    if parts <= 1 or len(points) < parts * 4:
+        return [points]
+    axis = int(np.argmax(points.max(axis=0) - points.min(axis=0)))
+    order = np.argsort(points[:, axis], kind="stable")
+    return [points[chunk] for chunk in np.array_split(order, parts)]
+
+
+def hull_mesh(name, points):
+    """Build a convex hull mesh from (N, 3) points, or None if the points are flat."""
+    bm = bmesh.new()
+    try:
+        for co in points.tolist():
+            bm.verts.new(co)
+        result = bmesh.ops.convex_hull(bm, input=bm.verts)
+        leftovers = [
+            elem for elem in result["geom_interior"] + result["geom_unused"]
+            if isinstance(elem, bmesh.types.BMVert)
+        ]
+        if leftovers:
+            bmesh.ops.delete(bm, geom=leftovers, context='VERTS')
+        if not bm.faces:
+            return None
+        mesh = bpy.data.meshes.new(name)
+        bm.to_mesh(mesh)
+    finally:
+        bm.free()
+    return mesh
+
+
+def _root_space_points(root, members, depsgraph, apply_modifiers):
+    """Gather the vertices of every mesh in a hierarchy in the root's local space."""
+    to_root = np.linalg.inv(matrix_to_array(root.matrix_world))
+    chunks = []
+    for obj in members:
+        if obj.type != 'MESH':
+            continue
+        source = obj.evaluated_get(depsgraph) if apply_modifiers else obj
+        co = vertex_positions(source.data).astype(np.float64)
+        if not len(co):
+            continue
+        matrix = to_root @ matrix_to_array(obj.matrix_world)
+        chunks.append(co @ matrix[:3, :3].T + matrix[:3, 3])
+    if not chunks:
+        return None
+    points = np.concatenate(chunks)
+    return points[np.isfinite(points).all(axis=1)]
+
+
+def build_collision_hulls(dups, roots, *, collection, hull_count, max_vertices, apply_modifiers, lod_suffix=""):
+    """Create UCX_<root>_NN convex hulls for every exported root.
+
+    <root> is the name the root mesh has in the file, so Unity pairs the
+    colliders with it: the export copy's .001 suffix is dropped and
+    lod_suffix (e.g. "_LOD0") is added to mesh roots that get LOD levels.
+
+    Each root gets hull_count hulls (the hierarchy's vertices split into slabs
+    along its longest axis, for concave props), each capped at max_vertices.
+    Hulls are parented to their root with an identity transform.
+
+    Returns:
+        List of created hull objects.
+    """
+    dup_set = set(dups)
+    members = {root: [] for root in roots}
+    for obj in dups:
+        top = obj
+        while top.parent in dup_set:
+            top = top.parent
+        if top in members:
+            members[top].append(obj)
+
+    max_vertices = max(4, min(max_vertices, MAX_HULL_VERTICES))
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    hulls = []
+    for root, objs in members.items():
+        points = _root_space_points(root, objs, depsgraph, apply_modifiers)
+        if points is None or len(points) < 4:
+            continue
+        root_name = export_base_name(root)
+        if root.type == 'MESH' and root.data is not None:
+            root_name += lod_suffix
+        parts = _split_along_longest_axis(points, hull_count)
+        for index, part in enumerate(parts, start=1):
+            name = f"{COLLISION_PREFIX}{root_name}_{index:02d}"
+            mesh = hull_mesh(name, support_points(part, max_vertices))
+            if mesh is None:
+                continue
+            hull = bpy.data.objects.new(name, mesh)
+            collection.objects.link(hull)
+            hull.parent = root
+            hull.matrix_parent_inverse = Matrix.Identity(4)
+            hull.matrix_basis = Matrix.Identity(4)
+            hulls.append(hull)
+    return hulls
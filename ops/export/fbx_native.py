@@ -0,0 +1,679 @@
+"""Fast-path binary FBX (7.4) writer for static MESH/EMPTY hierarchies.
+
+Mesh data is read in bulk with foreach_get into NumPy arrays and streamed to
+disk node by node. The output follows the conventions the Unity export
+operator passes to the stock exporter: -Z forward / Y up baked into geometry
+and object transforms (bake_space_transform), FBX_SCALE_UNITS unit scaling,
+per-face smoothing and tangent space. Anything else (armatures, shape keys,
+color attributes, image textures, other object types) is rejected by
+unsupported_reason() so the caller can fall back to the stock exporter.
+"""
+import hashlib
+import struct
+import zlib
+
+import numpy as np
+from bpy_extras.io_utils import axis_conversion
+
+from ..common.mesh_arrays import (
+    corner_vertex_indices,
+    polygon_loop_starts,
+    polygon_material_indices,
+    vertex_positions,
+)
+
+
+FBX_VERSION = 7400
+_HEAD_MAGIC = b"Kaydara FBX Binary\x20\x20\x00\x1a\x00"
+# FileId/CreationTime/footer triple used by Blender's own exporter; the FBX SDK
+# validates them against each other, and fixed values keep output deterministic.
+_FILE_ID = b"\x28\xb3\x2a\xeb\xb6\x24\xcc\xc2\xbf\xc8\xb0\x2a\xa9\x2b\xfc\xf1"
+_FOOT_ID = b"\xfa\xbc\xab\x09\xd0\xc8\xd4\x66\xb1\x76\xfb\x83\x1c\xf7\x26\x7e"
+_FOOT_MAGIC = b"\xf8\x5a\x8c\x6a\xde\xf5\xd9\x7e\xec\xe9\x0c\xe3\x75\x8f\x29\x0b"
+_TIME_ID = "1970-01-01 10:00:00:000"
+_NULL_RECORD = b"\x00" * 13
+# FBX time units per second, and the animation curve layout the stock exporter writes
+FBX_KTIME = 46186158000
+FBX_ANIM_KEY_VERSION = 4008
+# Linear interpolation, generic time-independent clamp-progressive tangents
+_KEY_ATTR_FLAGS = (1 << 2) | (1 << 8) | (1 << 13) | (1 << 14)
+_KEY_ATTR_DATA = (0.0, 0.0, 9.419963346924634e-30, 0.0)
+# FBX GlobalSettings TimeMode: custom frame rate given by CustomFrameRate
+_TIME_MODE_CUSTOM = 14
+# Arrays at least this large are zlib-compressed, like the stock exporter does
+_COMPRESS_MIN_BYTES = 128
+
+SUPPORTED_OBJECT_TYPES = {'MESH', 'EMPTY'}
+
+_ARRAY_CODES = {
+    np.dtype(np.float64): b"d",
+    np.dtype(np.float32): b"f",
+    np.dtype(np.int32): b"i",
+    np.dtype(np.int64): b"l",
+    np.dtype(np.bool_): b"b",
+}
+_ARRAY_DTYPES = {code: dtype for dtype, code in _ARRAY_CODES.items()}
+_SCALAR_FORMATS = {b"Y": "<h", b"C": "<?", b"I": "<i", b"F": "<f", b"D": "<d", b"L": "<q"}
+# Nodes the stock exporter always closes with a null record, even without children
+_ALWAYS_BLOCK_SENTINEL = {b"AnimationStack", b"AnimationLayer"}
+
+
+class _Encoded(bytes):
+    """A property kept exactly as read from a file (type code + payload)."""
+
+
+class _Raw(bytes):
+    """Marks a bytes value to be written as an FBX raw ('R') property."""
+
+
+class _Long(int):
+    """Marks an int to be written as an FBX int64 ('L') value (e.g. KTime)."""
+
+
+class _Id(_Long):
+    """Marks an int to be written as an FBX int64 ('L') object id."""
+
+
+def _encode_prop(value):
+    """Encode one FBX property value as type code + payload."""
+    if isinstance(value, _Encoded):
+        return bytes(value)
+    if isinstance(value, bool):
+        return b"C" + (b"\x01" if value else b"\x00")
+    if isinstance(value, _Long):
+        return b"L" + struct.pack("<q", value)
+    if isinstance(value, int):
+        if -(2 ** 31) <= value < 2 ** 31:
+            return b"I" + struct.pack("<i", value)
+        return b"L" + struct.pack("<q", value)
+    if isinstance(value, float):
+        return b"D" + struct.pack("<d", value)
+    if isinstance(value, _Raw):
+        return b"R" + struct.pack("<I", len(value)) + value
+    if isinstance(value, str):
+        data = value.encode("utf-8")
+        return b"S" + struct.pack("<I", len(data)) + data
+    if isinstance(value, bytes):
+        return b"S" + struct.pack("<I", len(value)) + value
+    if isinstance(value, np.ndarray):
+        array = np.ascontiguousarray(value.ravel())
+        code = _ARRAY_CODES[array.dtype]
+        data = array.tobytes()
+        encoding = 0
+        if len(data) >= _COMPRESS_MIN_BYTES:
+            data = zlib.compress(data, 1)
+            encoding = 1
+        return code + struct.pack("<3I", array.size, encoding, len(data)) + data
+    raise TypeError(f"Unsupported FBX property type: {type(value).__name__}")
+
+
+class _Node:
+    """In-memory FBX node; only small nodes are built this way, geometry arrays stay NumPy."""
+
+    __slots__ = ("name", "props", "children")
+
+    def __init__(self, name, *props):
+        self.name = name.encode("ascii")
+        self.props = props
+        self.children = []
+
+    def add(self, name, *props):
+        child = _Node(name, *props)
+        self.children.append(child)
+        return child
+
+
+def _write_node(f, node):
+    """Stream one node record, patching its end offset once its children are written."""
+    start = f.tell()
+    encoded = [_encode_prop(p) for p in node.props]
+    props_length = sum(len(e) for e in encoded)
+    f.write(struct.pack("<3I", 0, len(encoded), props_length))
+    f.write(bytes((len(node.name),)))
+    f.write(node.name)
+    for e in encoded:
+        f.write(e)
+    if node.children:
+        for child in node.children:
+            _write_node(f, child)
+        f.write(_NULL_RECORD)
+    elif not node.props or node.name in _ALWAYS_BLOCK_SENTINEL:
+        f.write(_NULL_RECORD)
+    end = f.tell()
+    f.seek(start)
+    f.write(struct.pack("<I", end))
+    f.seek(end)
+
+
+def _write_footer(f):
+    f.write(_FOOT_ID)
+    f.write(b"\x00" * 4)
+    offset = f.tell()
+    pad = ((offset + 15) & ~15) - offset
+    f.write(b"\x00" * (pad or 16))
+    f.write(struct.pack("<I", FBX_VERSION))
+    f.write(b"\x00" * 120)
+    f.write(_FOOT_MAGIC)
+
+
+def _read_prop(data, pos):
+    """Return the end offset of the property record starting at pos."""
+    code = data[pos:pos + 1]
+    pos += 1
+    if code in _SCALAR_FORMATS:
+        return pos + struct.calcsize(_SCALAR_FORMATS[code])
+    if code in (b"S", b"R"):
+        return pos + 4 + struct.unpack_from("<I", data, pos)[0]
+    if code in _ARRAY_DTYPES:
+        return pos + 12 + struct.unpack_from("<3I", data, pos)[2]
+    raise ValueError(f"Unknown FBX property type {code!r}")
+
+
+def _read_node(data, pos):
+    """Parse the node record at pos into a _Node with _Encoded props; returns (node, end)."""
+    end, prop_count, _ = struct.unpack_from("<3I", data, pos)
+    name_length = data[pos + 12]
+    pos += 13
+    node = _Node(data[pos:pos + name_length].decode("ascii"))
+    pos += name_length
+    props = []
+    for _ in range(prop_count):
+        prop_end = _read_prop(data, pos)
+        props.append(_Encoded(data[pos:prop_end]))
+        pos = prop_end
+    node.props = tuple(props)
+    while pos < end and data[pos:pos + 13] != _NULL_RECORD:
+        child, pos = _read_node(data, pos)
+        node.children.append(child)
+    return node, end
+
+
+def decode_prop(prop):
+    """Python value of an _Encoded property: int/float/bool, str for strings, NumPy array for arrays."""
+    code = prop[:1]
+    if code in _SCALAR_FORMATS:
+        return struct.unpack_from(_SCALAR_FORMATS[code], prop, 1)[0]
+    if code == b"S":
+        return prop[5:].decode("utf-8")
+    if code == b"R":
+        return bytes(prop[5:])
+    count, encoding, _ = struct.unpack_from("<3I", prop, 1)
+    data = prop[13:]
+    if encoding == 1:
+        data = zlib.decompress(data)
+    return np.frombuffer(data, dtype=_ARRAY_DTYPES[code], count=count).copy()
+
+
+def read_fbx(filepath):
+    """Read a binary FBX 7.4 file into its top-level nodes (properties stay encoded).
+
+    Raises:
+        ValueError: If the file is not a binary FBX this module can write back.
+    """
+    with open(filepath, "rb") as f:
+        data = f.read()
+    if not data.startswith(_HEAD_MAGIC):
+        raise ValueError("not a binary FBX file")
+    version = struct.unpack_from("<I", data, len(_HEAD_MAGIC))[0]
+    if version >= 7500:
+        # 7.5+ uses 64-bit record offsets
+        raise ValueError(f"FBX version {version} is not supported")
+    nodes = []
+    pos = len(_HEAD_MAGIC) + 4
+    while data[pos:pos + 13] != _NULL_RECORD:
+        node, pos = _read_node(data, pos)
+        nodes.append(node)
+    return nodes
+
+
+def write_fbx(filepath, nodes):
+    """Write top-level nodes (e.g. from read_fbx) as a binary FBX 7.4 file."""
+    with open(filepath, "wb") as f:
+        f.write(_HEAD_MAGIC)
+        f.write(struct.pack("<I", FBX_VERSION))
+        for node in nodes:
+            _write_node(f, node)
+        f.write(_NULL_RECORD)
+        _write_footer(f)
+
+
+def _uid(*keys):
+    """Deterministic positive int64 FBX object id derived from a key."""
+    digest = hashlib.sha1("\x00".join(keys).encode("utf-8")).digest()
+    return _Id((int.from_bytes(digest[:8], "little") & 0x7FFFFFFFFFFFFFFF) or 1)
+
+
+def _fbx_name(name, cls):
+    return f"{name}\x00\x01{cls}"
+
+
+def _properties70(parent, entries):
+    """Add a Properties70 block; entries are (name, type, label, flags, *values)."""
+    block = parent.add("Properties70")
+    for entry in entries:
+        block.add("P", *entry)
+    return block
+
+
+def _material_images(material):
+    if not (material.use_nodes and material.node_tree):
+        return []
+    return [n for n in material.node_tree.nodes if n.type == 'TEX_IMAGE' and n.image is not None]
+
+
+def unsupported_reason(objects, *, embed_textures):
+    """Return why the fast path cannot write these objects, or None if it can."""
+    if embed_textures:
+        return "texture embedding"
+    members = set(objects)
+    for obj in objects:
+        if obj.type not in SUPPORTED_OBJECT_TYPES:
+            return f"object type {obj.type}"
+        if obj.parent is not None and obj.parent not in members:
+            return "parent outside export set"
+        if obj.parent_type != 'OBJECT':
+            return "non-object parenting"
+        # The stock exporter writes instanced objects/collections; this writer would drop them
+        if obj.instance_type != 'NONE':
+            return f"instancing {obj.instance_type}"
+        if obj.is_instancer or any(
+            psys.settings.render_type in {'OBJECT', 'COLLECTION'} for psys in obj.particle_systems
+        ):
+            return "particle instancing"
+        if obj.type != 'MESH':
+            continue
+        if obj.data.shape_keys is not None:
+            return "shape keys"
+        if obj.data.color_attributes:
+            return "color attributes"
+        if any(m.type == 'ARMATURE' for m in obj.modifiers):
+            return "armature deformation"
+        for slot in obj.material_slots:
+            if slot.material is None:
+                return "empty material slot"
+            if _material_images(slot.material):
+                return "image textures"
+    return None
+
+
+class _SceneWriter:
+    """Collects FBX object/connection nodes for one file."""
+
+    def __init__(self, depsgraph, *, apply_modifiers, use_tspace, axis_forward, axis_up):
+        self.depsgraph = depsgraph
+        self.apply_modifiers = apply_modifiers
+        self.use_tspace = use_tspace
+        self.global_matrix = axis_conversion(to_forward=axis_forward, to_up=axis_up).to_4x4()
+        self.global_matrix_inv = self.global_matrix.inverted()
+        # Rotation part used for positions/normals/tangents (no scale with FBX_SCALE_UNITS)
+        self.rot3 = np.array(self.global_matrix.to_3x3(), dtype=np.float64)
+        self.objects = _Node("Objects")
+        self.connections = _Node("Connections")
+        self.counts = {
+            "Model": 0, "Geometry": 0, "Material": 0, "NodeAttribute": 0,
+            "AnimationStack": 0, "AnimationLayer": 0, "AnimationCurveNode": 0, "AnimationCurve": 0,
+        }
+        self.materials = {}
+
+    def _connect(self, child_id, parent_id):
+        self.connections.add("C", "OO", child_id, parent_id)
+
+    def _material_id(self, material):
+        if material in self.materials:
+            return self.materials[material]
+        mat_id = _uid("Material", material.name)
+        color = list(material.diffuse_color)
+        if material.use_nodes and material.node_tree:
+            bsdf = next((n for n in material.node_tree.nodes if n.type == 'BSDF_PRINCIPLED'), None)
+            if bsdf is not None:
+                color = list(bsdf.inputs["Base Color"].default_value)
+        node = self.objects.add("Material", mat_id, _fbx_name(material.name, "Material"), "")
+        node.add("Version", 102)
+        node.add("ShadingModel", "Phong")
+        node.add("MultiLayer", 0)
+        _properties70(node, [
+            ("ShadingModel", "KString", "", "", "Phong"),
+            ("DiffuseColor", "Color", "", "A", float(color[0]), float(color[1]), float(color[2])),
+            ("DiffuseFactor", "Number", "", "A", 1.0),
+            ("Opacity", "double", "Number", "", float(color[3])),
+        ])
+        self.materials[material] = mat_id
+        self.counts["Material"] += 1
+        return mat_id
+
+    def _local_transform(self, obj):
+        """FBX local transform with the axis conversion baked in: G @ L @ G^-1."""
+        matrix = self.global_matrix @ obj.matrix_local @ self.global_matrix_inv
+        loc, rot, scale = matrix.decompose()
+        euler = rot.to_euler('XYZ')
+        degrees = [float(np.degrees(a)) for a in euler]
+        return [
+            ("Lcl Translation", "Lcl Translation", "", "A", float(loc.x), float(loc.y), float(loc.z)),
+            ("Lcl Rotation", "Lcl Rotation", "", "A", *degrees),
+            ("Lcl Scaling", "Lcl Scaling", "", "A", float(scale.x), float(scale.y), float(scale.z)),
+            ("DefaultAttributeIndex", "int", "Integer", "", 0),
+            ("InheritType", "enum", "", "", 1),
+        ]
+
+    def add_object(self, obj, parent_id):
+        model_id = _uid("Model", obj.name)
+        kind = "Mesh" if obj.type == 'MESH' else "Null"
+        model = self.objects.add("Model", model_id, _fbx_name(obj.name, "Model"), kind)
+        model.add("Version", 232)
+        _properties70(model, self._local_transform(obj))
+        model.add("MultiLayer", 0)
+        model.add("MultiTake", 0)
+        model.add("Shading", True)
+        model.add("Culling", "CullingOff")
+        self.counts["Model"] += 1
+        self._connect(model_id, parent_id)
+
+        if obj.type == 'MESH':
+            geom_id = self._add_geometry(obj)
+            self._connect(geom_id, model_id)
+            for slot in obj.material_slots:
+                self._connect(self._material_id(slot.material), model_id)
+        else:
+            attr_id = _uid("NodeAttribute", obj.name)
+            attr = self.objects.add("NodeAttribute", attr_id, _fbx_name(obj.name, "NodeAttribute"), "Null")
+            attr.add("TypeFlags", "Null")
+            self.counts["NodeAttribute"] += 1
+            self._connect(attr_id, model_id)
+        return model_id
+
+    def add_animation(self, animation, model_ids):
+        """Write one take with linear transform curves from a ReducedAnimation."""
+        start = _ktime(animation.frame_start, animation.fps)
+        stop = _ktime(animation.frame_end, animation.fps)
+        stack_id = _uid("AnimStack", "Take")
+        stack = self.objects.add("AnimationStack", stack_id, _fbx_name("Take", "AnimStack"), "")
+        _properties70(stack, [
+            ("LocalStart", "KTime", "Time", "", start),
+            ("LocalStop", "KTime", "Time", "", stop),
+            ("ReferenceStart", "KTime", "Time", "", start),
+            ("ReferenceStop", "KTime", "Time", "", stop),
+        ])
+        layer_id = _uid("AnimLayer", "Take")
+        self.objects.add("AnimationLayer", layer_id, _fbx_name("BaseLayer", "AnimLayer"), "")
+        self.connections.add("C", "OO", layer_id, stack_id)
+        self.counts["AnimationStack"] += 1
+        self.counts["AnimationLayer"] += 1
+
+        for obj, properties in animation.curves.items():
+            model_id = model_ids[obj]
+            for fbx_property, axes in properties.items():
+                short = fbx_property.split()[-1][0]
+                node_id = _uid("AnimCurveNode", obj.name, fbx_property)
+                node = self.objects.add("AnimationCurveNode", node_id, _fbx_name(short, "AnimCurveNode"), "")
+                _properties70(node, [
+                    (f"d|{axis}", "Number", "", "A", float(values[0]))
+                    for axis, (_frames, values) in zip("XYZ", axes)
+                ])
+                self.connections.add("C", "OO", node_id, layer_id)
+                self.connections.add("C", "OP", node_id, model_id, fbx_property)
+                self.counts["AnimationCurveNode"] += 1
+                for axis, (frames, values) in zip("XYZ", axes):
+                    curve_id = _uid("AnimCurve", obj.name, fbx_property, axis)
+                    curve = self.objects.add("AnimationCurve", curve_id, _fbx_name("", "AnimCurve"), "")
+                    curve.add("Default", float(values[0]))
+                    curve.add("KeyVer", FBX_ANIM_KEY_VERSION)
+                    curve.add("KeyTime", _ktime(frames, animation.fps))
+                    curve.add("KeyValueFloat", np.asarray(values, dtype=np.float32))
+                    curve.add("KeyAttrFlags", np.array([_KEY_ATTR_FLAGS], dtype=np.int32))
+                    curve.add("KeyAttrDataFloat", np.array(_KEY_ATTR_DATA, dtype=np.float32))
+                    curve.add("KeyAttrRefCount", np.array([len(frames)], dtype=np.int32))
+                    self.connections.add("C", "OP", curve_id, node_id, f"d|{axis}")
+                    self.counts["AnimationCurve"] += 1
+
+    def _add_geometry(self, obj):
+        source = obj.evaluated_get(self.depsgraph) if self.apply_modifiers else obj
+        mesh = source.to_mesh()
+        try:
+            return self._write_mesh(obj, mesh)
+        finally:
+            source.to_mesh_clear()
+
+    def _write_mesh(self, obj, mesh):
+        geom_id = _uid("Geometry", obj.name)
+        geom = self.objects.add("Geometry", geom_id, _fbx_name(obj.name, "Geometry"), "Mesh")
+        _properties70(geom, [])
+        geom.add("GeometryVersion", 124)
+        self.counts["Geometry"] += 1
+
+        rot_t = self.rot3.T
+        positions = vertex_positions(mesh).astype(np.float64) @ rot_t
+        geom.add("Vertices", positions)
+
+        starts, totals = polygon_loop_starts(mesh)
+        polygon_indices = corner_vertex_indices(mesh).copy()
+        if len(totals):
+            last = starts + totals - 1
+            # FBX marks the last corner of each polygon with a bitwise-negated index
+            polygon_indices[last] = ~polygon_indices[last]
+        geom.add("PolygonVertexIndex", polygon_indices)
+
+        layer_elements = []
+        loop_count = len(mesh.loops)
+
+        normals = np.empty(loop_count * 3, dtype=np.float32)
+        mesh.corner_normals.foreach_get("vector", normals)
+        normal_elem = geom.add("LayerElementNormal", 0)
+        normal_elem.add("Version", 102)
+        normal_elem.add("Name", "")
+        normal_elem.add("MappingInformationType", "ByPolygonVertex")
+        normal_elem.add("ReferenceInformationType", "Direct")
+        normal_elem.add("Normals", normals.reshape(-1, 3).astype(np.float64) @ rot_t)
+        layer_elements.append(("LayerElementNormal", 0))
+
+        smooth = np.empty(len(mesh.polygons), dtype=np.bool_)
+        mesh.polygons.foreach_get("use_smooth", smooth)
+        smooth_elem = geom.add("LayerElementSmoothing", 0)
+        smooth_elem.add("Version", 102)
+        smooth_elem.add("Name", "")
+        smooth_elem.add("MappingInformationType", "ByPolygon")
+        smooth_elem.add("ReferenceInformationType", "Direct")
+        smooth_elem.add("Smoothing", smooth.astype(np.int32))
+        layer_elements.append(("LayerElementSmoothing", 0))
+
+        # Tangents need triangles/quads only, like the stock exporter
+        if self.use_tspace and mesh.uv_layers and not (totals > 4).any():
+            mesh.calc_tangents(uvmap=mesh.uv_layers[0].name)
+            for attr_name, elem_name, data_name in (
+                ("tangent", "LayerElementTangent", "Tangents"),
+                ("bitangent", "LayerElementBinormal", "Binormals"),
+            ):
+                values = np.empty(loop_count * 3, dtype=np.float32)
+                mesh.loops.foreach_get(attr_name, values)
+                elem = geom.add(elem_name, 0)
+                elem.add("Version", 102)
+                elem.add("Name", mesh.uv_layers[0].name)
+                elem.add("MappingInformationType", "ByPolygonVertex")
+                elem.add("ReferenceInformationType", "Direct")
+                elem.add(data_name, values.reshape(-1, 3).astype(np.float64) @ rot_t)
+                layer_elements.append((elem_name, 0))
+            mesh.free_tangents()
+
+        for uv_index, uv_layer in enumerate(mesh.uv_layers):
+            uvs = np.empty(loop_count * 2, dtype=np.float32)
+            uv_layer.data.foreach_get("uv", uvs)
+            unique, inverse = np.unique(uvs.reshape(-1, 2), axis=0, return_inverse=True)
+            elem = geom.add("LayerElementUV", uv_index)
+            elem.add("Version", 101)
+            elem.add("Name", uv_layer.name)
+            elem.add("MappingInformationType", "ByPolygonVertex")
+            elem.add("ReferenceInformationType", "IndexToDirect")
+            elem.add("UV", unique.astype(np.float64))
+            elem.add("UVIndex", inverse.astype(np.int32).ravel())
+            layer_elements.append(("LayerElementUV", uv_index))
+
+        if obj.material_slots:
+            material_indices = polygon_material_indices(mesh)
+            np.clip(material_indices, 0, len(obj.material_slots) - 1, out=material_indices)
+            elem = geom.add("LayerElementMaterial", 0)
+            elem.add("Version", 101)
+            elem.add("Name", "")
+            if len(material_indices) and (material_indices == material_indices[0]).all():
+                elem.add("MappingInformationType", "AllSame")
+                material_indices = material_indices[:1]
+            else:
+                elem.add("MappingInformationType", "ByPolygon")
+            elem.add("ReferenceInformationType", "IndexToDirect")
+            elem.add("Materials", material_indices)
+            layer_elements.append(("LayerElementMaterial", 0))
+
+        # Layer 0 holds every first element; extra UV sets get their own layers
+        layers = {}
+        for elem_type, typed_index in layer_elements:
+            layers.setdefault(typed_index, []).append(elem_type)
+        for layer_index in sorted(layers):
+            layer = geom.add("Layer", layer_index)
+            layer.add("Version", 100)
+            for elem_type in layers[layer_index]:
+                entry = layer.add("LayerElement")
+                entry.add("Type", elem_type)
+                entry.add("TypedIndex", layer_index)
+        return geom_id
+
+
+def _ktime(frames, fps):
+    """Frame number(s) to FBX KTime: an int64 array for arrays, a _Long for scalars."""
+    ktime = np.round(np.asarray(frames, dtype=np.float64) / fps * FBX_KTIME).astype(np.int64)
+    return ktime if ktime.ndim else _Long(int(ktime))
+
+
+def _header_nodes(unit_scale, animation=None):
+    header = _Node("FBXHeaderExtension")
+    header.add("FBXHeaderVersion", 1003)
+    header.add("FBXVersion", FBX_VERSION)
+    header.add("EncryptionType", 0)
+    stamp = header.add("CreationTimeStamp")
+    for name, value in (("Version", 1000), ("Year", 1970), ("Month", 1), ("Day", 1),
+                        ("Hour", 10), ("Minute", 0), ("Second", 0), ("Millisecond", 0)):
+        stamp.add(name, value)
+    header.add("Creator", "Artistant static FBX writer")
+
+    settings = _Node("GlobalSettings")
+    settings.add("Version", 1000)
+    # Y up, -Z forward (FBX "parity" front axis Z), right-handed X
+    _properties70(settings, [
+        ("UpAxis", "int", "Integer", "", 1),
+        ("UpAxisSign", "int", "Integer", "", 1),
+        ("FrontAxis", "int", "Integer", "", 2),
+        ("FrontAxisSign", "int", "Integer", "", 1),
+        ("CoordAxis", "int", "Integer", "", 0),
+        ("CoordAxisSign", "int", "Integer", "", 1),
+        ("OriginalUpAxis", "int", "Integer", "", -1),
+        ("OriginalUpAxisSign", "int", "Integer", "", 1),
+        ("UnitScaleFactor", "double", "Number", "", float(unit_scale)),
+        ("OriginalUnitScaleFactor", "double", "Number", "", float(unit_scale)),
+        *_time_settings(animation),
+    ])
+
+    documents = _Node("Documents")
+    documents.add("Count", 1)
+    document = documents.add("Document", _uid("Document", "Scene"), "Scene", "Scene")
+    _properties70(document, [])
+    document.add("RootNode", _Id(0))
+
+    return [
+        header,
+        _Node("FileId", _Raw(_FILE_ID)),
+        _Node("CreationTime", _TIME_ID),
+        _Node("Creator", "Artistant static FBX writer"),
+        settings,
+        documents,
+        _Node("References"),
+    ]
+
+
+def _time_settings(animation):
+    if animation is None:
+        return []
+    return [
+        ("TimeMode", "enum", "", "", _TIME_MODE_CUSTOM),
+        ("TimeSpanStart", "KTime", "Time", "", _ktime(animation.frame_start, animation.fps)),
+        ("TimeSpanStop", "KTime", "Time", "", _ktime(animation.frame_end, animation.fps)),
+        ("CustomFrameRate", "double", "Number", "", float(animation.fps)),
+    ]
+
+
+def _takes_node(animation):
+    takes = _Node("Takes")
+    takes.add("Current", "")
+    if animation is not None:
+        start = _ktime(animation.frame_start, animation.fps)
+        stop = _ktime(animation.frame_end, animation.fps)
+        take = takes.add("Take", "Take")
+        take.add("FileName", "Take.tak")
+        take.add("LocalTime", start, stop)
+        take.add("ReferenceTime", start, stop)
+    return takes
+
+
+def _definitions_node(counts):
+    definitions = _Node("Definitions")
+    definitions.add("Version", 100)
+    used = {name: count for name, count in counts.items() if count}
+    definitions.add("Count", 1 + sum(used.values()))
+    definitions.add("ObjectType", "GlobalSettings").add("Count", 1)
+    for name, count in used.items():
+        definitions.add("ObjectType", name).add("Count", count)
+    return definitions
+
+
+def fbx_unit_scale(scene, apply_unit_scale=True):
+    """Match the stock exporter's unit factor (units_blender_to_fbx_factor): Blender meters -> FBX centimeters.
+
+    Like the stock exporter, scenes without a unit system (or with unit scale
+    not applied) are written 1:1.
+    """
+    if not apply_unit_scale or scene.unit_settings.system == 'NONE':
+        return 1.0
+    return 100.0 * scene.unit_settings.scale_length
+
+
+def write_static_fbx(filepath, objects, *, depsgraph, scene, apply_modifiers=True,
+                     use_tspace=True, axis_forward='-Z', axis_up='Y', animation=None):
+    """Write objects (MESH/EMPTY only, see unsupported_reason) as a binary FBX file.
+
+    animation is an optional ReducedAnimation (see animation.py) whose keys
+    are written as they are, one take with linear curves.
+    """
+    writer = _SceneWriter(
+        depsgraph,
+        apply_modifiers=apply_modifiers,
+        use_tspace=use_tspace,
+        axis_forward=axis_forward,
+        axis_up=axis_up,
+    )
+
+    members = set(objects)
+    # Parents must be written before children so connections can reference them
+    model_ids = {}
+    pending = sorted(objects, key=lambda o: o.name)
+    while pending:
+        remaining = []
+        for obj in pending:
+            if obj.parent is None or obj.parent not in members:
+                model_ids[obj] = writer.add_object(obj, _Id(0))
+            elif obj.parent in model_ids:
+                model_ids[obj] = writer.add_object(obj, model_ids[obj.parent])
+            else:
+                remaining.append(obj)
+        if len(remaining) == len(pending):
+            raise RuntimeError("Cyclic parenting in export set")
+        pending = remaining
+    if animation is not None:
+        writer.add_animation(animation, model_ids)
+
+    with open(filepath, "wb") as f:
+        f.write(_HEAD_MAGIC)
+        f.write(struct.pack("<I", FBX_VERSION))
+        for node in _header_nodes(fbx_unit_scale(scene), animation):
+            _write_node(f, node)
+        _write_node(f, _definitions_node(writer.counts))
+        _write_node(f, writer.objects)
+        _write_node(f, writer.connections)
+        _write_node(f, _takes_node(animation))
+        f.write(_NULL_RECORD)
+        _write_footer(f)
@@ -0,0 +1,143 @@
+import json
+import os
+
+import numpy as np
+from bpy_extras.io_utils import axis_conversion
+from mathutils import Matrix
+
+from ..common.mesh_arrays import polygon_loop_starts
+from .fbx_native import fbx_unit_scale
+from .manifest import object_shading_signature
+
+
+PLACEMENT_MANIFEST_FILENAME = "artistant_instances.json"
+
+ASSET_KIND_MESH = "mesh"
+ASSET_KIND_COLLECTION = "collection"
+
+
+def _instance_key(obj):
+    """Return the asset an object instances, or None if it is not instance-like."""
+    if obj.instance_type == 'COLLECTION' and obj.instance_collection is not None:
+        return (ASSET_KIND_COLLECTION, obj.instance_collection.name, "")
+    if obj.type == 'MESH' and obj.data is not None:
+        return (ASSET_KIND_MESH, obj.data.name, object_shading_signature(obj))
+    return None
+
+
+def group_instances(objects):
+    """Group objects that would export identical geometry.
+
+    Meshes are grouped by mesh datablock plus modifier/material signature, so
+    objects whose stacks differ are never merged. Collection instance empties
+    are always grouped by collection, even when used once, so the collection
+    content is exported rather than a bare empty.
+
+    Returns:
+        Tuple of (groups, singles): groups is a list of (kind, source_name, members)
+        and singles the objects left for regular per-object export.
+    """
+    buckets = {}
+    singles = []
+    for obj in objects:
+        key = _instance_key(obj)
+        if key is None:
+            singles.append(obj)
+        else:
+            buckets.setdefault(key, []).append(obj)
+
+    groups = []
+    for (kind, source_name, _), members in buckets.items():
+        if kind == ASSET_KIND_MESH and len(members) == 1:
+            singles.extend(members)
+        else:
+            groups.append((kind, source_name, members))
+    return groups, singles
+
+
+def asset_file_name(kind, source_name, reserved_names):
+    """File name for a shared asset that cannot collide with per-object exports.
+
+    Assets are named <source>_<kind>.fbx, so a mesh called like an object (or
+    a collection) never overwrites that object's own <name>.fbx. A numeric
+    suffix is added if an object happens to use that name too.
+
+    Args:
+        reserved_names: Object names that get their own <name>.fbx in this run; the
+            chosen stem is added to it
+    """
+    stem = f"{source_name}_{kind}"
+    number = 1
+    while stem in reserved_names:
+        number += 1
+        stem = f"{source_name}_{kind}_{number}"
+    reserved_names.add(stem)
+    return f"{stem}.fbx"
+
+
+def unity_space(scene, axis_forward='-Z', axis_up='Y'):
+    """Matrix taking Blender world space to Unity space, for conjugating placements.
+
+    Applies the exporter's axis conversion (-Z forward, Y up) and the file's
+    unit scale (fbx_unit_scale, in centimeters, as meters after Unity's unit
+    conversion), then the X mirror Unity's FBX importer uses to go from
+    right- to left-handed coordinates.
+    """
+    axes = axis_conversion(to_forward=axis_forward, to_up=axis_up).to_4x4()
+    meters = Matrix.Scale(fbx_unit_scale(scene) / 100.0, 4)
+    mirror = Matrix.Diagonal((-1.0, 1.0, 1.0, 1.0))
+    return mirror @ meters @ axes
+
+
+def _matrix_rows(matrix):
+    return [round(float(v), 6) for row in matrix for v in row]
+
+
+def placement_entries(kind, members, representative=None, instance_offset=None, space=None):
+    """Return placement records (name, world transform) for each instance of an asset.
+
+    Mesh assets are exported from a representative at the origin that keeps its
+    rotation and scale, so each placement is the instance's world matrix relative
+    to that baked basis. Collection assets are exported in collection space, so
+    placements are the instancer's world matrix with the collection's
+    instance offset removed.
+
+    Args:
+        space: Optional change of basis (see unity_space); matrices are written as
+            space @ matrix @ space^-1 so they match how the asset files are imported
+    """
+    if kind == ASSET_KIND_MESH:
+        basis = representative.matrix_world.copy()
+        basis.translation = (0.0, 0.0, 0.0)
+        correction = basis.inverted_safe()
+    else:
+        correction = Matrix.Translation(-instance_offset)
+    space = space if space is not None else Matrix.Identity(4)
+    space_inv = space.inverted()
+    return [
+        {"name": obj.name, "matrix": _matrix_rows(space @ obj.matrix_world @ correction @ space_inv)}
+        for obj in members
+    ]
+
+
+def mesh_triangle_count(mesh):
+    """Triangles after fan triangulation of every polygon."""
+    _, totals = polygon_loop_starts(mesh)
+    return int(np.maximum(totals - 2, 0).sum())
+
+
+def write_placement_manifest(export_folder, assets, instances):
+    """Write the JSON placement manifest next to the exported asset files.
+
+    Matrices are 4x4 row-major world transforms in Unity space (Y up, left-handed,
+    meters), as built by placement_entries with unity_space.
+
+    Args:
+        export_folder: Destination folder of the export run
+        assets: Dict of asset file name -> {"kind", "source", "instances", "triangles"}
+        instances: List of {"name", "asset", "matrix"} records
+    """
+    path = os.path.join(export_folder, PLACEMENT_MANIFEST_FILENAME)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"assets": assets, "instances": instances}, f, indent=1)
+    return path
@@ -0,0 +1,138 @@
+import re
+
+import bpy
+
+from .instances import mesh_triangle_count
+
+
+LOD_SUFFIX = "_LOD{}"
+DEFAULT_LOD_RATIOS = "50,25,10"
+# Blender's ".001" duplicate-name suffix, dropped so LOD names stay readable in Unity
+_DUPLICATE_SUFFIX = re.compile(r"\.\d{3,}$")
+
+
+def parse_lod_ratios(text):
+    """Parse "50,25,10" (percent of LOD0 triangles) into [0.5, 0.25, 0.1].
+
+    Raises:
+        ValueError: If an entry is not a number between 0 and 100 (exclusive).
+    """
+    ratios = []
+    for part in text.replace(";", ",").split(","):
+        part = part.strip().rstrip("%")
+        if not part:
+            continue
+        percent = float(part)
+        if not 0.0 < percent < 100.0:
+            raise ValueError(f"LOD ratio {part}% must be between 0 and 100")
+        ratios.append(percent / 100.0)
+    return ratios
+
+
+def export_base_name(obj):
+    """obj's name without the .001 suffix Blender gave the export copy.
+
+    The suffix is only dropped when the shorter name belongs to another
+    object (the original), so names like "Rock.2024" stay intact.
+    """
+    base = _DUPLICATE_SUFFIX.sub("", obj.name)
+    if base != obj.name and bpy.data.objects.get(base) not in (None, obj):
+        return base
+    return obj.name
+
+
+def _copy_object_materials(source, target):
+    """Carry object-linked material slots over; mesh-linked slots come with the mesh."""
+    for src_slot, dst_slot in zip(source.material_slots, target.material_slots):
+        if src_slot.link == 'OBJECT':
+            dst_slot.link = 'OBJECT'
+            dst_slot.material = src_slot.material
+
+
+def _copy_skinning(source, target):
+    """Give target the vertex group names and armature modifiers of source.
+
+    Deform weights refer to groups by index; baked meshes normally carry the
+    group names along, any that are missing are recreated in the same order.
+    """
+    for vg in source.vertex_groups:
+        if vg.name not in target.vertex_groups:
+            target.vertex_groups.new(name=vg.name)
+    for src in source.modifiers:
+        if src.type != 'ARMATURE':
+            continue
+        mod = target.modifiers.new(src.name, 'ARMATURE')
+        mod.object = src.object
+        mod.vertex_group = src.vertex_group
+        mod.invert_vertex_group = src.invert_vertex_group
+        mod.use_vertex_groups = src.use_vertex_groups
+        mod.use_bone_envelopes = src.use_bone_envelopes
+        mod.use_deform_preserve_volume = src.use_deform_preserve_volume
+
+
+def build_lod_chain(dups, ratios, *, collection, apply_modifiers):
+    """Add decimated _LOD1.._LODn siblings for every mesh in dups.
+
+    Each mesh is evaluated once; every level decimates that cached mesh, so the
+    original modifier stack never runs again. All levels are evaluated in a
+    single depsgraph update and baked into plain meshes. Skinned meshes are
+    decimated in rest pose, and every level keeps the vertex groups, parent and
+    armature modifiers, so it deforms like LOD0. Mesh objects are
+    renamed to <name>_LOD0, without the .001 suffix Blender gave the copy.
+
+    Args:
+        dups: Export copies; the LOD objects are linked to collection but not added
+        ratios: Triangle ratios per extra level, e.g. [0.5, 0.25, 0.1]
+        collection: Temporary export collection to link LOD objects into
+        apply_modifiers: Whether LOD0 is exported with its modifiers applied
+
+    Returns:
+        Tuple of (lod_objects, triangles_per_level) where triangles_per_level[0] is LOD0.
+    """
+    meshes = [d for d in dups if d.type == 'MESH' and d.data is not None]
+    triangles = [0] * (len(ratios) + 1)
+    if not meshes or not ratios:
+        return [], triangles
+
+    # Bases are evaluated without armature deformation (rest pose); the exporter skins them
+    armature_mods = [m for obj in meshes for m in obj.modifiers if m.type == 'ARMATURE' and m.show_viewport]
+    for mod in armature_mods:
+        mod.show_viewport = False
+    pending = []
+    try:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        for obj in meshes:
+            if apply_modifiers:
+                base = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph))
+            else:
+                base = obj.data
+            triangles[0] += mesh_triangle_count(base)
+            name = export_base_name(obj)
+            obj.name = name + LOD_SUFFIX.format(0)
+            for level, ratio in enumerate(ratios, start=1):
+                lod = bpy.data.objects.new(name + LOD_SUFFIX.format(level), base)
+                collection.objects.link(lod)
+                lod.parent = obj.parent
+                lod.parent_type = obj.parent_type
+                lod.parent_bone = obj.parent_bone
+                lod.matrix_parent_inverse = obj.matrix_parent_inverse
+                lod.matrix_basis = obj.matrix_basis
+                _copy_object_materials(obj, lod)
+                decimate = lod.modifiers.new("LOD", 'DECIMATE')
+                decimate.ratio = ratio
+                pending.append((level, lod, obj))
+    finally:
+        for mod in armature_mods:
+            mod.show_viewport = True
+
+    # One evaluation for every level of every mesh, then bake the results
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    lods = []
+    for level, lod, source in pending:
+        lod_mesh = bpy.data.meshes.new_from_object(lod.evaluated_get(depsgraph))
+        lod.modifiers.clear()
+        lod.data = lod_mesh
+        _copy_skinning(source, lod)
+        triangles[level] += mesh_triangle_count(lod_mesh)
+        lods.append(lod)
+    return lods, triangles
@@ -0,0 +1,264 @@
+import hashlib
+import json
+import os
+
+import bpy
+import numpy as np
+
+from ..common.mesh_arrays import (
+    attribute_array,
+    corner_vertex_indices,
+    polygon_loop_starts,
+    vertex_positions,
+)
+
+
+MANIFEST_FILENAME = ".artistant_export_manifest.json"
+# Bump when the hashed content changes shape so stale manifests never match.
+MANIFEST_VERSION = 2
+
+# Object types that the FBX exporter converts to mesh geometry
+_GEOMETRY_TYPES = {'MESH', 'CURVE', 'SURFACE', 'FONT', 'META'}
+
+
+def _plain_value(value):
+    """Convert an RNA value into something json.dumps can serialize deterministically."""
+    if isinstance(value, (bool, int, float, str)) or value is None:
+        return value
+    if isinstance(value, bpy.types.ID):
+        return f"ID:{value.name}"
+    if isinstance(value, bpy.types.bpy_struct):
+        # Nested non-ID structs are covered by their owner's own properties
+        return type(value).__name__
+    try:
+        return [_plain_value(v) for v in value]
+    except TypeError:
+        return str(value)
+
+
+def _rna_signature(struct):
+    """Return (identifier, value) pairs for every non-collection RNA property of a struct."""
+    out = []
+    for prop in struct.bl_rna.properties:
+        ident = prop.identifier
+        if ident == "rna_type" or prop.type == 'COLLECTION':
+            continue
+        try:
+            out.append((ident, _plain_value(getattr(struct, ident))))
+        except Exception:
+            # Some properties are context-dependent and cannot be read here
+            continue
+    return out
+
+
+def _image_signature(image):
+    """Identify an image's pixels: packed data digest, file size/mtime, or unsaved pixels.
+
+    Name and path alone miss repaints on disk or in a packed image.
+    """
+    sig = [image.name, image.filepath, tuple(image.size), image.source]
+    if image.is_dirty:
+        # Edited in Blender and not saved: the exporter writes what is in memory
+        pixels = np.empty(len(image.pixels), dtype=np.float32)
+        image.pixels.foreach_get(pixels)
+        sig.append(hashlib.sha1(pixels.tobytes()).hexdigest())
+    elif image.packed_file is not None:
+        sig.append(hashlib.sha1(image.packed_file.data).hexdigest())
+    elif image.source in {'FILE', 'SEQUENCE', 'MOVIE', 'TILED'}:
+        try:
+            stat = os.stat(bpy.path.abspath(image.filepath, library=image.library))
+            sig.append((stat.st_size, stat.st_mtime_ns))
+        except OSError:
+            sig.append("missing")
+    return sig
+
+
+def _material_signature(material):
+    """Describe a material's node graph (or flat settings) for hashing."""
+    if material is None:
+        return None
+    sig = [material.name]
+    if not (material.use_nodes and material.node_tree):
+        sig.append(_plain_value(material.diffuse_color))
+        sig.append((material.metallic, material.roughness))
+        return sig
+
+    tree = material.node_tree
+    for node in sorted(tree.nodes, key=lambda n: n.name):
+        sig.append((node.bl_idname, node.name))
+        image = getattr(node, "image", None)
+        if image is not None:
+            sig.append(_image_signature(image))
+        for socket in node.inputs:
+            if not socket.is_linked and hasattr(socket, "default_value"):
+                sig.append((socket.identifier, _plain_value(socket.default_value)))
+    for link in tree.links:
+        sig.append((
+            link.from_node.name,
+            link.from_socket.identifier,
+            link.to_node.name,
+            link.to_socket.identifier,
+        ))
+    return sig
+
+
+def object_shading_signature(obj):
+    """Return a JSON string of an object's modifier stack and material assignment.
+
+    Two objects sharing mesh data only produce identical geometry when this
+    signature matches too.
+    """
+    return json.dumps([
+        [(m.name, m.type, _rna_signature(m)) for m in obj.modifiers],
+        [_material_signature(slot.material) for slot in obj.material_slots],
+    ], default=str)
+
+
+def _hash_mesh(h, mesh):
+    """Feed topology and every bulk-readable attribute of a mesh into the hash."""
+    h.update(vertex_positions(mesh).tobytes())
+    h.update(corner_vertex_indices(mesh).tobytes())
+    for array in polygon_loop_starts(mesh):
+        h.update(array.tobytes())
+    for attr in sorted(mesh.attributes, key=lambda a: a.name):
+        values = attribute_array(attr)
+        if values is None:
+            continue
+        h.update(f"{attr.name}:{attr.domain}:{attr.data_type}".encode())
+        h.update(values.tobytes())
+
+
+def _hash_object_data(h, obj, depsgraph, apply_modifiers):
+    """Feed the exported data of one object into the hash."""
+    if obj.type in _GEOMETRY_TYPES:
+        source = obj.evaluated_get(depsgraph) if apply_modifiers else obj
+        if source.type == 'MESH' and not apply_modifiers:
+            _hash_mesh(h, source.data)
+            return
+        mesh = source.to_mesh()
+        try:
+            if mesh is not None:
+                _hash_mesh(h, mesh)
+        finally:
+            source.to_mesh_clear()
+    elif obj.type == 'ARMATURE':
+        for bone in obj.data.bones:
+            h.update(json.dumps([
+                bone.name,
+                bone.parent.name if bone.parent else None,
+                _plain_value(bone.head_local),
+                _plain_value(bone.tail_local),
+                _plain_value(bone.matrix_local),
+            ]).encode())
+    elif obj.data is not None:
+        h.update(json.dumps(_rna_signature(obj.data), default=str).encode())
+
+
+def _hash_animation(h, obj):
+    """Feed the keys of an object's action into the hash."""
+    anim = obj.animation_data
+    if anim is None or anim.action is None:
+        return
+    for fcurve in anim.action.fcurves:
+        co = np.empty(len(fcurve.keyframe_points) * 2, dtype=np.float32)
+        fcurve.keyframe_points.foreach_get("co", co)
+        h.update(f"{fcurve.data_path}:{fcurve.array_index}".encode())
+        h.update(co.tobytes())
+
+
+def compute_export_hash(depsgraph, source_objs, settings, *, apply_modifiers, zero_root_translation, include_animation=False):
+    """Return a hex digest describing everything that ends up in one exported file.
+
+    Covers evaluated mesh data, transforms, modifiers, materials, the exported
+    hierarchy and the exporter settings. Root translation is ignored when the
+    export moves roots to the origin, so relocating a prop in the scene does
+    not invalidate its file.
+
+    Args:
+        depsgraph: Evaluated depsgraph used to read modifier results
+        source_objs: Objects that will be duplicated into the file
+        settings: JSON-serializable dict of exporter settings
+        apply_modifiers: Whether the export bakes modifiers into the mesh
+        zero_root_translation: Whether roots are placed at (0,0,0) on export
+        include_animation: Whether action keys are exported and must be hashed
+    """
+    h = hashlib.sha1()
+    h.update(json.dumps({"version": MANIFEST_VERSION, "settings": settings}, sort_keys=True).encode())
+
+    members = set(source_objs)
+    for obj in sorted(source_objs, key=lambda o: o.name):
+        is_root = obj.parent not in members
+        if is_root:
+            matrix = obj.matrix_world.copy()
+            if zero_root_translation:
+                matrix.translation = (0.0, 0.0, 0.0)
+        else:
+            matrix = obj.matrix_local
+        h.update(json.dumps([
+            obj.name,
+            obj.type,
+            None if is_root else obj.parent.name,
+            obj.parent_type,
+            obj.parent_bone,
+            _plain_value(matrix),
+            object_shading_signature(obj),
+        ], default=str).encode())
+        _hash_object_data(h, obj, depsgraph, apply_modifiers)
+        if include_animation:
+            _hash_animation(h, obj)
+
+    return h.hexdigest()
+
+
+class ExportManifest:
+    """Persistent record of the content hash behind every file in an export folder."""
+
+    def __init__(self, export_folder):
+        self.path = os.path.join(export_folder, MANIFEST_FILENAME)
+        self.files = {}
+
+    def load(self):
+        """Read the manifest from disk; a missing or corrupt file starts empty."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return self
+        if data.get("version") == MANIFEST_VERSION:
+            self.files = dict(data.get("files", {}))
+        return self
+
+    def save(self):
+        """Write the manifest atomically so an interrupted save never corrupts it."""
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": MANIFEST_VERSION, "files": self.files}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def is_up_to_date(self, export_path, content_hash):
+        """Return True if export_path was written from content_hash and is untouched on disk."""
+        entry = self.files.get(os.path.basename(export_path))
+        if not entry or entry.get("hash") != content_hash:
+            return False
+        try:
+            stat = os.stat(export_path)
+        except OSError:
+            return False
+        return stat.st_size == entry.get("size") and stat.st_mtime_ns == entry.get("mtime_ns")
+
+    def record(self, export_path, content_hash):
+        """Remember the hash and on-disk stamp of a freshly written file."""
+        stat = os.stat(export_path)
+        self.files.setdefault(os.path.basename(export_path), {}).update({
+            "hash": content_hash,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        })
+
+    def record_textures(self, export_path, store_names):
+        """Remember which texture store files a freshly written file references."""
+        self.files.setdefault(os.path.basename(export_path), {})["textures"] = sorted(set(store_names))
+
+    def referenced_textures(self):
+        """Texture store filenames referenced by any recorded file."""
+        return {name for entry in self.files.values() for name in entry.get("textures", ())}
@@ -0,0 +1,206 @@
+import bpy
+import numpy as np
+
+from ..common.mesh_arrays import (
+    corner_vertex_indices,
+    matrix_to_array,
+    polygon_loop_starts,
+    polygon_material_indices,
+    vertex_positions,
+)
+
+
+# Largest vertex count addressable by a 16-bit index buffer
+UINT16_VERTEX_LIMIT = 65535
+
+
+def _is_mergeable(obj, export_parents):
+    """Static meshes only: no rig, no shape keys, and nothing exported parented below them."""
+    if obj.type != 'MESH' or obj.data is None or obj.data.shape_keys is not None:
+        return False
+    if any(m.type == 'ARMATURE' for m in obj.modifiers):
+        return False
+    return obj not in export_parents
+
+
+def _corner_order(starts, totals, flip):
+    """Corner permutation that reverses winding (keeping the first corner) when flip is set."""
+    corner_count = int(totals.sum())
+    order = np.arange(corner_count, dtype=np.int64)
+    if flip and corner_count:
+        poly_start = np.repeat(starts.astype(np.int64), totals)
+        poly_total = np.repeat(totals.astype(np.int64), totals)
+        order = poly_start + (-(order - poly_start)) % poly_total
+    return order
+
+
+class _MeshChunk:
+    """World-space arrays of the polygons of one object that use one material."""
+
+    __slots__ = ("positions", "corner_verts", "totals", "smooth", "uvs")
+
+    def __init__(self, positions, corner_verts, totals, smooth, uvs):
+        self.positions = positions
+        self.corner_verts = corner_verts
+        self.totals = totals
+        self.smooth = smooth
+        self.uvs = uvs
+
+
+def _object_chunks(obj, mesh):
+    """Split an object's mesh into per-material chunks in world space.
+
+    Returns:
+        Dict of material -> _MeshChunk.
+    """
+    matrix = matrix_to_array(obj.matrix_world)
+    positions = vertex_positions(mesh).astype(np.float64) @ matrix[:3, :3].T + matrix[:3, 3]
+    corner_verts = corner_vertex_indices(mesh)
+    starts, totals = polygon_loop_starts(mesh)
+    material_indices = polygon_material_indices(mesh)
+    smooth = np.empty(len(totals), dtype=bool)
+    mesh.polygons.foreach_get("use_smooth", smooth)
+    uv_layers = []
+    for layer in mesh.uv_layers:
+        uv = np.empty(len(corner_verts) * 2, dtype=np.float32)
+        layer.data.foreach_get("uv", uv)
+        uv_layers.append(uv.reshape(-1, 2))
+
+    # Mirrored objects flip face winding when baked into world space
+    order = _corner_order(starts, totals, np.linalg.det(matrix[:3, :3]) < 0.0)
+    corner_verts = corner_verts[order]
+    uv_layers = [uv[order] for uv in uv_layers]
+
+    slot_materials = [slot.material for slot in obj.material_slots] or [None]
+    material_indices = np.clip(material_indices, 0, len(slot_materials) - 1)
+    corner_poly = np.repeat(np.arange(len(totals)), totals)
+
+    chunks = {}
+    for slot_index in np.unique(material_indices):
+        poly_mask = material_indices == slot_index
+        corner_mask = poly_mask[corner_poly]
+        used, local_verts = np.unique(corner_verts[corner_mask], return_inverse=True)
+        chunk = _MeshChunk(
+            positions[used],
+            local_verts.astype(np.int64),
+            totals[poly_mask],
+            smooth[poly_mask],
+            [uv[corner_mask] for uv in uv_layers],
+        )
+        material = slot_materials[int(slot_index)]
+        if material in chunks:
+            chunks[material] = _concatenate([chunks[material], chunk])
+        else:
+            chunks[material] = chunk
+    return chunks
+
+
+def _concatenate(chunks):
+    """Join chunks into one, offsetting corner vertex indices and padding missing UV layers."""
+    uv_count = max(len(c.uvs) for c in chunks)
+    offsets = np.cumsum([0] + [len(c.positions) for c in chunks[:-1]])
+    uvs = []
+    for layer in range(uv_count):
+        uvs.append(np.concatenate([
+            c.uvs[layer] if layer < len(c.uvs) else np.zeros((len(c.corner_verts), 2), dtype=np.float32)
+            for c in chunks
+        ]))
+    return _MeshChunk(
+        np.concatenate([c.positions for c in chunks]),
+        np.concatenate([c.corner_verts + offset for c, offset in zip(chunks, offsets)]),
+        np.concatenate([c.totals for c in chunks]),
+        np.concatenate([c.smooth for c in chunks]),
+        uvs,
+    )
+
+
+def _split_by_vertex_limit(chunks, max_vertices):
+    """Group chunks into runs whose vertex total stays within max_vertices (0 = no limit).
+
+    A single object larger than the limit keeps its own run.
+    """
+    if not max_vertices:
+        return [chunks]
+    runs, current, count = [], [], 0
+    for chunk in chunks:
+        if current and count + len(chunk.positions) > max_vertices:
+            runs.append(current)
+            current, count = [], 0
+        current.append(chunk)
+        count += len(chunk.positions)
+    if current:
+        runs.append(current)
+    return runs
+
+
+def _build_mesh(name, chunk, material):
+    """Create a mesh datablock from a chunk with bulk foreach_set calls."""
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(chunk.positions))
+    mesh.vertices.foreach_set("co", chunk.positions.astype(np.float32).ravel())
+    mesh.loops.add(len(chunk.corner_verts))
+    mesh.loops.foreach_set("vertex_index", chunk.corner_verts.astype(np.int32))
+    mesh.polygons.add(len(chunk.totals))
+    starts = np.concatenate(([0], np.cumsum(chunk.totals)[:-1])).astype(np.int32)
+    mesh.polygons.foreach_set("loop_start", starts)
+    mesh.polygons.foreach_set("use_smooth", chunk.smooth)
+    for index, uv in enumerate(chunk.uvs):
+        layer = mesh.uv_layers.new(name=f"UVMap{'' if index == 0 else f'.{index:03d}'}")
+        layer.data.foreach_set("uv", uv.astype(np.float32).ravel())
+    if material is not None:
+        mesh.materials.append(material)
+    mesh.update(calc_edges=True)
+    mesh.validate(clean_customdata=False)
+    return mesh
+
+
+def merge_by_material(dups, *, collection, apply_modifiers, max_vertices=0, exclude=()):
+    """Replace static mesh copies with one world-space mesh per material.
+
+    Geometry (after modifiers when applied) is split per material with NumPy
+    masks and concatenated in bulk; no join operator runs. Merged objects sit
+    at the world origin with an identity transform. Merged copies are
+    removed; their data is left for the export's datablock purge.
+
+    Args:
+        dups: Export copies; merged ones are removed from the list in place
+        collection: Temporary export collection to link merged objects into
+        apply_modifiers: Merge evaluated geometry instead of the base mesh
+        max_vertices: Split a material's mesh when it would exceed this count (0 = off)
+        exclude: Objects that must stay separate (e.g. collision hulls)
+
+    Returns:
+        Tuple of (merged_objects, merged_source_count).
+    """
+    export_parents = {d.parent for d in dups}
+    exclude = set(exclude)
+    sources = [d for d in dups if d not in exclude and _is_mergeable(d, export_parents)]
+    if len(sources) < 2:
+        return [], 0
+
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    by_material = {}
+    for obj in sources:
+        source = obj.evaluated_get(depsgraph) if apply_modifiers else obj
+        mesh = source.to_mesh()
+        try:
+            for material, chunk in _object_chunks(obj, mesh).items():
+                by_material.setdefault(material, []).append(chunk)
+        finally:
+            source.to_mesh_clear()
+
+    for obj in sources:
+        dups.remove(obj)
+        bpy.data.objects.remove(obj, do_unlink=True)
+
+    merged = []
+    for material, chunks in by_material.items():
+        base_name = f"Merged_{material.name if material else 'NoMaterial'}"
+        runs = _split_by_vertex_limit(chunks, max_vertices)
+        for index, run in enumerate(runs, start=1):
+            name = base_name if len(runs) == 1 else f"{base_name}_{index:02d}"
+            obj = bpy.data.objects.new(name, _build_mesh(name, _concatenate(run), material))
+            collection.objects.link(obj)
+            merged.append(obj)
+    dups.extend(merged)
+    return merged, len(sources)
@@ -0,0 +1,103 @@
+import csv
+import os
+import time
+from contextlib import contextmanager, nullcontext
+
+import numpy as np
+
+
+PROFILE_FILENAME = "artistant_export_profile.csv"
+# Pipeline phases timed per file, in execution order
+PHASES = ("hash", "duplicate", "prepare", "validate", "atlas", "merge", "lod", "reorder", "keys", "skin", "write", "cleanup")
+
+
+class ExportProfiler:
+    """Collects per-file phase timings and geometry counts for one export run."""
+
+    enabled = True
+
+    def __init__(self):
+        self.records = []
+        self._current = None
+
+    def begin_file(self, export_path):
+        self._current = {
+            "file": os.path.basename(export_path),
+            "objects": 0,
+            "vertices": 0,
+            "triangles": 0,
+        }
+        self._current.update((phase, 0.0) for phase in PHASES)
+        self.records.append(self._current)
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._current[name] += time.perf_counter() - start
+
+    def count_geometry(self, objects, depsgraph):
+        """Add object, vertex and triangle counts of the (evaluated) export objects."""
+        record = self._current
+        record["objects"] += len(objects)
+        for obj in objects:
+            if obj.type != 'MESH':
+                continue
+            mesh = obj.evaluated_get(depsgraph).data
+            totals = np.empty(len(mesh.polygons), dtype=np.int32)
+            mesh.polygons.foreach_get("loop_total", totals)
+            record["vertices"] += len(mesh.vertices)
+            record["triangles"] += int(np.maximum(totals - 2, 0).sum())
+
+    def write_csv(self, export_folder):
+        path = os.path.join(export_folder, PROFILE_FILENAME)
+        fields = ["file", "objects", "vertices", "triangles", *PHASES, "total"]
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            for record in self.records:
+                row = dict(record)
+                row["total"] = sum(record[phase] for phase in PHASES)
+                for key in (*PHASES, "total"):
+                    row[key] = f"{row[key]:.6f}"
+                writer.writerow(row)
+        return path
+
+    def summary(self, top=3):
+        """One-line summary: slowest files with their dominant phase, and the run's dominant phase."""
+        if not self.records:
+            return "no files profiled"
+
+        def total(record):
+            return sum(record[phase] for phase in PHASES)
+
+        slowest = sorted(self.records, key=total, reverse=True)[:top]
+        parts = []
+        for record in slowest:
+            dominant = max(PHASES, key=lambda phase: record[phase])
+            parts.append(f"{record['file']} {total(record):.2f}s ({dominant})")
+        phase_totals = {phase: sum(r[phase] for r in self.records) for phase in PHASES}
+        run_total = sum(phase_totals.values()) or 1.0
+        dominant = max(phase_totals, key=phase_totals.get)
+        return (
+            f"slowest: {', '.join(parts)}; "
+            f"dominant phase: {dominant} ({100.0 * phase_totals[dominant] / run_total:.0f}%)"
+        )
+
+
+class NullProfiler:
+    """Stand-in used when profiling is off: every hook is a no-op."""
+
+    enabled = False
+    _null_phase = nullcontext()
+
+    def begin_file(self, export_path):
+        pass
+
+    def phase(self, name):
+        return self._null_phase
+
+    def count_geometry(self, objects, depsgraph):
+        pass
@@ -0,0 +1,50 @@
+def pack_rects(sizes, max_size, padding=0):
+    """Shelf-pack rectangles into as few max_size x max_size bins as possible.
+
+    Rectangles are placed tallest first on horizontal shelves; every bin is
+    then shrunk to the smallest power-of-two size that holds its content.
+
+    Args:
+        sizes: List of (width, height) in pixels
+        max_size: Edge length of a bin
+        padding: Free border kept around every rectangle
+
+    Returns:
+        Tuple of (placements, bins): placements[i] is (bin_index, x, y) of the
+        unpadded rectangle i, bins is a list of (width, height).
+
+    Raises:
+        ValueError: If a rectangle plus padding does not fit into max_size.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (sizes[i][1], sizes[i][0]), reverse=True)
+    placements = [None] * len(sizes)
+    # Per bin: list of shelves as [y, height, x_cursor]
+    bins = []
+    for i in order:
+        w, h = sizes[i]
+        pw, ph = w + 2 * padding, h + 2 * padding
+        if pw > max_size or ph > max_size:
+            raise ValueError(f"{w}x{h} does not fit into a {max_size} atlas")
+        for b, shelves in enumerate(bins):
+            shelf = next((s for s in shelves if ph <= s[1] and s[2] + pw <= max_size), None)
+            if shelf is None:
+                top = shelves[-1][0] + shelves[-1][1]
+                if top + ph > max_size:
+                    continue
+                shelf = [top, ph, 0]
+                shelves.append(shelf)
+            placements[i] = (b, shelf[2] + padding, shelf[0] + padding)
+            shelf[2] += pw
+            break
+        else:
+            bins.append([[0, ph, pw]])
+            placements[i] = (len(bins) - 1, padding, padding)
+
+    def pow2(value):
+        return 1 << max(0, int(value - 1).bit_length())
+
+    bin_sizes = [
+        (pow2(max(s[2] for s in shelves)), pow2(shelves[-1][0] + shelves[-1][1]))
+        for shelves in bins
+    ]
+    return placements, bin_sizes
@@ -0,0 +1,175 @@
+import bpy
+import numpy as np
+
+
+DEFAULT_MAX_INFLUENCES = 4
+DEFAULT_PRUNE_THRESHOLD = 0.01
+# Written weights are rounded to 1/WEIGHT_STEPS so equal weights of a group go in one call
+WEIGHT_STEPS = 1024
+# Point attribute each bone group is copied into while reading weights
+_WEIGHT_ATTRIBUTE = "_artistant_weight_{}"
+
+
+def _deform_bone_names(obj):
+    """Names of deforming bones of every armature that deforms obj."""
+    names = set()
+    for modifier in obj.modifiers:
+        if modifier.type == 'ARMATURE' and modifier.object is not None and modifier.object.type == 'ARMATURE':
+            names.update(bone.name for bone in modifier.object.data.bones if bone.use_deform)
+    return names
+
+
+def _rank_within_vertex(vertices):
+    """0-based position of each entry within its run of equal (sorted) vertex indices."""
+    starts = np.flatnonzero(np.r_[True, vertices[1:] != vertices[:-1]])
+    lengths = np.diff(np.r_[starts, len(vertices)])
+    return np.arange(len(vertices)) - np.repeat(starts, lengths)
+
+
+def _weights_node_group(group_names):
+    """Geometry nodes that copy each named vertex group into a float point attribute."""
+    tree = bpy.data.node_groups.new("_artistant_read_weights", 'GeometryNodeTree')
+    tree.interface.new_socket("Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+    tree.interface.new_socket("Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+    socket = tree.nodes.new('NodeGroupInput').outputs[0]
+    for index, name in enumerate(group_names):
+        read = tree.nodes.new('GeometryNodeInputNamedAttribute')
+        read.data_type = 'FLOAT'
+        read.inputs["Name"].default_value = name
+        store = tree.nodes.new('GeometryNodeStoreNamedAttribute')
+        store.data_type = 'FLOAT'
+        store.domain = 'POINT'
+        store.inputs["Name"].default_value = _WEIGHT_ATTRIBUTE.format(index)
+        tree.links.new(socket, store.inputs["Geometry"])
+        tree.links.new(read.outputs["Attribute"], store.inputs["Value"])
+        socket = store.outputs["Geometry"]
+    tree.links.new(socket, tree.nodes.new('NodeGroupOutput').inputs[0])
+    return tree
+
+
+def _read_weights(obj, group_names):
+    """(vertices, groups) float32 array of the weights of the named vertex groups.
+
+    Vertex groups cannot be read in bulk through the Python API, so a
+    temporary geometry nodes modifier (with every other modifier off) stores
+    each group as a point attribute of the evaluated mesh, which is then read
+    with one foreach_get per group. Unassigned vertices read as 0.
+    """
+    tree = _weights_node_group(group_names)
+    disabled = [m for m in obj.modifiers if m.show_viewport]
+    for modifier in disabled:
+        modifier.show_viewport = False
+    modifier = obj.modifiers.new("_artistant_read_weights", 'NODES')
+    try:
+        modifier.node_group = tree
+        mesh = obj.evaluated_get(bpy.context.evaluated_depsgraph_get()).data
+        weights = np.empty((len(group_names), len(mesh.vertices)), dtype=np.float32)
+        for index in range(len(group_names)):
+            mesh.attributes[_WEIGHT_ATTRIBUTE.format(index)].data.foreach_get("value", weights[index])
+    finally:
+        obj.modifiers.remove(modifier)
+        for other in disabled:
+            other.show_viewport = True
+        bpy.data.node_groups.remove(tree)
+    return weights.T
+
+
+def _runs(*keys):
+    """Split sorted parallel key arrays into (first, end) runs of equal keys."""
+    change = np.zeros(len(keys[0]), dtype=bool)
+    if len(change):
+        change[0] = True
+    for key in keys:
+        change[1:] |= key[1:] != key[:-1]
+    starts = np.flatnonzero(change)
+    return zip(starts.tolist(), np.r_[starts[1:], len(change)].tolist())
+
+
+def _write_weights(vertex_groups, vertices, groups, levels, removed_vertices, removed_groups):
+    """Remove dropped assignments and write kept ones, one call per group (and weight level)."""
+    order = np.argsort(removed_groups, kind="stable")
+    removed_vertices, removed_groups = removed_vertices[order], removed_groups[order]
+    for first, end in _runs(removed_groups):
+        vertex_groups[int(removed_groups[first])].remove(removed_vertices[first:end].tolist())
+
+    order = np.lexsort((levels, groups))
+    vertices, groups, levels = vertices[order], groups[order], levels[order]
+    for first, end in _runs(groups, levels):
+        vertex_groups[int(groups[first])].add(vertices[first:end].tolist(), levels[first] / WEIGHT_STEPS, 'REPLACE')
+
+
+def _quantized_levels(vertices, weights):
+    """Normalize each vertex's kept weights to integer levels summing to WEIGHT_STEPS.
+
+    Entries are sorted by vertex, strongest first. Rounding error goes to the
+    strongest influence, so written weights (levels / WEIGHT_STEPS, exact in
+    float) sum to exactly 1; no kept influence rounds to zero.
+    """
+    sums = np.bincount(vertices, weights=weights)
+    levels = np.maximum(np.rint(weights / np.maximum(sums[vertices], 1e-12) * WEIGHT_STEPS), 1).astype(np.int64)
+    first = np.flatnonzero(np.r_[True, vertices[1:] != vertices[:-1]]) if len(vertices) else np.zeros(0, dtype=np.int64)
+    totals = np.add.reduceat(levels, first) if len(first) else np.zeros(0, dtype=np.int64)
+    levels[first] += WEIGHT_STEPS - totals
+    return levels
+
+
+def optimize_skin_weights(obj, *, max_influences=DEFAULT_MAX_INFLUENCES, prune_threshold=DEFAULT_PRUNE_THRESHOLD):
+    """Cap bone influences per vertex, prune small weights, renormalize and drop emptied bone groups.
+
+    Only groups named after deforming bones count as influences; other
+    vertex groups are left as they are. Every vertex keeps at least its
+    strongest bone. Bone weights are read in bulk (see _read_weights),
+    processed with NumPy, normalized to 1/WEIGHT_STEPS levels that sum to
+    exactly 1, and written back with one vertex group call per group and
+    weight instead of per vertex.
+
+    Returns:
+        Dict of statistics, or None if obj is not a skinned mesh.
+    """
+    bone_names = _deform_bone_names(obj)
+    if obj.type != 'MESH' or not bone_names or not obj.vertex_groups:
+        return None
+    bone_groups = [vg for vg in obj.vertex_groups if vg.name in bone_names]
+    if not bone_groups:
+        return None
+    if obj.data.users > 1:
+        obj.data = obj.data.copy()
+
+    dense = _read_weights(obj, [vg.name for vg in bone_groups])
+    vertex_count = dense.shape[0]
+    b_vertices, columns = np.nonzero(dense > 0.0)
+    if not len(b_vertices):
+        return None
+    b_weights = dense[b_vertices, columns].astype(np.float64)
+    b_groups = np.array([vg.index for vg in bone_groups], dtype=np.int64)[columns]
+
+    order = np.lexsort((-b_weights, b_vertices))
+    b_vertices, b_groups, b_weights = b_vertices[order], b_groups[order], b_weights[order]
+    rank = _rank_within_vertex(b_vertices)
+
+    keep = (rank < max_influences) & (b_weights >= prune_threshold)
+    keep |= rank == 0
+    levels = _quantized_levels(b_vertices[keep], b_weights[keep])
+
+    influences_before = np.bincount(b_vertices, minlength=vertex_count)
+    influences_after = np.bincount(b_vertices[keep], minlength=vertex_count)
+
+    _write_weights(
+        obj.vertex_groups,
+        b_vertices[keep], b_groups[keep], levels,
+        b_vertices[~keep], b_groups[~keep],
+    )
+
+    used = set(np.unique(b_groups[keep]).tolist())
+    empty = [vg for vg in bone_groups if vg.index not in used]
+    for vg in empty:
+        obj.vertex_groups.remove(vg)
+
+    return {
+        "vertices": vertex_count,
+        "max_before": int(influences_before.max(initial=0)),
+        "max_after": int(influences_after.max(initial=0)),
+        "capped_vertices": int((influences_before > max_influences).sum()),
+        "pruned_weights": int((~keep).sum()),
+        "removed_groups": len(empty),
+    }
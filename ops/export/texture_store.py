@@ -0,0 +1,222 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+from contextlib import contextmanager
+
+import bpy
+
+
+TEXTURE_STORE_DIRNAME = "Textures"
+TEXTURE_INDEX_FILENAME = ".artistant_texture_index.json"
+
+STORE_MODE_OFF = 'OFF'
+STORE_MODE_REFERENCE = 'REFERENCE'
+STORE_MODE_HARDLINK = 'HARDLINK'
+
+_HASH_CHUNK = 1024 * 1024
+
+
+def _hash_file(path):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _node_tree_images(tree, seen_trees):
+    """Yield images of every Image Texture node, following node groups once."""
+    if tree is None or tree in seen_trees:
+        return
+    seen_trees.add(tree)
+    for node in tree.nodes:
+        if node.type == 'TEX_IMAGE' and node.image is not None:
+            yield node.image
+        elif node.type == 'GROUP':
+            yield from _node_tree_images(node.node_tree, seen_trees)
+
+
+def images_for_objects(objects):
+    """Return the set of images used by the materials of the given objects."""
+    images = set()
+    seen_trees = set()
+    for obj in objects:
+        for slot in obj.material_slots:
+            material = slot.material
+            if material is not None and material.use_nodes:
+                images.update(_node_tree_images(material.node_tree, seen_trees))
+    return images
+
+
+class TextureStore:
+    """Content-addressed texture folder shared by every FBX in an export folder.
+
+    Each image is written once as <name>_<hash>.<ext> under Textures/. Exports
+    reference the stored file instead of copying or embedding the texture
+    again. An index of source size/mtime/hash lets unchanged textures skip
+    hashing and copying on later runs. The export manifest records which
+    stored files each FBX uses, so files no FBX references anymore are pruned.
+    """
+
+    def __init__(self, export_folder, mode):
+        self.mode = mode
+        self.export_folder = export_folder
+        self.root = os.path.join(export_folder, TEXTURE_STORE_DIRNAME)
+        self.index_path = os.path.join(self.root, TEXTURE_INDEX_FILENAME)
+        self.index = {}
+        self.files_written = 0
+        self.files_unchanged = 0
+        self.bytes_written = 0
+        self.bytes_referenced = 0
+        self.seconds = 0.0
+        self.unsupported = set()
+        self.files_pruned = 0
+        # Store filenames handed out by the last redirect(), i.e. used by the last FBX
+        self.last_names = []
+        self._targets = {}
+        self._resolved = {}
+
+    def load(self):
+        os.makedirs(self.root, exist_ok=True)
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            self.index = {}
+        return self
+
+    def save(self):
+        tmp_path = f"{self.index_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+
+    @property
+    def bytes_saved(self):
+        """Bytes not written compared to copying every texture next to every FBX."""
+        return max(0, self.bytes_referenced - self.bytes_written)
+
+    def _target(self, image):
+        """Resolve image to (store_path, size, packed_data), or None; nothing is written.
+
+        File digests come from the index when size and mtime are unchanged.
+        """
+        if image in self._targets:
+            return self._targets[image]
+
+        target = None
+        source = os.path.normpath(bpy.path.abspath(image.filepath, library=image.library))
+        stem, ext = os.path.splitext(os.path.basename(source))
+        if image.packed_file is not None:
+            data = bytes(image.packed_file.data)
+            digest = hashlib.sha1(data).hexdigest()
+            target = (os.path.join(self.root, f"{stem or image.name}_{digest[:12]}{ext or '.png'}"), len(data), data)
+        elif image.source == 'FILE' and os.path.isfile(source):
+            stat = os.stat(source)
+            entry = self.index.get(source)
+            if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                digest = entry["hash"]
+            else:
+                digest = _hash_file(source)
+            self.index[source] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "hash": digest}
+            target = (os.path.join(self.root, f"{stem}_{digest[:12]}{ext}"), stat.st_size, None)
+
+        self._targets[image] = target
+        return target
+
+    def store_names(self, objects):
+        """Sorted store filenames the objects' textures resolve to (for content hashing)."""
+        names = set()
+        for image in images_for_objects(objects):
+            target = self._target(image)
+            if target is not None:
+                names.add(os.path.basename(target[0]))
+        return sorted(names)
+
+    def _store_file(self, image):
+        """Make sure image is in the store and return (store_path, size), or None."""
+        if image in self._resolved:
+            return self._resolved[image]
+
+        target = self._target(image)
+        result = None
+        if target is None:
+            # Generated or missing images have no file to share
+            self.unsupported.add(image.name)
+        else:
+            dest, size, data = target
+            if os.path.exists(dest) and os.path.getsize(dest) == size:
+                self.files_unchanged += 1
+            else:
+                if data is not None:
+                    with open(dest, "wb") as f:
+                        f.write(data)
+                else:
+                    source = os.path.normpath(bpy.path.abspath(image.filepath, library=image.library))
+                    shutil.copyfile(source, dest)
+                self.files_written += 1
+                self.bytes_written += size
+            result = (dest, size)
+
+        self._resolved[image] = result
+        return result
+
+    def prune(self, names, fbx_folder):
+        """Delete stored textures (and their hardlinked copies) that no export references anymore.
+
+        Returns:
+            Number of store files removed.
+        """
+        removed = 0
+        for name in names:
+            try:
+                os.remove(os.path.join(self.root, name))
+                removed += 1
+            except OSError:
+                pass
+            if self.mode == STORE_MODE_HARDLINK:
+                try:
+                    os.remove(os.path.join(fbx_folder, name))
+                except OSError:
+                    pass
+        self.files_pruned += removed
+        return removed
+
+    def _link_beside(self, store_path, fbx_folder):
+        """Hardlink a stored texture next to the FBX files, copying if links are unsupported."""
+        side_path = os.path.join(fbx_folder, os.path.basename(store_path))
+        if not os.path.exists(side_path):
+            try:
+                os.link(store_path, side_path)
+            except OSError:
+                shutil.copyfile(store_path, side_path)
+        return side_path
+
+    @contextmanager
+    def redirect(self, objects, fbx_folder):
+        """Point the objects' images at their stored copies while an FBX is written.
+
+        filepath_raw is swapped (no image reload) and always restored.
+        """
+        start = time.perf_counter()
+        originals = {}
+        self.last_names = []
+        try:
+            for image in images_for_objects(objects):
+                stored = self._store_file(image)
+                if stored is None:
+                    continue
+                store_path, size = stored
+                self.bytes_referenced += size
+                self.last_names.append(os.path.basename(store_path))
+                if self.mode == STORE_MODE_HARDLINK:
+                    store_path = self._link_beside(store_path, fbx_folder)
+                originals[image] = image.filepath_raw
+                image.filepath_raw = store_path
+            self.seconds += time.perf_counter() - start
+            yield
+        finally:
+            for image, filepath in originals.items():
+                image.filepath_raw = filepath
@@ -1,13 +1,98 @@
+import datetime
+import json
 import os
+import time
+import types
+from contextlib import contextmanager, nullcontext
 
 import bpy
 from bpy.types import Operator
 from ..common.context_guard import preserve_selection_and_active
+from ..common.datablocks import datablock_counts, purge_created_datablocks
+from ..common.hierarchy import HierarchyIndex, root_objects
+from ..common.memory import format_bytes, process_rss_bytes
+from ...core.constants import (
+    EXPORT_ANIMATION_PROP,
+    EXPORT_ANIM_POSITION_TOLERANCE_PROP,
+    EXPORT_ANIM_REDUCE_PROP,
+    EXPORT_ANIM_ROTATION_TOLERANCE_PROP,
+    EXPORT_ANIM_SCALE_TOLERANCE_PROP,
+    EXPORT_ATLAS_PROP,
+    EXPORT_ATLAS_SIZE_PROP,
+    EXPORT_COLLISION_HULLS_PROP,
+    EXPORT_COLLISION_MAX_VERTS_PROP,
+    EXPORT_COLLISION_PROP,
+    EXPORT_INSTANCE_AWARE_PROP,
+    EXPORT_LOD_RATIOS_PROP,
+    EXPORT_LODS_PROP,
+    EXPORT_MERGE_BY_MATERIAL_PROP,
+    EXPORT_MERGE_MAX_VERTS_PROP,
+    EXPORT_PARALLEL_PROP,
+    EXPORT_PROFILE_PROP,
+    EXPORT_PROGRESS_PROP,
+    EXPORT_STATUS_PROP,
+    EXPORT_NATIVE_FBX_PROP,
+    EXPORT_SKIN_MAX_INFLUENCES_PROP,
+    EXPORT_SKIN_OPTIMIZE_PROP,
+    EXPORT_SKIN_PRUNE_THRESHOLD_PROP,
+    EXPORT_SKIP_UNCHANGED_PROP,
+    EXPORT_TEXTURE_STORE_PROP,
+    EXPORT_VALIDATE_FAIL_PROP,
+    EXPORT_VERTEX_CACHE_PROP,
+    EXPORT_VALIDATE_PROP,
+    EXPORT_WORKERS_PROP,
+    EXPORT_ZERO_DUPLICATE_PROP,
+)
+from . import fbx_native
+from .animation import (
+    CHANNEL_POSITION,
+    CHANNEL_ROTATION,
+    CHANNEL_SCALE,
+    animated_objects,
+    bake_reduced_animation,
+    reduce_fbx_keys,
+)
+from .atlas import bake_atlas
+from .collision import build_collision_hulls
+from .instances import (
+    ASSET_KIND_MESH,
+    asset_file_name,
+    group_instances,
+    mesh_triangle_count,
+    placement_entries,
+    unity_space,
+    write_placement_manifest,
+)
+from .lods import DEFAULT_LOD_RATIOS, LOD_SUFFIX, build_lod_chain, parse_lod_ratios
+from .merge import UINT16_VERTEX_LIMIT, merge_by_material
+from .manifest import ExportManifest, compute_export_hash
+from .profiling import ExportProfiler, NullProfiler
+from .skin_weights import DEFAULT_MAX_INFLUENCES, DEFAULT_PRUNE_THRESHOLD, optimize_skin_weights
+from .texture_store import STORE_MODE_OFF, TextureStore
+from .validation import (
+    VALIDATE_FIX,
+    VALIDATE_OFF,
+    fix_mesh,
+    format_issues,
+    has_blocking_issues,
+    validate_mesh,
+    write_validation_report,
+)
+from .vertex_cache import optimize_objects
+from .workers import run_parallel_export
 
 
 ORIGIN_MODE_PRESERVE = "preserve"
 ORIGIN_MODE_ROOTS_TO_ZERO = "roots_to_zero"
 
+# Seconds of export work per modal timer tick before the UI gets to redraw
+MODAL_TIME_SLICE = 0.1
+# Events the modal export lets through so the viewport can still be navigated
+MODAL_PASS_THROUGH_EVENTS = {
+    'MIDDLEMOUSE', 'WHEELUPMOUSE', 'WHEELDOWNMOUSE',
+    'TRACKPADPAN', 'TRACKPADZOOM', 'MOUSEMOVE', 'INBETWEEN_MOUSEMOVE',
+}
+
 
 def _fbx_supported_object_types():
     """Query supported object_types for FBX exporter in this Blender build.
@@ -24,6 +109,38 @@ def _fbx_supported_object_types():
         return {'EMPTY', 'CAMERA', 'LIGHT', 'ARMATURE', 'MESH', 'OTHER'}
 
 
+class _PinnedDateTime(datetime.datetime):
+    """datetime whose now() is the fixed FBX creation time the native writer also uses."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls(1970, 1, 1, 10, 0, 0)
+
+
+@contextmanager
+def _pinned_fbx_timestamp():
+    """Make the stock exporter write a fixed CreationTimeStamp.
+
+    The stamp is the only part of the stock output that depends on when it
+    ran, so pinning it makes serial and parallel (worker) exports of the same
+    scene byte-identical. Leaves the exporter untouched if its layout differs.
+    """
+    try:
+        from io_scene_fbx import export_fbx_bin
+    except ImportError:
+        yield
+        return
+    original = getattr(export_fbx_bin, "datetime", None)
+    if not isinstance(original, types.ModuleType):
+        yield
+        return
+    export_fbx_bin.datetime = types.SimpleNamespace(datetime=_PinnedDateTime)
+    try:
+        yield
+    finally:
+        export_fbx_bin.datetime = original
+
+
 def _fbx_object_types_for_export():
     """Return a valid set to pass to object_types for Unity export.
     
@@ -43,21 +160,26 @@ def _fbx_object_types_for_export():
     return chosen or ({'ARMATURE', 'MESH'} & supported) or {'MESH'}
 
 
-def _root_objects(objs):
-    """Return only objects whose parent is not inside 'objs'.
-    
-    This identifies objects that are "roots" within a given set.
-    Useful for distinguishing which objects need transform conversion
-    (roots) vs which should be left alone (children).
-    
+def _remap_object_pointers(obj, mapping):
+    """Point modifier and constraint object references at their copies.
+
+    obj.copy() keeps references to the originals (e.g. an Armature modifier
+    targeting the source rig); bpy.ops.object.duplicate remaps these itself.
+
     Args:
-        objs: List of objects to filter
-    
-    Returns:
-        Subset of objs containing only those without parents in objs
+        obj: Copied object whose stacks should be remapped
+        mapping: Dict of original object -> copy
     """
-    s = set(objs)
-    return [o for o in objs if (o.parent not in s)]
+    for stack in (obj.modifiers, obj.constraints):
+        for item in stack:
+            for prop in item.bl_rna.properties:
+                if prop.type != 'POINTER' or prop.is_readonly:
+                    continue
+                if prop.fixed_type.identifier != 'Object':
+                    continue
+                target = getattr(item, prop.identifier)
+                if target in mapping:
+                    setattr(item, prop.identifier, mapping[target])
 
 
 class ARTISTANT_OT_export_unity_fbx(Operator):
@@ -74,9 +196,31 @@ class ARTISTANT_OT_export_unity_fbx(Operator):
         name="Embed Textures (FBX)",
         default=False,
     )
+    force_export: bpy.props.BoolProperty(
+        name="Force Re-export",
+        description="Rewrite every file even if the export manifest says it is up to date",
+        default=False,
+    )
+    worker_mode: bpy.props.BoolProperty(
+        name="Worker Mode",
+        description="Internal: set by background export workers to bypass the manifest and parallel dispatch",
+        default=False,
+        options={'HIDDEN', 'SKIP_SAVE'},
+    )
+    result_path: bpy.props.StringProperty(
+        name="Result Path",
+        description="Internal: write a JSON summary of the run (files, timings, failures) to this path",
+        default="",
+        subtype='FILE_PATH',
+        options={'HIDDEN', 'SKIP_SAVE'},
+    )
 
     def _export_selected_duplicates(self, export_path: str):
         """Call Blender's FBX exporter on the currently selected objects."""
+        with _pinned_fbx_timestamp():
+            self._call_stock_exporter(export_path)
+
+    def _call_stock_exporter(self, export_path: str):
         bpy.ops.export_scene.fbx(
             filepath=export_path,
             use_selection=True,
@@ -89,14 +233,77 @@ class ARTISTANT_OT_export_unity_fbx(Operator):
             use_space_transform=True,
             bake_space_transform=True,
             add_leaf_bones=False,
-            bake_anim=False,
+            bake_anim=self._export_animation,
+            bake_anim_use_all_bones=True,
+            bake_anim_use_nla_strips=False,
+            bake_anim_use_all_actions=False,
+            bake_anim_force_startend_keying=True,
+            # With Reduce Keys every frame is written and reduce_fbx_keys() applies the tolerances
+            bake_anim_simplify_factor=0.0 if self._key_tolerances else 1.0,
             use_mesh_modifiers=self.apply_modifiers,
             mesh_smooth_type='FACE',
             use_tspace=True,
-            path_mode='COPY' if self.embed_textures else 'AUTO',
-            embed_textures=self.embed_textures,
+            **self._texture_path_options(),
         )
 
+    def _texture_path_options(self):
+        """Texture path settings for the stock exporter.
+
+        The shared texture store replaces per-file COPY/embedding: images are
+        redirected to the store and referenced relative to the FBX.
+        """
+        if self._texture_store is not None:
+            return {"path_mode": 'RELATIVE', "embed_textures": False}
+        return {
+            "path_mode": 'COPY' if self.embed_textures else 'AUTO',
+            "embed_textures": self.embed_textures,
+        }
+
+    def _reduce_stock_keys(self, export_path: str):
+        """Apply the key tolerances to a file the stock exporter baked every frame of."""
+        name = os.path.basename(export_path)
+        try:
+            reduction = reduce_fbx_keys(export_path, self._key_tolerances)
+        except ValueError as e:
+            self._keys_unreduced.append((name, [f"whole file ({e})"]))
+            return
+        if reduction is None:
+            return
+        self._key_counts.append((name, reduction.sampled_keys, reduction.written_keys))
+        if reduction.unreduced:
+            self._keys_unreduced.append((name, reduction.unreduced))
+
+    def _native_unsupported_reason(self, dups):
+        embedding = self.embed_textures and self._texture_store is None
+        return fbx_native.unsupported_reason(dups, embed_textures=embedding)
+
+    def _write_native_fbx(self, export_path: str, dups, animation=None):
+        """Write dups with the built-in FBX writer (static, or with reduced transform keys).
+
+        Returns:
+            True if the file was written, False if the stock exporter must be used.
+        """
+        if self._export_animation and animation is None:
+            # Only reduced transform keys are written natively; full bakes go through the stock exporter
+            self._native_fallbacks.append(f"{os.path.basename(export_path)} (animation)")
+            return False
+        reason = self._native_unsupported_reason(dups)
+        if reason is not None:
+            self._native_fallbacks.append(f"{os.path.basename(export_path)} ({reason})")
+            return False
+        fbx_native.write_static_fbx(
+            export_path,
+            dups,
+            depsgraph=bpy.context.evaluated_depsgraph_get(),
+            scene=bpy.context.scene,
+            apply_modifiers=self.apply_modifiers,
+            use_tspace=True,
+            axis_forward='-Z',
+            axis_up='Y',
+            animation=animation,
+        )
+        return True
+
     def _duplicate_objects(self, objs, temp_coll_name="IGP_TMP_EXPORT"):
         """Duplicate objects into a dedicated temp collection.
         
@@ -130,12 +337,43 @@ class ARTISTANT_OT_export_unity_fbx(Operator):
 
         return dups, temp_coll
 
-    def _prepare_duplicates_for_export(self, dups, source_roots, origin_mode=ORIGIN_MODE_PRESERVE):
+    def _copy_objects(self, objs, temp_coll_name="IGP_TMP_EXPORT"):
+        """Make lightweight data-API copies of objects into a temp collection.
+
+        Zero-duplicate alternative to _duplicate_objects: copies share their
+        mesh/armature data with the originals and no operator runs, so there
+        is no selection churn and no extra datablocks to clean up.
+
+        Returns:
+            Tuple of (copied_objects, temporary_collection)
+        """
+        temp_coll = bpy.data.collections.new(temp_coll_name)
+        bpy.context.scene.collection.children.link(temp_coll)
+
+        mapping = {}
+        for o in objs:
+            copy = o.copy()
+            temp_coll.objects.link(copy)
+            mapping[o] = copy
+
+        # Rebuild the hierarchy among copies; matrix_parent_inverse is copied as-is
+        for src, copy in mapping.items():
+            if src.parent in mapping:
+                copy.parent = mapping[src.parent]
+            _remap_object_pointers(copy, mapping)
+
+        return list(mapping.values()), temp_coll
+
+    def _prepare_duplicates_for_export(self, dups, source_roots, origin_mode=ORIGIN_MODE_PRESERVE, temp_coll=None):
         """Prepare duplicates for export.
 
         - Detach duplicate objects that still reference non-export parents while preserving world transforms.
         - Apply origin normalization policy to duplicate roots when requested.
         - Preserve root naming for single-object exports.
+        - Add UCX_ convex collision hulls under each root when enabled (appended to dups).
+
+        Returns:
+            List of generated collision hull objects.
         """
         dup_set = set(dups)
 
@@ -146,7 +384,7 @@ class ARTISTANT_OT_export_unity_fbx(Operator):
                 dup.parent = None
                 dup.matrix_world = world
 
-        dup_roots = _root_objects(dups)
+        dup_roots = root_objects(dups)
         if not dup_roots:
             dup_roots = list(dups)
 
@@ -158,6 +396,21 @@ class ARTISTANT_OT_export_unity_fbx(Operator):
         if len(source_roots) == 1 and len(dup_roots) == 1:
             dup_roots[0].name = source_roots[0].name
 
+        if not self._collision_hulls or temp_coll is None:
+            return []
+        hulls = build_collision_hulls(
+            dups,
+            dup_roots,
+            collection=temp_coll,
+            hull_count=self._collision_hulls,
+            max_vertices=self._collision_max_verts,
+            apply_modifiers=self.apply_modifiers,
+            # LOD levels are added later and rename mesh roots to <name>_LOD0
+            lod_suffix=LOD_SUFFIX.format(0) if self._lod_ratios else "",
+        )
+        dups.extend(hulls)
+        return hulls
+
     def _cleanup_temp(self, dups, temp_coll):
         """Delete temporary duplicates and remove their collection.
         
@@ -175,11 +428,22 @@ class ARTISTANT_OT_export_unity_fbx(Operator):
             except Exception:
                 pass
 
+    def _cleanup_copies(self, copies, temp_coll):
+        """Remove zero-duplicate copies and their collection without operators.
+
+        The shared object data belongs to the originals and is left alone.
+        """
+        for copy in copies:
+            bpy.data.objects.remove(copy, do_unlink=True)
+        if temp_coll and temp_coll.name in bpy.data.collections:
+            bpy.data.collections.remove(temp_coll)
+
     def _gather_with_children(self, root):
         """Recursively gather a root object and all its descendants.
         
         Used to collect a complete hierarchy when exporting individual objects
-        with the export_individual flag enabled.
+        with the export_individual flag enabled. Children come from the run's
+        hierarchy index instead of Object.children, which scans every object.
         
         Args:
             root: The root object to gather from
@@ -187,60 +451,334 @@ class ARTISTANT_OT_export_unity_fbx(Operator):
         Returns:
             List containing root and all descendants in depth-first order
         """
-        out, stack, seen = [], [root], set()
-        # Depth-first traversal using a stack
-        while stack:
-            o = stack.pop()
-            # Avoid adding the same object twice
-            if o.name in seen:
-                continue
-            seen.add(o.name)
-            out.append(o)
-            # Add all children to the stack for processing
-            stack.extend(list(o.children))
-        return out
+        return self._hierarchy.descendants(root)
 
-    def _export_duplicate_set(self, *, export_path: str, source_objs, origin_mode=ORIGIN_MODE_PRESERVE):
+    def _export_duplicate_set(self, *, export_path: str, source_objs, origin_mode=ORIGIN_MODE_PRESERVE, zero_duplicate=False):
         """Execute the core export pipeline: duplicate -> prepare -> export.
         
         Args:
             export_path: Full file path for the output FBX
             source_objs: List of objects to duplicate and export
             origin_mode: Origin normalization strategy for duplicate roots
+            zero_duplicate: Use data-API copies sharing object data instead of operator duplicates
         """
+        profiler = self._profiler
+        counts_before = datablock_counts()
         # Step 1: Duplicate the source objects into a temporary collection
-        dups, temp_coll = self._duplicate_objects(source_objs)
+        with profiler.phase("duplicate"):
+            if zero_duplicate:
+                dups, temp_coll = self._copy_objects(source_objs)
+                cleanup = self._cleanup_copies
+            else:
+                dups, temp_coll = self._duplicate_objects(source_objs)
+                cleanup = self._cleanup_temp
+        # The temp collection is the first ID this file creates: anything newer is ours
+        watermark_uid = temp_coll.session_uid
         try:
-            source_roots = _root_objects(source_objs)
-            if not source_roots:
-                source_roots = list(source_objs)
-
-            # Step 2: Prepare duplicates according to mode and restore naming
-            self._prepare_duplicates_for_export(
-                dups,
-                source_roots,
-                origin_mode=origin_mode,
-            )
+            with profiler.phase("prepare"):
+                source_roots = root_objects(source_objs)
+                if not source_roots:
+                    source_roots = list(source_objs)
+
+                # Step 2: Prepare duplicates according to mode and restore naming
+                hulls = self._prepare_duplicates_for_export(
+                    dups,
+                    source_roots,
+                    origin_mode=origin_mode,
+                    temp_coll=temp_coll,
+                )
+                self._hull_count += len(hulls)
+
+                # Step 3: Select duplicates and prepare for export
+                for o in bpy.context.selected_objects:
+                    o.select_set(False)
+                for d in dups:
+                    d.select_set(True)
+                bpy.context.view_layer.objects.active = dups[0]
+
+            if self._validate_mode != VALIDATE_OFF:
+                with profiler.phase("validate"):
+                    self._validate_duplicates(export_path, dups)
 
-            # Step 3: Select duplicates and prepare for export
-            bpy.ops.object.select_all(action='DESELECT')
-            for d in dups:
-                d.select_set(True)
-            bpy.context.view_layer.objects.active = dups[0]
+            # Step 3a: Pack base color textures into atlases with one shared material
+            if self._atlas_size:
+                with profiler.phase("atlas"):
+                    atlas = bake_atlas(
+                        dups,
+                        export_folder=os.path.dirname(export_path),
+                        file_stem=os.path.splitext(os.path.basename(export_path))[0],
+                        max_size=self._atlas_size,
+                    )
+                    self._atlas_results.append(atlas)
+
+            # Step 3b: Batch export merges static meshes into one mesh per material
+            if self._merge_by_material and not self._export_individual:
+                with profiler.phase("merge"):
+                    merged, merged_sources = merge_by_material(
+                        dups,
+                        collection=temp_coll,
+                        apply_modifiers=self.apply_modifiers,
+                        max_vertices=self._merge_max_verts,
+                        exclude=hulls,
+                    )
+                    for obj in merged:
+                        obj.select_set(True)
+                    if merged:
+                        bpy.context.view_layer.objects.active = dups[0]
+                    self._merge_stats.append((merged_sources, len(merged)))
+
+            # Step 3c: Add decimated LOD levels next to every exported mesh
+            if self._lod_ratios:
+                with profiler.phase("lod"):
+                    hull_set = set(hulls)
+                    lods, triangles = build_lod_chain(
+                        [d for d in dups if d not in hull_set],
+                        self._lod_ratios,
+                        collection=temp_coll,
+                        apply_modifiers=self.apply_modifiers,
+                    )
+                    for lod in lods:
+                        lod.select_set(True)
+                    # Extend in place so cleanup removes the LOD objects too
+                    dups.extend(lods)
+                    self._lod_triangles.append(triangles)
+
+            if profiler.enabled:
+                profiler.count_geometry(dups, bpy.context.evaluated_depsgraph_get())
 
-            # Step 4: Call the FBX exporter
-            self._export_selected_duplicates(export_path)
+            # Step 3d: Reorder faces and vertices for GPU vertex cache locality
+            if self._optimize_vertex_cache:
+                with profiler.phase("reorder"):
+                    self._cache_results.extend(optimize_objects(dups, apply_modifiers=self.apply_modifiers))
+
+            # Step 3e: Bake transform keys per frame in FBX space and reduce them within the
+            # tolerances; these exact keys are written by the native writer in step 4.
+            # Files the native writer cannot take are reduced after the stock export instead
+            animation = None
+            if (
+                self._export_animation
+                and self._key_tolerances
+                and animated_objects(dups)
+                and self._native_unsupported_reason(dups) is None
+            ):
+                with profiler.phase("keys"):
+                    animation = bake_reduced_animation(dups, bpy.context.scene, self._key_tolerances)
+
+            # Step 3f: Fit skin weights to the runtime's per-vertex influence budget
+            if self._max_influences:
+                with profiler.phase("skin"):
+                    for dup in dups:
+                        stats = optimize_skin_weights(
+                            dup,
+                            max_influences=self._max_influences,
+                            prune_threshold=self._weight_threshold,
+                        )
+                        if stats is not None:
+                            self._skin_results.append((dup.name, stats))
+
+            # Step 4: Call the FBX exporter (fast static writer when enabled and supported)
+            with profiler.phase("write"):
+                store = self._texture_store
+                with store.redirect(dups, os.path.dirname(export_path)) if store else nullcontext():
+                    if animation is not None and self._write_native_fbx(export_path, dups, animation):
+                        self._key_counts.append(
+                            (os.path.basename(export_path), animation.sampled_keys, animation.written_keys)
+                        )
+                    elif not (self._native_fbx and self._write_native_fbx(export_path, dups)):
+                        self._export_selected_duplicates(export_path)
+                        if self._export_animation and self._key_tolerances:
+                            self._reduce_stock_keys(export_path)
         finally:
-            # Clean up: delete duplicates and temporary collection
-            self._cleanup_temp(dups, temp_coll)
+            # Clean up: delete duplicates and temporary collection, then purge
+            # the data they leave behind (duplicate meshes, materials, ...)
+            with profiler.phase("cleanup"):
+                created = [d.data for d in dups if d.data is not None and d.data.session_uid > watermark_uid]
+                cleanup(dups, temp_coll)
+                purge_created_datablocks(created, watermark_uid, counts_before)
 
-    def execute(self, context):
-        """Main operator entry point. Exports selected objects as FBX.
-        
-        Supports three modes:
-        - Batch: all selected objects exported to one FBX with world transforms preserved
-        - Individual (all selected): each selected object exported alone, normalized to origin
-        - Individual (only orphans): each orphan exported with full hierarchy and root at origin
+    def _validate_duplicates(self, export_path: str, dups):
+        """Validate (and in Fix mode repair) the meshes of one file's export copies.
+
+        Validation reads the evaluated mesh when modifiers are applied, since
+        that is what gets written. Fixes edit the copy's base mesh; mesh data
+        still shared with an original is copied first.
+
+        Raises:
+            RuntimeError: If Fail on Issues is set and problems remain.
+        """
+        file_results = {}
+        remaining = []
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        for dup in dups:
+            if dup.type != 'MESH':
+                continue
+            source = dup.evaluated_get(depsgraph) if self.apply_modifiers else dup
+            before = validate_mesh(source.data)
+            after = before
+            if self._validate_mode == VALIDATE_FIX and has_blocking_issues(before):
+                if dup.data.users > 1:
+                    dup.data = dup.data.copy()
+                fix_mesh(dup.data)
+                depsgraph = bpy.context.evaluated_depsgraph_get()
+                source = dup.evaluated_get(depsgraph) if self.apply_modifiers else dup
+                after = validate_mesh(source.data)
+            file_results[dup.name] = {"before": before, "after": after}
+            if has_blocking_issues(after):
+                remaining.append(f"{dup.name}: {format_issues(after)}")
+
+        self._validation_results[os.path.basename(export_path)] = file_results
+        if remaining and self._validate_fail:
+            raise RuntimeError(f"validation failed ({'; '.join(remaining[:3])})")
+
+    def _build_export_jobs(self, selected_objects, *, anchor, export_folder, export_individual, export_only_orphans):
+        """Turn the selection into the list of files to write.
+
+        Returns:
+            List of (export_path, source_objs, origin_mode) tuples, one per FBX.
+        """
+        jobs = []
+        if export_individual:
+            if export_only_orphans:
+                # Case C: export only selection orphans, each with full hierarchy.
+                selected_roots = root_objects(selected_objects)
+                orphan_roots = [obj for obj in selected_roots if obj.parent is None]
+                # Only childless roots can be shared assets; hierarchies always export as-is
+                candidates = [obj for obj in orphan_roots if not self._hierarchy.has_children(obj)] if self._instance_aware else []
+                per_object = [obj for obj in orphan_roots if obj not in candidates]
+            else:
+                # Case B: export every selected object by itself (no children).
+                candidates = list(selected_objects) if self._instance_aware else []
+                per_object = [obj for obj in selected_objects if obj not in candidates]
+
+            if candidates:
+                instance_jobs, singles = self._build_instance_jobs(
+                    candidates,
+                    export_folder,
+                    reserved_names={obj.name for obj in candidates + per_object},
+                )
+                jobs.extend(instance_jobs)
+                per_object.extend(singles)
+
+            for src_obj in per_object:
+                export_path = os.path.join(export_folder, f"{src_obj.name}.fbx")
+                source_objs = self._gather_with_children(src_obj) if export_only_orphans else [src_obj]
+                jobs.append((export_path, source_objs, ORIGIN_MODE_ROOTS_TO_ZERO))
+        else:
+            # Case A: export all selected objects together as one FBX.
+            export_name = anchor.name if anchor in selected_objects else "Export"
+            export_path = os.path.join(export_folder, f"{export_name}.fbx")
+            jobs.append((export_path, list(selected_objects), ORIGIN_MODE_PRESERVE))
+        return jobs
+
+    def _build_instance_jobs(self, candidates, export_folder, *, reserved_names):
+        """Create one job per unique mesh/collection asset and record instance placements.
+
+        Args:
+            reserved_names: Names of objects that may get their own <name>.fbx;
+                asset files are named so they never overwrite those
+
+        Returns:
+            Tuple of (jobs, singles) where singles still need regular per-object jobs.
+        """
+        groups, singles = group_instances(candidates)
+        space = unity_space(bpy.context.scene)
+        jobs = []
+        for kind, source_name, members in groups:
+            asset_name = asset_file_name(kind, source_name, reserved_names)
+            export_path = os.path.join(export_folder, asset_name)
+            if kind == ASSET_KIND_MESH:
+                representative = members[0]
+                source_objs = [representative]
+                placements = placement_entries(kind, members, representative=representative, space=space)
+                triangles = mesh_triangle_count(representative.data)
+                origin_mode = ORIGIN_MODE_ROOTS_TO_ZERO
+            else:
+                collection = members[0].instance_collection
+                source_objs = list(collection.all_objects)
+                if not source_objs:
+                    singles.extend(members)
+                    continue
+                placements = placement_entries(
+                    kind, members, instance_offset=collection.instance_offset, space=space
+                )
+                triangles = sum(mesh_triangle_count(o.data) for o in source_objs if o.type == 'MESH')
+                # Keep the collection's internal layout; placements carry the offset
+                origin_mode = ORIGIN_MODE_PRESERVE
+
+            jobs.append((export_path, source_objs, origin_mode))
+            self._instance_assets[asset_name] = {
+                "kind": kind,
+                "source": source_name,
+                "instances": len(members),
+                "triangles": triangles,
+            }
+            for entry in placements:
+                entry["asset"] = asset_name
+            self._instance_placements.extend(placements)
+        return jobs, singles
+
+    def _export_settings_signature(self, origin_mode):
+        """Return the exporter settings that affect file content, for change detection."""
+        return {
+            "apply_modifiers": self.apply_modifiers,
+            "embed_textures": self.embed_textures,
+            "origin_mode": origin_mode,
+            "zero_duplicate": self._zero_duplicate,
+            "native_fbx": self._native_fbx,
+            "texture_store": self._texture_store.mode if self._texture_store else STORE_MODE_OFF,
+            "lod_ratios": self._lod_ratios,
+            "collision_hulls": self._collision_hulls,
+            "collision_max_verts": self._collision_max_verts,
+            "atlas_size": self._atlas_size,
+            "merge_by_material": self._merge_by_material,
+            "merge_max_verts": self._merge_max_verts,
+            "vertex_cache": self._optimize_vertex_cache,
+            "max_influences": self._max_influences,
+            "weight_threshold": self._weight_threshold,
+            "animation": self._export_animation,
+            "key_tolerances": self._key_tolerances,
+            # Only fixing changes the written geometry
+            "validate_fix": self._validate_mode == VALIDATE_FIX,
+            "object_types": sorted(_fbx_object_types_for_export()),
+        }
+
+    def _content_hash(self, context, source_objs, origin_mode):
+        """Hash everything that ends up in the file exported from source_objs."""
+        settings = self._export_settings_signature(origin_mode)
+        if self._texture_store is not None:
+            # The FBX references stored textures by digest name, so a new digest is a new file
+            settings["texture_store_files"] = self._texture_store.store_names(source_objs)
+        return compute_export_hash(
+            context.evaluated_depsgraph_get(),
+            source_objs,
+            settings,
+            apply_modifiers=self.apply_modifiers,
+            zero_root_translation=(origin_mode == ORIGIN_MODE_ROOTS_TO_ZERO),
+            include_animation=self._export_animation,
+        )
+
+    def _export_parallel(self, pending, *, export_folder, only_orphans, worker_count):
+        """Fan pending individual jobs out to background Blender workers.
+
+        Returns:
+            List of worker result dicts (see run_parallel_export).
+        """
+        return run_parallel_export(
+            [(export_path, source_objs[0].name) for export_path, source_objs, _, _ in pending],
+            export_folder=export_folder,
+            only_orphans=only_orphans,
+            operator_settings={
+                "apply_modifiers": self.apply_modifiers,
+                "embed_textures": self.embed_textures,
+            },
+            worker_count=worker_count,
+        )
+
+    def _begin(self, context):
+        """Validate the selection and settings, build all jobs and open the run.
+
+        Returns:
+            None when the run is ready, otherwise the operator result to return.
         """
         # Gather selected objects (excluding hidden ones)
         selected_objects = [o for o in context.selected_objects if o.visible_get()]
@@ -255,8 +793,59 @@ class ARTISTANT_OT_export_unity_fbx(Operator):
             return {'CANCELLED'}
 
         # Check if we should export each object individually or as a batch
-        export_individual = context.scene.export_individual
-        export_only_orphans = getattr(context.scene, "export_only_orphans", False)
+        self._export_folder = export_folder
+        self._export_individual = context.scene.export_individual
+        self._export_only_orphans = getattr(context.scene, "export_only_orphans", False)
+        self._skip_unchanged = getattr(context.scene, EXPORT_SKIP_UNCHANGED_PROP, False) and not self.force_export
+        self._zero_duplicate = getattr(context.scene, EXPORT_ZERO_DUPLICATE_PROP, False)
+        self._native_fbx = getattr(context.scene, EXPORT_NATIVE_FBX_PROP, False)
+        self._native_fallbacks = []
+        self._instance_aware = self._export_individual and getattr(context.scene, EXPORT_INSTANCE_AWARE_PROP, False)
+        self._instance_assets = {}
+        self._instance_placements = []
+        self._collision_hulls = 0
+        if getattr(context.scene, EXPORT_COLLISION_PROP, False):
+            self._collision_hulls = getattr(context.scene, EXPORT_COLLISION_HULLS_PROP, 1)
+        self._collision_max_verts = getattr(context.scene, EXPORT_COLLISION_MAX_VERTS_PROP, 32)
+        self._hull_count = 0
+        self._atlas_size = 0
+        if getattr(context.scene, EXPORT_ATLAS_PROP, False):
+            self._atlas_size = int(getattr(context.scene, EXPORT_ATLAS_SIZE_PROP, '2048'))
+        self._atlas_results = []
+        self._merge_by_material = getattr(context.scene, EXPORT_MERGE_BY_MATERIAL_PROP, False)
+        self._merge_max_verts = getattr(context.scene, EXPORT_MERGE_MAX_VERTS_PROP, UINT16_VERTEX_LIMIT)
+        self._merge_stats = []
+        scene = context.scene
+        self._export_animation = getattr(scene, EXPORT_ANIMATION_PROP, False)
+        self._key_tolerances = None
+        if self._export_animation and getattr(scene, EXPORT_ANIM_REDUCE_PROP, True):
+            self._key_tolerances = {
+                CHANNEL_POSITION: getattr(scene, EXPORT_ANIM_POSITION_TOLERANCE_PROP, 0.001),
+                CHANNEL_ROTATION: getattr(scene, EXPORT_ANIM_ROTATION_TOLERANCE_PROP, 0.001),
+                CHANNEL_SCALE: getattr(scene, EXPORT_ANIM_SCALE_TOLERANCE_PROP, 0.001),
+            }
+        self._key_counts = []
+        # (file name, ["<object> <property>", ...]) of curves written with every key
+        self._keys_unreduced = []
+        self._max_influences = 0
+        if getattr(scene, EXPORT_SKIN_OPTIMIZE_PROP, False):
+            self._max_influences = getattr(scene, EXPORT_SKIN_MAX_INFLUENCES_PROP, DEFAULT_MAX_INFLUENCES)
+        self._weight_threshold = getattr(scene, EXPORT_SKIN_PRUNE_THRESHOLD_PROP, DEFAULT_PRUNE_THRESHOLD)
+        self._skin_results = []
+        self._optimize_vertex_cache = getattr(context.scene, EXPORT_VERTEX_CACHE_PROP, False)
+        self._cache_results = []
+        self._lod_ratios = []
+        self._lod_triangles = []
+        if getattr(context.scene, EXPORT_LODS_PROP, False):
+            try:
+                self._lod_ratios = parse_lod_ratios(getattr(context.scene, EXPORT_LOD_RATIOS_PROP, DEFAULT_LOD_RATIOS))
+            except ValueError as e:
+                self.report({'ERROR'}, f"Invalid LOD ratios: {e}")
+                return {'CANCELLED'}
+        self._validate_mode = getattr(context.scene, EXPORT_VALIDATE_PROP, VALIDATE_OFF)
+        self._validate_fail = getattr(context.scene, EXPORT_VALIDATE_FAIL_PROP, False)
+        self._validation_results = {}
+        self._profiler = ExportProfiler() if getattr(context.scene, EXPORT_PROFILE_PROP, False) else NullProfiler()
 
         selected_set = set(selected_objects)
         external_parented = [o for o in selected_objects if o.parent and o.parent not in selected_set]
@@ -270,59 +859,463 @@ class ARTISTANT_OT_export_unity_fbx(Operator):
         active = context.view_layer.objects.active
         anchor = active if active and active in selected_objects else selected_objects[0]
 
+        # One pass over all objects replaces per-object Object.children scans
+        self._hierarchy = HierarchyIndex(bpy.data.objects)
+        self._jobs = self._build_export_jobs(
+            selected_objects,
+            anchor=anchor,
+            export_folder=export_folder,
+            export_individual=self._export_individual,
+            export_only_orphans=self._export_only_orphans,
+        )
+        if not self._jobs:
+            self.report({'WARNING'}, "No orphan objects selected")
+            return {'CANCELLED'}
+
         try:
             # Ensure export folder exists
             os.makedirs(export_folder, exist_ok=True)
-            exported_paths = []
+        except OSError as e:
+            self.report({'ERROR'}, f"FBX export failed: {e}")
+            return {'CANCELLED'}
 
-            # Export while preserving the user's original selection and active object
-            with preserve_selection_and_active(context):
-                if export_individual:
-                    if export_only_orphans:
-                        # Case C: export only selection orphans, each with full hierarchy.
-                        selected_roots = _root_objects(selected_objects)
-                        orphan_roots = [obj for obj in selected_roots if obj.parent is None]
-                        if not orphan_roots:
-                            self.report({'WARNING'}, "No orphan objects selected")
-                            return {'CANCELLED'}
-
-                        for src_obj in orphan_roots:
-                            export_name = src_obj.name
-                            export_path = os.path.join(export_folder, f"{export_name}.fbx")
-                            source_objs = self._gather_with_children(src_obj)
-                            self._export_duplicate_set(
-                                export_path=export_path,
-                                source_objs=source_objs,
-                                origin_mode=ORIGIN_MODE_ROOTS_TO_ZERO,
-                            )
-                            exported_paths.append(export_path)
-                    else:
-                        # Case B: export every selected object by itself (no children).
-                        for src_obj in selected_objects:
-                            export_name = src_obj.name
-                            export_path = os.path.join(export_folder, f"{export_name}.fbx")
-                            self._export_duplicate_set(
-                                export_path=export_path,
-                                source_objs=[src_obj],
-                                origin_mode=ORIGIN_MODE_ROOTS_TO_ZERO,
-                            )
-                            exported_paths.append(export_path)
-                else:
-                    # Case A: export all selected objects together as one FBX.
-                    export_name = anchor.name if anchor in selected_objects else "Export"
-                    export_path = os.path.join(export_folder, f"{export_name}.fbx")
-                    self._export_duplicate_set(
-                        export_path=export_path,
-                        source_objs=selected_objects,
-                        origin_mode=ORIGIN_MODE_PRESERVE,
-                    )
-                    exported_paths.append(export_path)
+        # Workers leave the manifest to the parent process that dispatched them
+        self._manifest = None if self.worker_mode else ExportManifest(export_folder).load()
+        store_mode = getattr(context.scene, EXPORT_TEXTURE_STORE_PROP, STORE_MODE_OFF)
+        self._texture_store = None
+        if store_mode != STORE_MODE_OFF:
+            self._texture_store = TextureStore(export_folder, store_mode).load()
+        # Store files referenced before this run; the ones no file references afterwards are pruned
+        self._store_names_before = set()
+        if self._texture_store is not None and self._manifest is not None:
+            self._store_names_before = self._manifest.referenced_textures()
+        self._next_job = 0
+        self._exported_paths = []
+        self._skipped_paths = []
+        self._failures = []
+        self._timings = []
+        self._cancelled = False
+        self._start_time = time.perf_counter()
+        self._counts_start = datablock_counts()
+        self._rss_start = process_rss_bytes()
+        return None
 
+    def _use_parallel(self, context):
+        return (
+            self._export_individual
+            and not self.worker_mode
+            # Workers re-derive jobs from single objects and cannot see instance groups
+            and not self._instance_aware
+            # The texture store index has a single writer
+            and self._texture_store is None
+            # The validation report is collected in this process
+            and self._validate_mode == VALIDATE_OFF
+            # Profile records are collected in this process and written to one CSV
+            and not self._profiler.enabled
+            and getattr(context.scene, EXPORT_PARALLEL_PROP, False)
+            and len(self._jobs) > 1
+        )
+
+    def _process_job(self, context, job):
+        """Hash, export and record one file; failures are recorded, never raised."""
+        export_path, source_objs, origin_mode = job
+        name = os.path.basename(export_path)
+        start = time.perf_counter()
+        self._profiler.begin_file(export_path)
+        try:
+            # Hashing only pays off when it can skip files; forced or non-skipping runs
+            # leave the manifest entry alone (its stale stamp never matches the new file)
+            content_hash = None
+            if self._manifest is not None and self._skip_unchanged:
+                with self._profiler.phase("hash"):
+                    content_hash = self._content_hash(context, source_objs, origin_mode)
+                if self._manifest.is_up_to_date(export_path, content_hash):
+                    self._skipped_paths.append(export_path)
+                    return
+            self._export_duplicate_set(
+                export_path=export_path,
+                source_objs=source_objs,
+                origin_mode=origin_mode,
+                # Objects outside the view layer (e.g. instanced collections) cannot be
+                # duplicated with operators, so they always use data-API copies
+                zero_duplicate=(
+                    self._zero_duplicate
+                    or any(o.name not in context.view_layer.objects for o in source_objs)
+                ),
+            )
+            self._exported_paths.append(export_path)
+            if self._texture_store is not None and self._manifest is not None:
+                self._manifest.record_textures(export_path, self._texture_store.last_names)
+            if content_hash is not None:
+                self._manifest.record(export_path, content_hash)
         except Exception as e:
-            self.report({'ERROR'}, f"FBX export failed: {e}")
+            self._failures.append((name, str(e)))
+        finally:
+            self._timings.append((name, time.perf_counter() - start))
+
+    def _run_parallel(self, context):
+        """Hash every job, then hand the ones that need writing to background workers."""
+        pending = []
+        hashes = {}
+        for job in self._jobs:
+            export_path, source_objs, origin_mode = job
+            content_hash = None
+            if self._skip_unchanged:
+                content_hash = self._content_hash(context, source_objs, origin_mode)
+                if self._manifest.is_up_to_date(export_path, content_hash):
+                    self._skipped_paths.append(export_path)
+                    continue
+            hashes[export_path] = content_hash
+            pending.append((export_path, source_objs, origin_mode, content_hash))
+        self._next_job = len(self._jobs)
+        if not pending:
+            return
+
+        results = self._export_parallel(
+            pending,
+            export_folder=self._export_folder,
+            only_orphans=self._export_only_orphans,
+            worker_count=getattr(context.scene, EXPORT_WORKERS_PROP, 1),
+        )
+        for result in results:
+            name = os.path.basename(result["path"])
+            self._timings.append((name, result["seconds"]))
+            if not result["ok"]:
+                self._failures.append((name, result["error"]))
+            elif not os.path.isfile(result["path"]):
+                self._failures.append((name, "worker reported success but wrote no file"))
+            else:
+                self._exported_paths.append(result["path"])
+                if hashes[result["path"]] is not None:
+                    self._manifest.record(result["path"], hashes[result["path"]])
+
+    def _finish(self, context):
+        """Save the manifest and report results, timings, failures and memory."""
+        if self._texture_store is not None and self._manifest is not None:
+            unreferenced = self._store_names_before - self._manifest.referenced_textures()
+            self._texture_store.prune(unreferenced, self._export_folder)
+        if self._manifest is not None:
+            try:
+                self._manifest.save()
+            except OSError as e:
+                self.report({'WARNING'}, f"Could not save export manifest: {e}")
+
+        for name, error in self._failures:
+            self.report({'WARNING'}, f"{name} failed: {error}")
+
+        counts_end = datablock_counts()
+        counts_start = self._counts_start
+        grown = [f"{name} +{counts_end[name] - counts_start[name]}" for name in counts_end if counts_end[name] > counts_start[name]]
+        if grown:
+            self.report({'WARNING'}, f"Export left extra datablocks behind: {', '.join(grown)}")
+        self.report(
+            {'INFO'},
+            f"Datablocks {sum(counts_start.values())} -> {sum(counts_end.values())}, "
+            f"RSS {format_bytes(self._rss_start)} -> {format_bytes(process_rss_bytes())}",
+        )
+
+        if self._native_fallbacks:
+            details = ", ".join(self._native_fallbacks[:3])
+            self.report({'INFO'}, f"{len(self._native_fallbacks)} file(s) used the stock FBX exporter: {details}")
+
+        if self._instance_placements:
+            self._report_instances()
+
+        if self._texture_store is not None:
+            self._report_texture_store()
+
+        if self._validation_results:
+            self._report_validation()
+
+        if self._lod_triangles:
+            self._report_lods()
+
+        if self._atlas_results:
+            self._report_atlases()
+
+        if self._merge_stats:
+            sources = sum(count for count, _ in self._merge_stats)
+            meshes = sum(count for _, count in self._merge_stats)
+            self.report({'INFO'}, f"Merged {sources} static mesh object(s) into {meshes} mesh(es) by material")
+
+        if self._cache_results:
+            self._report_vertex_cache()
+
+        if self._key_counts or self._keys_unreduced:
+            self._report_key_counts()
+
+        if self._skin_results:
+            self._report_skin_weights()
+
+        if self._hull_count:
+            self.report({'INFO'}, f"Collision: {self._hull_count} UCX_ hull(s) generated")
+
+        if self._profiler.enabled and self._profiler.records:
+            try:
+                path = self._profiler.write_csv(self._export_folder)
+                self.report({'INFO'}, f"Profile ({os.path.basename(path)}): {self._profiler.summary()}")
+            except OSError as e:
+                self.report({'WARNING'}, f"Could not write export profile: {e}")
+
+        if len(self._timings) > 1:
+            slowest = sorted(self._timings, key=lambda item: item[1], reverse=True)[:3]
+            self.report({'INFO'}, "Slowest: " + ", ".join(f"{name} {seconds:.2f}s" for name, seconds in slowest))
+
+        if self.result_path:
+            self._write_result_file()
+
+        if self._failures and not self._exported_paths and not self._skipped_paths:
+            self.report({'ERROR'}, f"FBX export failed: {self._failures[0][1]}")
             return {'CANCELLED'}
 
-        # Report success
-        plural = "FBXs" if len(exported_paths) > 1 else "FBX"
-        self.report({'INFO'}, f"Exported {len(exported_paths)} {plural} to: {export_folder}")
+        # Report success with wall time so pipeline modes can be compared directly
+        elapsed = time.perf_counter() - self._start_time
+        pipeline = "zero-duplicate" if self._zero_duplicate else "duplicate"
+        plural = "FBXs" if len(self._exported_paths) != 1 else "FBX"
+        cancelled = f", cancelled after {self._next_job}/{len(self._jobs)}" if self._cancelled else ""
+        self.report(
+            {'INFO'},
+            f"Exported {len(self._exported_paths)} {plural} to: {self._export_folder} "
+            f"({len(self._skipped_paths)} unchanged skipped, {len(self._failures)} failed, "
+            f"{elapsed:.2f}s, {pipeline} pipeline{cancelled})",
+        )
         return {'FINISHED'}
+
+    def _write_result_file(self):
+        """Write a machine-readable summary of the run for command-line callers."""
+        timings = dict(self._timings)
+        result = {
+            "export_folder": self._export_folder,
+            "exported": [os.path.basename(p) for p in self._exported_paths],
+            "skipped": [os.path.basename(p) for p in self._skipped_paths],
+            "failures": [{"file": name, "error": error} for name, error in self._failures],
+            "timings": timings,
+            "seconds": time.perf_counter() - self._start_time,
+            "cancelled": self._cancelled,
+        }
+        try:
+            with open(bpy.path.abspath(self.result_path), "w", encoding="utf-8") as f:
+                json.dump(result, f, indent=1)
+        except OSError as e:
+            self.report({'WARNING'}, f"Could not write result file: {e}")
+
+    def _report_texture_store(self):
+        """Save the texture index and report bytes written, reused and saved."""
+        store = self._texture_store
+        try:
+            store.save()
+        except OSError as e:
+            self.report({'WARNING'}, f"Could not save texture store index: {e}")
+        if store.unsupported:
+            names = ", ".join(sorted(store.unsupported)[:3])
+            self.report({'WARNING'}, f"{len(store.unsupported)} image(s) have no file to store: {names}")
+        self.report(
+            {'INFO'},
+            f"Textures: {store.files_written} written ({format_bytes(store.bytes_written)}), "
+            f"{store.files_unchanged} unchanged, {store.files_pruned} pruned, "
+            f"{format_bytes(store.bytes_saved)} saved vs per-file copies, "
+            f"{store.seconds:.2f}s",
+        )
+
+    def _report_atlases(self):
+        """Report atlases written and materials that kept their own textures."""
+        atlases = sum(len(r.atlas_paths) for r in self._atlas_results)
+        materials = sum(r.materials_atlased for r in self._atlas_results)
+        skipped = sorted({name for r in self._atlas_results for name in r.skipped})
+        self.report({'INFO'}, f"Atlas: {materials} material(s) packed into {atlases} atlas image(s)")
+        if skipped:
+            self.report({'WARNING'}, f"{len(skipped)} material(s) not atlased: {', '.join(skipped[:3])}")
+
+    def _report_skin_weights(self):
+        """Report influence caps, pruned weights and removed groups per skinned mesh."""
+        for name, stats in self._skin_results[:10]:
+            self.report(
+                {'INFO'},
+                f"Skin {name}: max influences {stats['max_before']} -> {stats['max_after']}, "
+                f"{stats['capped_vertices']}/{stats['vertices']} vertices capped, "
+                f"{stats['pruned_weights']} weights pruned, {stats['removed_groups']} empty groups removed",
+            )
+        if len(self._skin_results) > 10:
+            self.report({'INFO'}, f"... and {len(self._skin_results) - 10} more skinned mesh(es)")
+
+    def _report_key_counts(self):
+        """Report per-frame keys against keys written to the file, per file and in total.
+
+        Files from both writers are counted; curves without a tolerance
+        (shape keys, camera/light properties) are listed as not reduced.
+        """
+        for name, before, after in self._key_counts[:10]:
+            self.report({'INFO'}, f"Keys {name}: {before} -> {after}")
+        if len(self._key_counts) > 10:
+            self.report({'INFO'}, f"... and {len(self._key_counts) - 10} more file(s)")
+        before = sum(b for _, b, _ in self._key_counts)
+        after = sum(a for _, _, a in self._key_counts)
+        share = 100.0 * (before - after) / before if before else 0.0
+        self.report({'INFO'}, f"Keyframe reduction: {before} -> {after} keys written ({share:.0f}% removed)")
+        for name, curves in self._keys_unreduced[:10]:
+            details = ", ".join(curves[:5]) + (f", ... ({len(curves)} total)" if len(curves) > 5 else "")
+            self.report({'INFO'}, f"Not reduced in {name} (every frame kept): {details}")
+
+    def _report_vertex_cache(self):
+        """Report ACMR before/after per optimized mesh (largest gains first) and overall."""
+        results = sorted(self._cache_results, key=lambda r: r[1] - r[2], reverse=True)
+        for name, before, after in results[:10]:
+            self.report({'INFO'}, f"Vertex cache {name}: ACMR {before:.3f} -> {after:.3f}")
+        if len(results) > 10:
+            self.report({'INFO'}, f"... and {len(results) - 10} more mesh(es)")
+        count = len(results)
+        self.report(
+            {'INFO'},
+            f"Vertex cache: {count} mesh(es), mean ACMR "
+            f"{sum(r[1] for r in results) / count:.3f} -> {sum(r[2] for r in results) / count:.3f}",
+        )
+
+    def _report_lods(self):
+        """Report triangle totals per LOD level across the exported files."""
+        totals = [sum(level) for level in zip(*self._lod_triangles)]
+        base = totals[0] or 1
+        levels = ", ".join(
+            f"{LOD_SUFFIX.format(i)[1:]} {count} ({100.0 * count / base:.0f}%)"
+            for i, count in enumerate(totals)
+        )
+        self.report({'INFO'}, f"LODs in {len(self._lod_triangles)} file(s), triangles: {levels}")
+
+    def _report_validation(self):
+        """Write the validation report and summarize problems found and fixed."""
+        try:
+            write_validation_report(self._export_folder, self._validation_results)
+        except OSError as e:
+            self.report({'WARNING'}, f"Could not write validation report: {e}")
+        checked = fixed = remaining = 0
+        for file_results in self._validation_results.values():
+            for result in file_results.values():
+                checked += 1
+                if has_blocking_issues(result["before"]) and not has_blocking_issues(result["after"]):
+                    fixed += 1
+                elif has_blocking_issues(result["after"]):
+                    remaining += 1
+        level = 'WARNING' if remaining else 'INFO'
+        self.report(
+            {level},
+            f"Validation: {checked} mesh(es) in {len(self._validation_results)} file(s), "
+            f"{fixed} fixed, {remaining} with remaining issues",
+        )
+
+    def _report_instances(self):
+        """Write the placement manifest and report how much geometry was deduplicated."""
+        try:
+            write_placement_manifest(self._export_folder, self._instance_assets, self._instance_placements)
+        except OSError as e:
+            self.report({'WARNING'}, f"Could not write instance placement manifest: {e}")
+            return
+        assets = self._instance_assets.values()
+        instance_count = sum(a["instances"] for a in assets)
+        written_tris = sum(a["triangles"] for a in assets)
+        saved_tris = sum(a["triangles"] * (a["instances"] - 1) for a in assets)
+        total_tris = written_tris + saved_tris
+        share = (100.0 * saved_tris / total_tris) if total_tris else 0.0
+        self.report(
+            {'INFO'},
+            f"Instances: {instance_count} objects share {len(self._instance_assets)} asset file(s); "
+            f"{saved_tris} triangles deduplicated ({share:.0f}%)",
+        )
+
+    def execute(self, context):
+        """Main operator entry point. Exports selected objects as FBX.
+        
+        Supports three modes:
+        - Batch: all selected objects exported to one FBX with world transforms preserved
+        - Individual (all selected): each selected object exported alone, normalized to origin
+        - Individual (only orphans): each orphan exported with full hierarchy and root at origin
+
+        Runs to completion without yielding to the UI; invoke() uses the modal
+        queue instead when started from the interface.
+        """
+        result = self._begin(context)
+        if result is not None:
+            return result
+
+        # Export while preserving the user's original selection and active object
+        with preserve_selection_and_active(context):
+            if self._use_parallel(context):
+                try:
+                    self._run_parallel(context)
+                except Exception as e:
+                    self._failures.append(("parallel export", str(e)))
+            else:
+                for job in self._jobs:
+                    self._process_job(context, job)
+                    self._next_job += 1
+
+        return self._finish(context)
+
+    def invoke(self, context, event):
+        """Start the export as a timer-driven modal job with progress and ESC cancel."""
+        if self.worker_mode or context.window is None:
+            return self.execute(context)
+
+        result = self._begin(context)
+        if result is not None:
+            return result
+        if self._use_parallel(context):
+            # Workers run out of process; the blocking path only waits on them
+            with preserve_selection_and_active(context):
+                try:
+                    self._run_parallel(context)
+                except Exception as e:
+                    self._failures.append(("parallel export", str(e)))
+            return self._finish(context)
+
+        # Held open across modal steps and closed in _end_modal
+        self._selection_guard = preserve_selection_and_active(context)
+        self._selection_guard.__enter__()
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.01, window=context.window)
+        wm.modal_handler_add(self)
+        self._set_progress(context, 0.0, f"Exporting 0/{len(self._jobs)}")
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self._cancelled = True
+            return self._end_modal(context)
+
+        if event.type == 'TIMER':
+            # Export files until the time slice is used up, then let the UI redraw
+            slice_end = time.perf_counter() + MODAL_TIME_SLICE
+            while self._next_job < len(self._jobs) and time.perf_counter() < slice_end:
+                self._process_job(context, self._jobs[self._next_job])
+                self._next_job += 1
+
+            if self._next_job >= len(self._jobs):
+                return self._end_modal(context)
+            name = os.path.basename(self._jobs[self._next_job][0])
+            self._set_progress(
+                context,
+                self._next_job / len(self._jobs),
+                f"Exporting {self._next_job}/{len(self._jobs)}: {name} (ESC to cancel)",
+            )
+            return {'RUNNING_MODAL'}
+
+        # Allow viewport navigation; block edits that could invalidate queued objects
+        if event.type in MODAL_PASS_THROUGH_EVENTS:
+            return {'PASS_THROUGH'}
+        return {'RUNNING_MODAL'}
+
+    def cancel(self, context):
+        self._cancelled = True
+        self._end_modal(context)
+
+    def _end_modal(self, context):
+        context.window_manager.event_timer_remove(self._timer)
+        self._selection_guard.__exit__(None, None, None)
+        self._set_progress(context, 0.0, "")
+        return self._finish(context)
+
+    def _set_progress(self, context, factor, status):
+        wm = context.window_manager
+        setattr(wm, EXPORT_PROGRESS_PROP, factor)
+        setattr(wm, EXPORT_STATUS_PROP, status)
+        for area in context.screen.areas if context.screen else ():
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
@@ -0,0 +1,107 @@
+import json
+import os
+
+import bmesh
+import numpy as np
+
+from ..common.mesh_arrays import corner_vertex_indices, polygon_loop_starts, vertex_positions
+
+
+VALIDATION_REPORT_FILENAME = "artistant_validation.json"
+
+VALIDATE_OFF = 'OFF'
+VALIDATE_REPORT = 'REPORT'
+VALIDATE_FIX = 'FIX'
+
+# Faces with a smaller area (in object units squared) count as degenerate
+DEGENERATE_AREA = 1e-12
+# Merge-by-distance threshold used by the fix pass
+MERGE_DISTANCE = 1e-5
+
+# Issue counters that make a mesh fail validation; boundary edges are reported only
+BLOCKING_ISSUES = ("nan_vertices", "degenerate_faces", "loose_vertices", "non_manifold_edges", "missing_uvs")
+
+
+def validate_mesh(mesh):
+    """Count geometry problems of a mesh using bulk array reads.
+
+    Polygon areas use Newell's method on every corner at once, edge face
+    counts come from a bincount over corner edge indices, so cost is linear
+    in the number of corners.
+
+    Returns:
+        Dict of issue name -> count (see BLOCKING_ISSUES, plus "boundary_edges").
+    """
+    positions = vertex_positions(mesh).astype(np.float64)
+    corner_verts = corner_vertex_indices(mesh)
+    starts, totals = polygon_loop_starts(mesh)
+    edge_count = len(mesh.edges)
+
+    issues = dict.fromkeys(BLOCKING_ISSUES, 0)
+    issues["boundary_edges"] = 0
+    issues["nan_vertices"] = int((~np.isfinite(positions)).any(axis=1).sum())
+
+    if len(starts):
+        # Newell: polygon normal = 0.5 * sum(cross(v_i, v_next)); its length is the area
+        next_corner = np.arange(1, len(corner_verts) + 1, dtype=np.int64)
+        next_corner[starts + totals - 1] = starts
+        with np.errstate(invalid='ignore'):
+            crosses = np.cross(positions[corner_verts], positions[corner_verts[next_corner]])
+            normals = np.add.reduceat(crosses, starts, axis=0)
+            areas = 0.5 * np.linalg.norm(normals, axis=1)
+        issues["degenerate_faces"] = int((~(areas > DEGENERATE_AREA)).sum())
+        if not len(mesh.uv_layers):
+            issues["missing_uvs"] = 1
+
+    if edge_count:
+        edge_verts = np.empty(edge_count * 2, dtype=np.int32)
+        mesh.edges.foreach_get("vertices", edge_verts)
+        vertex_edges = np.bincount(edge_verts, minlength=len(positions))
+        issues["loose_vertices"] = int((vertex_edges == 0).sum())
+
+        corner_edges = np.empty(len(corner_verts), dtype=np.int32)
+        mesh.loops.foreach_get("edge_index", corner_edges)
+        edge_faces = np.bincount(corner_edges, minlength=edge_count)
+        issues["boundary_edges"] = int((edge_faces == 1).sum())
+        issues["non_manifold_edges"] = int((edge_faces > 2).sum())
+    else:
+        issues["loose_vertices"] = len(positions)
+
+    return issues
+
+
+def has_blocking_issues(issues):
+    return any(issues.get(name) for name in BLOCKING_ISSUES)
+
+
+def fix_mesh(mesh):
+    """Merge by distance, dissolve degenerate geometry and delete loose vertices in place."""
+    bm = bmesh.new()
+    try:
+        bm.from_mesh(mesh)
+        bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=MERGE_DISTANCE)
+        bmesh.ops.dissolve_degenerate(bm, dist=MERGE_DISTANCE, edges=bm.edges)
+        loose = [v for v in bm.verts if not v.link_edges]
+        if loose:
+            bmesh.ops.delete(bm, geom=loose, context='VERTS')
+        bm.to_mesh(mesh)
+    finally:
+        bm.free()
+    mesh.update()
+
+
+def format_issues(issues):
+    parts = [f"{count} {name.replace('_', ' ')}" for name, count in issues.items() if count and name in BLOCKING_ISSUES]
+    return ", ".join(parts) or "ok"
+
+
+def write_validation_report(export_folder, results):
+    """Write per-file, per-object validation results as JSON.
+
+    Args:
+        results: Dict of file name -> {object name -> {"before": issues, "after": issues}}
+    """
+    path = os.path.join(export_folder, VALIDATION_REPORT_FILENAME)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=1, sort_keys=True)
+    return path
@@ -0,0 +1,255 @@
+import bpy
+import numpy as np
+
+from ..common.mesh_arrays import (
+    attribute_array,
+    corner_vertex_indices,
+    polygon_loop_starts,
+    set_attribute_array,
+    vertex_positions,
+)
+
+
+# Post-transform cache modelled for ACMR (FIFO, typical of current GPUs)
+CACHE_SIZE = 32
+# ACMR is simulated on at most this many triangles per mesh to bound its cost
+ACMR_SAMPLE_TRIANGLES = 250_000
+# Bits per axis of the Morton code used to order faces
+_MORTON_BITS = 10
+# Built-in arrays _permute_mesh rewrites itself (they hold indices, not just values)
+_TOPOLOGY_ATTRIBUTES = {"position", ".corner_vert", ".corner_edge", ".edge_verts"}
+
+
+def triangle_indices(corner_verts, starts, totals):
+    """Fan-triangulate polygons into an (T, 3) array of vertex indices, in face order."""
+    tri_counts = np.maximum(totals - 2, 0).astype(np.int64)
+    first = np.repeat(starts.astype(np.int64), tri_counts)
+    # Position of each triangle within its polygon's fan: 1 .. total-2
+    offsets = np.cumsum(tri_counts) - tri_counts
+    step = np.arange(int(tri_counts.sum()), dtype=np.int64) - np.repeat(offsets, tri_counts) + 1
+    return np.column_stack((
+        corner_verts[first],
+        corner_verts[first + step],
+        corner_verts[first + step + 1],
+    ))
+
+
+def acmr(triangles, cache_size=CACHE_SIZE):
+    """Average cache miss ratio (vertex transforms per triangle) with a FIFO cache.
+
+    The cache is inherently sequential, so this runs over plain Python ints on
+    at most ACMR_SAMPLE_TRIANGLES triangles.
+    """
+    sample = triangles[:ACMR_SAMPLE_TRIANGLES]
+    if not len(sample):
+        return 0.0
+    inserted = {}
+    misses = 0
+    for vertex in sample.ravel().tolist():
+        # A vertex is cached if it was loaded within the last cache_size misses
+        if misses - inserted.get(vertex, -cache_size - 1) > cache_size:
+            inserted[vertex] = misses
+            misses += 1
+    return misses / len(sample)
+
+
+def _spread_bits(values):
+    """Insert two zero bits between each of the low _MORTON_BITS bits."""
+    v = values.astype(np.uint64)
+    v = (v | (v << np.uint64(16))) & np.uint64(0x030000FF)
+    v = (v | (v << np.uint64(8))) & np.uint64(0x0300F00F)
+    v = (v | (v << np.uint64(4))) & np.uint64(0x030C30C3)
+    v = (v | (v << np.uint64(2))) & np.uint64(0x09249249)
+    return v
+
+
+def face_order(positions, corner_verts, starts, totals):
+    """Order faces along a Morton curve through their centroids.
+
+    Neighbouring faces share vertices, so walking them in space-filling-curve
+    order keeps recently transformed vertices in the cache. Fully vectorized.
+    """
+    sums = np.add.reduceat(positions[corner_verts], starts, axis=0)
+    centroids = sums / totals[:, None]
+    low = centroids.min(axis=0)
+    extent = np.maximum(centroids.max(axis=0) - low, 1e-12)
+    scale = (1 << _MORTON_BITS) - 1
+    cells = ((centroids - low) / extent * scale).astype(np.int64)
+    codes = (
+        _spread_bits(cells[:, 0])
+        | (_spread_bits(cells[:, 1]) << np.uint64(1))
+        | (_spread_bits(cells[:, 2]) << np.uint64(2))
+    )
+    return np.argsort(codes, kind="stable")
+
+
+def vertex_order(corner_verts, vertex_count):
+    """Order vertices by first use in corner order; unused vertices go last."""
+    first_use = np.full(vertex_count, len(corner_verts), dtype=np.int64)
+    np.minimum.at(first_use, corner_verts, np.arange(len(corner_verts), dtype=np.int64))
+    return np.argsort(first_use, kind="stable")
+
+
+def _permute_mesh(mesh, faces, corners, verts=None):
+    """Reorder faces (with their corners) and optionally vertices in place, in bulk.
+
+    Every face, corner and point attribute (UVs, materials, smoothing,
+    colors, ...) is gathered with the new order and written back with
+    foreach_set; edges keep their order and only get remapped vertex indices.
+
+    Args:
+        faces: New-to-old face indices
+        corners: New-to-old corner indices (the corners of faces, in order)
+        verts: New-to-old vertex indices, or None to keep vertex order
+    """
+    orders = {'FACE': faces, 'CORNER': corners}
+    if verts is not None:
+        orders['POINT'] = verts
+    for attribute in mesh.attributes:
+        order = orders.get(attribute.domain)
+        if order is None or attribute.name in _TOPOLOGY_ATTRIBUTES:
+            continue
+        values = attribute_array(attribute)
+        if values is not None:
+            set_attribute_array(attribute, values[order])
+
+    custom_normals = None
+    if mesh.has_custom_normals:
+        custom_normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+        mesh.corner_normals.foreach_get("vector", custom_normals)
+        custom_normals = custom_normals.reshape(-1, 3)[corners]
+
+    _, totals = polygon_loop_starts(mesh)
+    totals = totals[faces]
+    corner_verts = corner_vertex_indices(mesh)[corners]
+    corner_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", corner_edges)
+    corner_edges = corner_edges[corners]
+
+    if verts is not None:
+        rank = np.empty(len(verts), dtype=np.int32)
+        rank[verts] = np.arange(len(verts), dtype=np.int32)
+        corner_verts = rank[corner_verts]
+        mesh.vertices.foreach_set("co", vertex_positions(mesh)[verts].ravel())
+        edge_verts = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+        mesh.edges.foreach_get("vertices", edge_verts)
+        mesh.edges.foreach_set("vertices", rank[edge_verts])
+        if mesh.shape_keys is not None:
+            co = np.empty(len(verts) * 3, dtype=np.float32)
+            for key_block in mesh.shape_keys.key_blocks:
+                key_block.data.foreach_get("co", co)
+                key_block.data.foreach_set("co", co.reshape(-1, 3)[verts].ravel())
+
+    mesh.polygons.foreach_set("loop_start", (np.cumsum(totals) - totals).astype(np.int32))
+    mesh.loops.foreach_set("vertex_index", corner_verts)
+    mesh.loops.foreach_set("edge_index", corner_edges)
+    mesh.update()
+    if custom_normals is not None:
+        mesh.normals_split_custom_set(custom_normals.tolist())
+
+
+def optimize_mesh(mesh, *, reorder_vertices=True):
+    """Reorder faces and vertices of a mesh in place for vertex cache locality.
+
+    The new order is simulated first; meshes it would not improve (already
+    well ordered) keep their original order and are not touched. Orders are
+    NumPy argsorts, applied to every mesh array with foreach_set.
+
+    Args:
+        reorder_vertices: False keeps vertex order (e.g. for meshes with vertex
+            groups, whose per-vertex weights cannot be permuted in bulk); ACMR
+            only depends on the face order
+
+    Returns:
+        Tuple of (acmr_before, acmr_after); equal when the order was kept.
+    """
+    positions = vertex_positions(mesh).astype(np.float64)
+    corner_verts = corner_vertex_indices(mesh)
+    starts, totals = polygon_loop_starts(mesh)
+    before = acmr(triangle_indices(corner_verts, starts, totals))
+    if not len(starts):
+        return before, before
+
+    faces = face_order(positions, corner_verts, starts, totals)
+    # Corner order after the face sort, to derive the vertex fetch order
+    corner_sorted = _gather_corners(starts[faces], totals[faces])
+    verts = vertex_order(corner_verts[corner_sorted], len(positions)) if reorder_vertices else None
+
+    # Triangles as they will be after the sort: faces keep their own corner order
+    sorted_totals = totals[faces]
+    sorted_starts = np.cumsum(sorted_totals) - sorted_totals
+    triangles = triangle_indices(corner_verts[corner_sorted], sorted_starts, sorted_totals)
+    if verts is not None:
+        rank = np.empty(len(verts), dtype=np.int64)
+        rank[verts] = np.arange(len(verts))
+        triangles = rank[triangles]
+    after = acmr(triangles)
+    if after >= before:
+        return before, before
+
+    _permute_mesh(mesh, faces, corner_sorted, verts)
+    return before, after
+
+
+def _gather_corners(starts, totals):
+    """Concatenate the corner ranges [start, start + total) of faces, vectorized."""
+    totals = totals.astype(np.int64)
+    offsets = np.cumsum(totals) - totals
+    return np.repeat(starts.astype(np.int64) - offsets, totals) + np.arange(int(totals.sum()), dtype=np.int64)
+
+
+def _bake_export_meshes(objects):
+    """Give each object the mesh the exporter would generate from its modifiers.
+
+    Armature modifiers are kept (switched off while baking): the exporter
+    skins the rest-pose mesh, so topology and order are those of the bake.
+    """
+    armatures = [m for obj in objects for m in obj.modifiers if m.type == 'ARMATURE' and m.show_viewport]
+    for modifier in armatures:
+        modifier.show_viewport = False
+    try:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        for obj in objects:
+            obj.data = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph))
+    finally:
+        for modifier in armatures:
+            modifier.show_viewport = True
+    for obj in objects:
+        for modifier in [m for m in obj.modifiers if m.type != 'ARMATURE']:
+            obj.modifiers.remove(modifier)
+
+
+def optimize_objects(dups, *, apply_modifiers):
+    """Optimize the mesh every copy is exported with, and measure ACMR on it.
+
+    With modifiers applied, generated geometry is baked first (rigs keep their
+    Armature modifier on the baked rest-pose mesh), so the order survives
+    export. Shape-keyed meshes with generating modifiers are skipped: the
+    exporter rebuilds their geometry. Mesh data still shared with an original
+    is copied before it is touched.
+
+    Returns:
+        List of (object_name, acmr_before, acmr_after).
+    """
+    meshes = [obj for obj in dups if obj.type == 'MESH' and obj.data is not None]
+    bake = []
+    if apply_modifiers:
+        for obj in meshes:
+            if any(m.type != 'ARMATURE' for m in obj.modifiers):
+                if obj.data.shape_keys is not None:
+                    continue
+                bake.append(obj)
+        if bake:
+            _bake_export_meshes(bake)
+
+    results = []
+    baked = set(bake)
+    for obj in meshes:
+        if obj not in baked:
+            if apply_modifiers and any(m.type != 'ARMATURE' for m in obj.modifiers):
+                continue
+            if obj.data.users > 1:
+                obj.data = obj.data.copy()
+        before, after = optimize_mesh(obj.data, reorder_vertices=not obj.vertex_groups)
+        results.append((obj.name, before, after))
+    return results
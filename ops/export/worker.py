@@ -0,0 +1,65 @@
+"""Background worker for parallel Unity FBX export.
+
+Started by ops/export/workers.py as:
+    blender --background snapshot.blend --factory-startup --python worker.py -- jobs.json results.json
+
+The add-on is imported straight from its folder (factory startup does not
+enable it), then the export operator runs once per job with only that job's
+root selected, so output matches the serial export path.
+"""
+import importlib
+import json
+import os
+import sys
+import time
+
+import bpy
+
+
+def _register_addon(addon_root):
+    sys.path.insert(0, os.path.dirname(addon_root))
+    addon = importlib.import_module(os.path.basename(addon_root))
+    addon.register()
+    return addon
+
+
+def _run_job(job, operator_settings):
+    view_layer = bpy.context.view_layer
+    obj = view_layer.objects.get(job["object"])
+    if obj is None:
+        raise RuntimeError(f"Object '{job['object']}' not found in snapshot")
+
+    for o in bpy.context.selected_objects:
+        o.select_set(False)
+    obj.select_set(True)
+    view_layer.objects.active = obj
+    # worker_mode keeps the parent process as the only manifest writer
+    bpy.ops.artistant.export_unity_fbx(worker_mode=True, **operator_settings)
+
+
+def main(argv):
+    job_path, result_path = argv[argv.index("--") + 1:][:2]
+    with open(job_path, "r", encoding="utf-8") as f:
+        spec = json.load(f)
+
+    _register_addon(spec["addon_root"])
+    scene = bpy.context.scene
+    scene.export_folder = spec["export_folder"]
+    scene.export_individual = True
+    scene.export_only_orphans = spec["only_orphans"]
+
+    results = []
+    for job in spec["jobs"]:
+        start = time.perf_counter()
+        try:
+            _run_job(job, spec["operator_settings"])
+            results.append({"path": job["path"], "ok": True, "error": "", "seconds": time.perf_counter() - start})
+        except Exception as e:
+            results.append({"path": job["path"], "ok": False, "error": str(e), "seconds": time.perf_counter() - start})
+
+    with open(result_path, "w", encoding="utf-8") as f:
+        json.dump(results, f)
+
+
+if __name__ == "__main__":
+    main(sys.argv)
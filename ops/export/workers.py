@@ -0,0 +1,93 @@
+import json
+import os
+import subprocess
+import tempfile
+
+import bpy
+
+from ...core.paths import addon_root_dir
+
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "worker.py")
+
+
+def default_worker_count():
+    """Leave one core for the UI process, but always allow at least one worker."""
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
+def _split_jobs(jobs, worker_count):
+    """Deal jobs round-robin so every worker gets a similar mix of large and small files."""
+    count = max(1, min(worker_count, len(jobs)))
+    return [jobs[i::count] for i in range(count)]
+
+
+def _log_tail(log_path, lines=5):
+    try:
+        with open(log_path, "r", encoding="utf-8", errors="replace") as f:
+            return " | ".join(f.read().strip().splitlines()[-lines:])
+    except OSError:
+        return "no worker log"
+
+
+def run_parallel_export(jobs, *, export_folder, only_orphans, operator_settings, worker_count):
+    """Export individual files across background Blender processes.
+
+    The current scene is saved to a temporary snapshot that every worker opens.
+    Each worker re-runs the Unity export operator for its share of root objects,
+    so the per-file pipeline (duplicate -> prepare -> _export_duplicate_set)
+    is exactly the one used by the serial path.
+
+    Args:
+        jobs: List of (export_path, root_object_name) pairs
+        export_folder: Destination folder shared by every job
+        only_orphans: Whether the jobs are orphan roots exported with their hierarchy
+        operator_settings: Operator keyword arguments forwarded to every worker
+        worker_count: Maximum number of concurrent Blender processes
+
+    Returns:
+        List of result dicts with "path", "ok", "error" and "seconds" keys.
+    """
+    with tempfile.TemporaryDirectory(prefix="artistant_export_") as tmp_dir:
+        snapshot_path = os.path.join(tmp_dir, "snapshot.blend")
+        bpy.ops.wm.save_as_mainfile(filepath=snapshot_path, copy=True, check_existing=False)
+
+        processes = []
+        for index, share in enumerate(_split_jobs(jobs, worker_count)):
+            job_path = os.path.join(tmp_dir, f"jobs_{index}.json")
+            result_path = os.path.join(tmp_dir, f"results_{index}.json")
+            log_path = os.path.join(tmp_dir, f"worker_{index}.log")
+            with open(job_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "addon_root": addon_root_dir(),
+                    "export_folder": export_folder,
+                    "only_orphans": only_orphans,
+                    "operator_settings": operator_settings,
+                    "jobs": [{"path": path, "object": name} for path, name in share],
+                }, f)
+            with open(log_path, "w", encoding="utf-8") as log:
+                process = subprocess.Popen(
+                    [
+                        bpy.app.binary_path,
+                        "--background",
+                        snapshot_path,
+                        "--factory-startup",
+                        "--python", WORKER_SCRIPT,
+                        "--", job_path, result_path,
+                    ],
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                )
+            processes.append((process, share, result_path, log_path))
+
+        results = []
+        for process, share, result_path, log_path in processes:
+            process.wait()
+            try:
+                with open(result_path, "r", encoding="utf-8") as f:
+                    results.extend(json.load(f))
+            except (OSError, ValueError):
+                # The worker died before writing results: fail every file it owned
+                error = f"worker exited with code {process.returncode}: {_log_tail(log_path)}"
+                results.extend({"path": path, "ok": False, "error": error, "seconds": 0.0} for path, _ in share)
+        return results
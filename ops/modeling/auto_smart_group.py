@@ -0,0 +1,165 @@
+import bpy
+import numpy as np
+from mathutils.kdtree import KDTree
+from ..common.bounds import BOUNDS_LOOSE, BOUNDS_MODE_ITEMS, object_bounds
+from ..common.hierarchy import parent_keep_transform
+from .smart_group import create_group_empty, fitted_matrix, group_members
+
+
+CLUSTER_DISTANCE = 'DISTANCE'
+CLUSTER_SIZE = 'SIZE'
+
+
+def _build_kdtree(points):
+    tree = KDTree(len(points))
+    for index, co in enumerate(points.tolist()):
+        tree.insert(co, index)
+    tree.balance()
+    return tree
+
+
+def cluster_by_distance(points, threshold):
+    """Label points so that any two within threshold of each other share a cluster.
+
+    Single-linkage clustering: one KD-tree range query per point feeds a
+    union-find, so the cost is O(n log n) plus the number of close pairs.
+
+    Returns:
+        (N,) int array of cluster labels.
+    """
+    count = len(points)
+    tree = _build_kdtree(points)
+    parent = list(range(count))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for index, co in enumerate(points.tolist()):
+        root = find(index)
+        for _co, other, _dist in tree.find_range(co, threshold):
+            other_root = find(other)
+            if other_root != root:
+                parent[other_root] = root
+    return np.array([find(i) for i in range(count)], dtype=np.int64)
+
+
+def cluster_by_size(points, size):
+    """Label points in spatially compact clusters of up to size points.
+
+    Seeds are taken in X order; each claims its nearest unclaimed points
+    through KD-tree k-nearest queries, doubling k only when the nearest
+    points are already claimed.
+
+    Returns:
+        (N,) int array of cluster labels.
+    """
+    count = len(points)
+    tree = _build_kdtree(points)
+    labels = np.full(count, -1, dtype=np.int64)
+    coords = points.tolist()
+    label = 0
+    for seed in np.argsort(points[:, 0], kind="stable").tolist():
+        if labels[seed] >= 0:
+            continue
+        query = size
+        while True:
+            hits = [index for _co, index, _dist in tree.find_n(coords[seed], query) if labels[index] < 0]
+            if len(hits) >= size or query >= count:
+                break
+            query = min(query * 2, count)
+        labels[hits[:size]] = label
+        label += 1
+    return labels
+
+
+class ARTISTANT_OT_auto_smart_group(bpy.types.Operator):
+    """Cluster the selection spatially and create one Smart Group per cluster"""
+    bl_idname = "artistant.auto_smart_group"
+    bl_label = "Auto Smart Group"
+    bl_description = (
+        "Cluster the selected objects by distance or by cluster size and create one "
+        "bounds-fitted cube Empty per cluster"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+
+    cluster_method: bpy.props.EnumProperty(
+        name="Cluster By",
+        items=(
+            (CLUSTER_DISTANCE, "Distance", "Chain objects whose bounds centers are within Distance"),
+            (CLUSTER_SIZE, "Size", "Split the selection into compact clusters of up to Size objects"),
+        ),
+        default=CLUSTER_DISTANCE,
+    )
+    distance: bpy.props.FloatProperty(
+        name="Distance",
+        description="Maximum gap between bounds centers of neighbouring objects in one cluster",
+        default=5.0,
+        min=0.0,
+        subtype='DISTANCE',
+    )
+    cluster_size: bpy.props.IntProperty(
+        name="Size",
+        description="Target number of objects per cluster",
+        default=16,
+        min=1,
+    )
+    min_size: bpy.props.IntProperty(
+        name="Min Objects",
+        description="Clusters with fewer objects are left ungrouped",
+        default=2,
+        min=1,
+    )
+    bounds_mode: bpy.props.EnumProperty(
+        name="Fit",
+        description="How each group box is fitted around its cluster",
+        items=BOUNDS_MODE_ITEMS,
+        default=BOUNDS_LOOSE,
+    )
+    reparent_ancestors: bpy.props.BoolProperty(
+        name="Re-parent Ancestors",
+        description="Cluster already-parented selections through their top-level ancestor",
+        default=False,
+    )
+
+    def execute(self, context):
+        selected_objects = context.selected_objects
+        members = group_members(selected_objects, self.reparent_ancestors)
+        if not members:
+            self.report({'ERROR'}, "No parentless objects selected")
+            return {'CANCELLED'}
+
+        # Cluster on loose bounds centers: one batched NumPy pass over all members
+        boxes = object_bounds(members, BOUNDS_LOOSE)
+        centers = np.array([(low + high) / 2.0 for low, high in boxes])
+        if self.cluster_method == CLUSTER_SIZE:
+            labels = cluster_by_size(centers, self.cluster_size)
+        else:
+            labels = cluster_by_distance(centers, self.distance)
+
+        clusters = {}
+        for obj, label in zip(members, labels.tolist()):
+            clusters.setdefault(label, []).append(obj)
+
+        depsgraph = context.evaluated_depsgraph_get()
+        groups = []
+        for cluster in clusters.values():
+            if len(cluster) < self.min_size:
+                continue
+            matrix = fitted_matrix(cluster, self.bounds_mode, depsgraph)
+            empty = create_group_empty(context, matrix, name="Cluster")
+            parent_keep_transform(cluster, empty, matrix)
+            groups.append(empty)
+
+        for obj in selected_objects:
+            obj.select_set(False)
+        for empty in groups:
+            empty.select_set(True)
+        if groups:
+            context.view_layer.objects.active = groups[0]
+
+        grouped = sum(len(c) for c in clusters.values() if len(c) >= self.min_size)
+        self.report({'INFO'}, f"Created {len(groups)} group(s) from {grouped} of {len(members)} object(s)")
+        return {'FINISHED'}
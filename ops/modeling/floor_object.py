@@ -1,19 +1,59 @@
 import bpy
 from bpy.types import Operator
+from mathutils import Matrix, Vector
+from ..common.bounds import BOUNDS_TIGHT, invalidate, object_bounds
+from ..common.ground_bvh import ground_bvh
+from ..common.hierarchy import HierarchyIndex, root_objects
+
+
+FLOOR_ORIGIN = 'ORIGIN'
+FLOOR_SURFACE = 'SURFACE'
 
 
 class ARTISTANT_OT_floor_object(Operator):
-    """Translate each selected object so its origin sits at world Z = 0"""
+    """Translate each selected object so its origin sits at world Z = 0, or drop it onto a ground surface"""
     bl_idname = "artistant.floor_object"
     bl_label = "Floor Object"
-    bl_description = "Move each selected object so its origin (pivot) is at world Z = 0"
+    bl_description = (
+        "Move each selected object so its origin (pivot) is at world Z = 0, "
+        "or drop it onto the Ground collection"
+    )
     bl_options = {'REGISTER', 'UNDO'}
 
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        items=(
+            (FLOOR_ORIGIN, "World Z = 0", "Move the origin to world Z = 0"),
+            (FLOOR_SURFACE, "Surface", "Drop straight down onto the meshes of the Ground collection"),
+        ),
+        default=FLOOR_ORIGIN,
+    )
+    use_lowest_point: bpy.props.BoolProperty(
+        name="Lowest Point",
+        description="Rest the lowest point of the geometry on the surface instead of the origin",
+        default=True,
+    )
+    align_to_normal: bpy.props.BoolProperty(
+        name="Align to Normal",
+        description="Tilt each object so its up axis follows the surface normal",
+        default=False,
+    )
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "mode")
+        col = layout.column()
+        col.enabled = self.mode == FLOOR_SURFACE
+        col.prop(self, "use_lowest_point")
+        col.prop(self, "align_to_normal")
+
     def execute(self, context):
         selected = context.selected_objects
         if not selected:
             self.report({'WARNING'}, "No objects selected")
             return {'CANCELLED'}
+        if self.mode == FLOOR_SURFACE:
+            return self._drop_to_surface(context, selected)
 
         count = 0
         for obj in selected:
@@ -33,3 +73,53 @@ class ARTISTANT_OT_floor_object(Operator):
 
         self.report({'INFO'}, f"Floored {count} object(s) to world Z = 0")
         return {'FINISHED'}
+
+    def _drop_to_surface(self, context, selected):
+        ground_collection = context.scene.floor_ground_collection
+        if ground_collection is None:
+            self.report({'ERROR'}, "Choose a Ground collection first")
+            return {'CANCELLED'}
+        ground = set(ground_collection.all_objects)
+        depsgraph = context.evaluated_depsgraph_get()
+        bvh = ground_bvh(ground, depsgraph)
+        if bvh is None:
+            self.report({'ERROR'}, f"'{ground_collection.name}' has no ground geometry")
+            return {'CANCELLED'}
+
+        # Children ride along with their parents, so only drop the selection's roots
+        movers = [obj for obj in root_objects(selected) if obj not in ground]
+        if self.use_lowest_point:
+            # The lowest point of a root's whole hierarchy rests on the surface, so
+            # children hanging below an empty or parent do not sink into the ground
+            hierarchy = HierarchyIndex(context.scene.objects)
+            members = [[o for o in hierarchy.descendants(obj) if o not in ground] for obj in movers]
+            unique = list({o: None for group in members for o in group})
+            low_z = {o: float(low[2]) for o, (low, _high) in zip(unique, object_bounds(unique, BOUNDS_TIGHT, depsgraph))}
+            lowest = [min(low_z[o] for o in group) for group in members]
+        else:
+            lowest = [obj.matrix_world.translation.z for obj in movers]
+
+        up = Vector((0.0, 0.0, 1.0))
+        count = missed = 0
+        for obj, low_z in zip(movers, lowest):
+            world = obj.matrix_world
+            hit = bvh.ray_down(world.translation.x, world.translation.y)
+            if hit is None:
+                missed += 1
+                continue
+            location, normal = hit
+            new_world = Matrix.Translation((0.0, 0.0, location.z - low_z)) @ world
+            if self.align_to_normal:
+                # Tilt about the contact point so the object stays on the surface
+                contact = Vector((world.translation.x, world.translation.y, location.z))
+                tilt = up.rotation_difference(normal).to_matrix().to_4x4()
+                new_world = Matrix.Translation(contact) @ tilt @ Matrix.Translation(-contact) @ new_world
+            obj.matrix_world = new_world
+            invalidate(obj)
+            count += 1
+
+        message = f"Dropped {count} object(s) onto '{ground_collection.name}'"
+        if missed:
+            message += f", {missed} missed the surface"
+        self.report({'WARNING'} if missed else {'INFO'}, message)
+        return {'FINISHED'}
@@ -1,5 +1,8 @@
 import bpy
 from bpy.types import Operator
+from mathutils import Matrix, Vector
+from ..common.bounds import BOUNDS_TIGHT, invalidate, object_bounds
+from ..common.hierarchy import HierarchyIndex
 
 
 class ARTISTANT_OT_floor_pivot(Operator):
@@ -23,7 +26,7 @@ class ARTISTANT_OT_floor_pivot(Operator):
         starting_mode = context.mode
         switched_to_object = False
 
-        # origin_set requires Object mode
+        # Mesh data can only be transformed outside Edit mode
         if context.mode != 'OBJECT':
             bpy.ops.object.mode_set(mode='OBJECT')
             switched_to_object = True
@@ -36,50 +39,50 @@ class ARTISTANT_OT_floor_pivot(Operator):
             return {'CANCELLED'}
 
         depsgraph = context.evaluated_depsgraph_get()
-        cursor = context.scene.cursor
 
-        # Snapshot cursor and selection so we can restore them after the operation
-        saved_cursor_loc = cursor.location.copy()
-        saved_selection = list(context.selected_objects)
-        saved_active = context.view_layer.objects.active
-
-        count = 0
+        # Pass 1: one local pivot offset per unique mesh, measured on the first
+        # selected user (with modifiers) before anything moves
+        offsets = {}
         for obj in selected_meshes:
-            # Evaluate the mesh with all modifiers applied
-            eval_obj = obj.evaluated_get(depsgraph)
-            mesh = eval_obj.to_mesh()
-            if not mesh or not mesh.vertices:
-                eval_obj.to_mesh_clear()
+            mesh = obj.data
+            if mesh in offsets or mesh.library is not None:
                 continue
+            if not len(mesh.vertices):
+                continue
+            # Tight bounds read the evaluated vertices (with modifiers) in world space
+            min_z = float(object_bounds([obj], BOUNDS_TIGHT, depsgraph)[0][0][2])
+            # Keep the pivot centred over the object, only dropping it to the bottom:
+            # the world-space move (0, 0, dz) expressed in the object's local axes
+            world = obj.matrix_world
+            dz = min_z - world.translation.z
+            offset = world.to_3x3().inverted_safe() @ Vector((0.0, 0.0, dz))
+            if offset.length_squared > 1e-18:
+                offsets[mesh] = offset
 
-            # Find the minimum world-space Z among all vertices
-            mat = obj.matrix_world
-            min_z = min((mat @ v.co).z for v in mesh.vertices)
-            eval_obj.to_mesh_clear()
-
-            # Place the 3D cursor at the object's current XY origin but at floor Z.
-            # This keeps the pivot centred over the object, only dropping it to the bottom.
-            world_origin = obj.matrix_world.translation
-            cursor.location = (world_origin.x, world_origin.y, min_z)
-
-            # Isolate the object so origin_set only affects this one
-            bpy.ops.object.select_all(action='DESELECT')
-            obj.select_set(True)
-            context.view_layer.objects.active = obj
-            bpy.ops.object.origin_set(type='ORIGIN_CURSOR', center='MEDIAN')
-            count += 1
+        # Pass 2: shift each mesh once and compensate every user (and its
+        # children) so nothing moves in world space
+        hierarchy = HierarchyIndex(bpy.data.objects)
+        users = {}
+        for obj in bpy.data.objects:
+            if obj.data in offsets:
+                users.setdefault(obj.data, []).append(obj)
 
-        # Restore cursor, selection, and active object
-        cursor.location = saved_cursor_loc
-        bpy.ops.object.select_all(action='DESELECT')
-        for obj in saved_selection:
-            obj.select_set(True)
-        if saved_active and saved_active.name in context.view_layer.objects:
-            context.view_layer.objects.active = saved_active
+        count = 0
+        for mesh, offset in offsets.items():
+            mesh.transform(Matrix.Translation(-offset), shape_keys=True)
+            mesh.update()
+            shift = Matrix.Translation(offset)
+            unshift = Matrix.Translation(-offset)
+            for user in users.get(mesh, ()):
+                user.matrix_world = user.matrix_world @ shift
+                invalidate(user)
+                for child in hierarchy.children(user):
+                    child.matrix_parent_inverse = unshift @ child.matrix_parent_inverse
+                count += 1
 
         # Return user to the mode they were in before running the operator
         if switched_to_object:
             bpy.ops.object.mode_set(mode=self._mode_for_mode_set(starting_mode))
 
-        self.report({'INFO'}, f"Floor pivot applied to {count} object(s)")
+        self.report({'INFO'}, f"Floor pivot applied to {count} object(s) sharing {len(offsets)} mesh(es)")
         return {'FINISHED'}
@@ -1,11 +1,62 @@
 import bpy
-from mathutils import Vector
+from mathutils import Matrix
+from ..common.bounds import BOUNDS_LOOSE, BOUNDS_MODE_ITEMS, BOUNDS_ORIENTED, world_bounds
+from ..common.hierarchy import parent_keep_transform, top_level_ancestor
+
+
+def group_members(selected_objects, reparent_ancestors=False):
+    """Objects a new group should adopt: the parentless selected objects.
+
+    With reparent_ancestors, parented selections contribute their top-level
+    ancestor instead of being skipped. Order follows the selection.
+    """
+    members = {}
+    for obj in selected_objects:
+        if obj.parent is None:
+            members[obj] = None
+        elif reparent_ancestors:
+            members[top_level_ancestor(obj)] = None
+    return list(members)
+
+
+def fitted_matrix(objects, bounds_mode, depsgraph):
+    """World matrix of a cube Empty fitted to the bounds of objects."""
+    bounds = world_bounds(objects, bounds_mode, depsgraph)
+    if bounds_mode == BOUNDS_ORIENTED:
+        return bounds.matrix()
+    min_bound, max_bound = bounds
+    return Matrix.LocRotScale((min_bound + max_bound) / 2, None, (max_bound - min_bound) / 2)
+
+
+def create_group_empty(context, matrix, name="Empty"):
+    """Add a cube Empty to the active collection with the given world matrix."""
+    empty = bpy.data.objects.new(name, None)
+    empty.empty_display_type = 'CUBE'
+    context.collection.objects.link(empty)
+    empty.matrix_world = matrix
+    return empty
 
 
 class ARTISTANT_OT_smart_group_operator(bpy.types.Operator):
     """Create a bounding-box EMPTY parent for selected objects (like Maya's group)"""
     bl_idname = "artistant.smart_group_operator"
     bl_label = "Smart Group"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    bounds_mode: bpy.props.EnumProperty(
+        name="Fit",
+        description="How the group box is fitted around the selection",
+        items=BOUNDS_MODE_ITEMS,
+        default=BOUNDS_LOOSE,
+    )
+    reparent_ancestors: bpy.props.BoolProperty(
+        name="Re-parent Ancestors",
+        description=(
+            "Group already-parented selections by re-parenting their top-level ancestor "
+            "instead of leaving them out"
+        ),
+        default=False,
+    )
 
     def execute(self, context):
         selected_objects = context.selected_objects
@@ -13,32 +64,20 @@ class ARTISTANT_OT_smart_group_operator(bpy.types.Operator):
             self.report({'ERROR'}, "No objects selected")
             return {'CANCELLED'}
 
-        # Create empty cube (parent object)
-        bpy.ops.object.empty_add(type='CUBE')
-        empty = context.object
+        members = group_members(selected_objects, self.reparent_ancestors)
+        fit_objects = list(dict.fromkeys([*selected_objects, *members]))
 
-        # Calculate bounding box of all selected objects
-        min_bound = Vector((float('inf'), float('inf'), float('inf')))
-        max_bound = Vector((float('-inf'), float('-inf'), float('-inf')))
-        for obj in selected_objects:
-            # Transform each vertex to world space and update bounds
-            for vertex in obj.bound_box:
-                world_vertex = obj.matrix_world @ Vector(vertex)
-                min_bound = Vector((min(min_bound.x, world_vertex.x), min(min_bound.y, world_vertex.y), min(min_bound.z, world_vertex.z)))
-                max_bound = Vector((max(max_bound.x, world_vertex.x), max(max_bound.y, world_vertex.y), max(max_bound.z, world_vertex.z)))
+        # Create the empty cube (parent object) fitted to the bounds
+        matrix = fitted_matrix(fit_objects, self.bounds_mode, context.evaluated_depsgraph_get())
+        empty = create_group_empty(context, matrix)
 
-        # Position and scale empty to match bounding box
-        empty.location = (min_bound + max_bound) / 2
-        empty.scale = (max_bound - min_bound) / 2
+        # Parent members in one data-API pass (keeping their transforms)
+        count = parent_keep_transform(members, empty, matrix)
 
-        # Parent selected objects to the empty (keeping their transforms)
         for obj in selected_objects:
-            if obj.parent is None:
-                obj.select_set(True)
-                empty.select_set(True)
-                context.view_layer.objects.active = empty
-                bpy.ops.object.parent_set(type='OBJECT', keep_transform=True)
-                obj.select_set(False)
-
-        self.report({'INFO'}, "Smart group created")
+            obj.select_set(False)
+        empty.select_set(True)
+        context.view_layer.objects.active = empty
+
+        self.report({'INFO'}, f"Smart group created with {count} object(s)")
         return {'FINISHED'}
@@ -0,0 +1,213 @@
+import fnmatch
+import re
+
+import bpy
+import numpy as np
+
+
+MATCH_CONTAINS = 'CONTAINS'
+MATCH_EXACT = 'EXACT'
+MATCH_GLOB = 'GLOB'
+MATCH_REGEX = 'REGEX'
+
+MATCH_ITEMS = (
+    (MATCH_CONTAINS, "Contains", "Name contains the text (case-insensitive)"),
+    (MATCH_EXACT, "Exact", "Name is exactly the text"),
+    (MATCH_GLOB, "Glob", "Shell-style wildcards: * ? [abc] (case-insensitive)"),
+    (MATCH_REGEX, "Regex", "Python regular expression searched in the name (case-insensitive)"),
+)
+
+# Glob characters that are not literal text
+_GLOB_SPECIAL = re.compile(r"[*?\[\]]")
+# A whole [...] / [!...] set; a leading ] is part of the set, as in fnmatch
+_GLOB_SET = re.compile(r"\[!?\]?[^\]]*\]")
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def glob_literals(query):
+    """Literal runs of a glob that every match must contain ([...] sets count as wildcards)."""
+    return [part for part in _GLOB_SPECIAL.split(_GLOB_SET.sub("*", query)) if part]
+
+
+def compile_pattern(query, match):
+    """Compile a glob or regex query into a case-insensitive regex; raises re.error if invalid."""
+    if match == MATCH_GLOB:
+        return re.compile(fnmatch.translate(query), re.IGNORECASE)
+    return re.compile(query, re.IGNORECASE)
+
+
+class NameIndex:
+    """Lower-cased object names with a trigram index for substring lookups.
+
+    Entries are keyed by session_uid so renames can be applied in place.
+    Contains and glob queries intersect the trigram sets of their literal
+    text before verifying candidates, instead of scanning every name.
+    """
+
+    def __init__(self):
+        self._names = {}
+        self._lower = {}
+        self._by_name = {}
+        self._trigrams = {}
+        self.generation = 0
+
+    def __len__(self):
+        return len(self._names)
+
+    def rebuild(self, objects):
+        self.__init__()
+        for obj in objects:
+            self._add(obj.session_uid, obj.name)
+        self.generation += 1
+
+    def _add(self, uid, name):
+        lower = name.lower()
+        self._names[uid] = name
+        self._lower[uid] = lower
+        self._by_name[name] = uid
+        for gram in _trigrams(lower):
+            self._trigrams.setdefault(gram, set()).add(uid)
+
+    def _remove(self, uid):
+        name = self._names.pop(uid)
+        lower = self._lower.pop(uid)
+        if self._by_name.get(name) == uid:
+            del self._by_name[name]
+        for gram in _trigrams(lower):
+            uids = self._trigrams.get(gram)
+            if uids is not None:
+                uids.discard(uid)
+                if not uids:
+                    del self._trigrams[gram]
+
+    def update(self, uid, name):
+        """Add an object, or re-index it if its name changed. Returns True on change."""
+        if self._names.get(uid) == name:
+            return False
+        if uid in self._names:
+            self._remove(uid)
+        self._add(uid, name)
+        self.generation += 1
+        return True
+
+    def sync(self, objects):
+        """Apply adds, removals and renames against the current objects."""
+        current = {obj.session_uid: obj.name for obj in objects}
+        changed = False
+        for uid in [uid for uid in self._names if uid not in current]:
+            self._remove(uid)
+            changed = True
+        for uid, name in current.items():
+            changed |= self.update(uid, name)
+        if changed:
+            self.generation += 1
+
+    def _candidates(self, literal):
+        """uids whose lower-cased name may contain literal (None = every name)."""
+        grams = _trigrams(literal)
+        if not grams:
+            return None
+        sets = sorted((self._trigrams.get(gram, set()) for gram in grams), key=len)
+        return set.intersection(*sets)
+
+    def find(self, query, match=MATCH_CONTAINS):
+        """Names matching query, sorted. Raises re.error for an invalid glob/regex."""
+        if match == MATCH_EXACT:
+            return [query] if query in self._by_name else []
+        lower = query.lower()
+        if match == MATCH_CONTAINS:
+            uids = self._candidates(lower)
+            pool = self._lower.items() if uids is None else ((uid, self._lower[uid]) for uid in uids)
+            return sorted(self._names[uid] for uid, name in pool if lower in name)
+
+        pattern = compile_pattern(query, match)
+        uids = None
+        if match == MATCH_GLOB:
+            literals = [part for part in glob_literals(lower) if len(part) >= 3]
+            if literals:
+                uids = self._candidates(max(literals, key=len))
+        names = self._names.values() if uids is None else (self._names[uid] for uid in uids)
+        if match == MATCH_GLOB:
+            return sorted(name for name in names if pattern.match(name))
+        return sorted(name for name in names if pattern.search(name))
+
+
+_index = NameIndex()
+_state = {"dirty": True, "uids": None}
+
+# (query, match, generation) -> matching names, reused while the panel redraws
+_last_query = {"key": None, "names": []}
+
+
+def _object_uids(objects):
+    uids = np.empty(len(objects), dtype=np.int32)
+    objects.foreach_get("session_uid", uids)
+    return uids
+
+
+def name_index():
+    """The shared index of bpy.data.objects names, synced when objects were added or removed.
+
+    Depsgraph updates do not report deleted objects, so every call compares
+    the session uids of bpy.data.objects (one bulk read) with the last call
+    and syncs on any difference, even when the object count is unchanged.
+    """
+    objects = bpy.data.objects
+    uids = _object_uids(objects)
+    if _state["dirty"]:
+        _index.rebuild(objects)
+    elif not np.array_equal(uids, _state["uids"]):
+        _index.sync(objects)
+    _state["dirty"] = False
+    _state["uids"] = uids
+    return _index
+
+
+def find_names(query, match=MATCH_CONTAINS):
+    """Cached name_index().find(); raises re.error for an invalid glob/regex."""
+    index = name_index()
+    key = (query, match, index.generation)
+    if _last_query["key"] != key:
+        _last_query["names"] = index.find(query, match)
+        _last_query["key"] = key
+    return _last_query["names"]
+
+
+@bpy.app.handlers.persistent
+def _on_depsgraph_update(scene, depsgraph):
+    if _state["dirty"]:
+        return
+    for update in depsgraph.updates:
+        obj = update.id
+        if isinstance(obj, bpy.types.Object):
+            # Updates carry evaluated copies; the original holds the user-facing name
+            obj = obj.original
+            _index.update(obj.session_uid, obj.name)
+
+
+@bpy.app.handlers.persistent
+def _on_reset(*_args):
+    _state["dirty"] = True
+
+
+_RESET_HANDLERS = ("undo_post", "redo_post", "load_post")
+
+
+def register_name_index():
+    """Install the handlers that keep the object name index up to date."""
+    bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    for name in _RESET_HANDLERS:
+        getattr(bpy.app.handlers, name).append(_on_reset)
+
+
+def unregister_name_index():
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    for name in _RESET_HANDLERS:
+        handlers = getattr(bpy.app.handlers, name)
+        if _on_reset in handlers:
+            handlers.remove(_on_reset)
+    _state["dirty"] = True
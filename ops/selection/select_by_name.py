@@ -1,25 +1,44 @@
+import re
+
 import bpy
 from bpy.types import Operator
-from bpy.props import StringProperty, BoolProperty
+from bpy.props import StringProperty, EnumProperty
+from .name_index import MATCH_CONTAINS, MATCH_ITEMS, find_names
+
+
+ACTION_SET = 'SET'
+ACTION_ADD = 'ADD'
+ACTION_RESTRICT = 'RESTRICT'
+
+ACTION_ITEMS = (
+    (ACTION_SET, "Set", "Replace the selection with the matches"),
+    (ACTION_ADD, "Add", "Add the matches to the current selection"),
+    (ACTION_RESTRICT, "Restrict", "Keep only the currently selected objects that match"),
+)
 
 
 class ARTISTANT_OT_select_by_name(Operator):
-    """Select objects by name (exact or contains)"""
+    """Select objects by name (contains, exact, glob or regex)"""
     bl_idname = "artistant.select_by_name"
     bl_label = "Select By Name"
-    bl_description = "Select objects whose name matches (Exact) or contains the query"
+    bl_description = "Select objects whose name matches the query (contains, exact, glob or regex)"
     bl_options = {'REGISTER', 'UNDO'}
 
     # These are set by the panel when invoking the operator
     query: StringProperty(
         name="Name",
-        description="Text to match against object names",
+        description="Text or pattern to match against object names",
         default=""
     )
-    exact: BoolProperty(
-        name="Exact",
-        description="Exact match (OFF = contains, case-insensitive)",
-        default=False
+    match: EnumProperty(
+        name="Match",
+        items=MATCH_ITEMS,
+        default=MATCH_CONTAINS
+    )
+    action: EnumProperty(
+        name="Selection",
+        items=ACTION_ITEMS,
+        default=ACTION_SET
     )
 
     def execute(self, context):
@@ -36,26 +55,40 @@ class ARTISTANT_OT_select_by_name(Operator):
             except Exception:
                 pass
 
-        # Clear the selection before performing the search
-        bpy.ops.object.select_all(action='DESELECT')
+        # Look matches up in the name index instead of scanning every object
+        try:
+            names = find_names(query, self.match)
+        except re.error as exc:
+            self.report({'ERROR'}, f"Invalid pattern '{query}': {exc}")
+            return {'CANCELLED'}
 
-        # Prepare for case-insensitive search if not exact match
-        q_lower = query.lower()
+        view_layer = context.view_layer
+        layer_objects = view_layer.objects
+        objects = bpy.data.objects
         matches = []
+        for name in names:
+            obj = objects.get(name)
+            if obj is not None and obj.name in layer_objects:
+                matches.append(obj)
 
-        # Search through all objects in current view layer
-        for obj in context.view_layer.objects:
-            name = obj.name
-            # Check if name matches (exact or contains)
-            is_match = (name == query) if self.exact else (q_lower in name.lower())
-            if is_match:
+        if self.action == ACTION_RESTRICT:
+            keep = {obj for obj in matches if obj.select_get()}
+            for obj in context.selected_objects:
+                if obj not in keep:
+                    obj.select_set(False)
+            matches = [obj for obj in matches if obj in keep]
+        else:
+            if self.action == ACTION_SET:
+                # Only the selected objects need clearing, not the whole view layer
+                for obj in context.selected_objects:
+                    obj.select_set(False)
+            for obj in matches:
                 obj.select_set(True)
-                matches.append(obj)
 
         # Report results and set active object for convenience
         if matches:
             try:
-                context.view_layer.objects.active = matches[0]
+                view_layer.objects.active = matches[0]
             except Exception:
                 pass
             self.report({'INFO'}, f"Selected {len(matches)} object(s) matching '{query}'.")
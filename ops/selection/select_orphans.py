@@ -1,5 +1,6 @@
 import bpy
 from bpy.types import Operator
+from ..common.hierarchy import HierarchyIndex
 
 
 class ARTISTANT_OT_select_orphans(Operator):
@@ -17,22 +18,19 @@ class ARTISTANT_OT_select_orphans(Operator):
 
         if not selected:
             # Case A — nothing selected: select every parentless object in the scene
-            count = 0
-            for obj in context.scene.objects:
-                if obj.parent is None:
-                    obj.select_set(True)
-                    count += 1
-            self.report({'INFO'}, f"Selected {count} orphan object(s)")
+            orphans = HierarchyIndex(context.scene.objects).orphans()
+            for obj in orphans:
+                obj.select_set(True)
+            self.report({'INFO'}, f"Selected {len(orphans)} orphan object(s)")
         else:
             # Case B — filter current selection: deselect objects that have a parent
-            kept = 0
+            orphans = set(HierarchyIndex(selected).orphans())
+            kept = len(orphans)
             removed = 0
             for obj in selected:
-                if obj.parent is not None:
+                if obj not in orphans:
                     obj.select_set(False)
                     removed += 1
-                else:
-                    kept += 1
             self.report(
                 {'INFO'},
                 f"Kept {kept} orphan(s), deselected {removed} parented object(s)",
@@ -0,0 +1,26 @@
+"""pytest setup for the add-on's bpy-free tests.
+
+The repository root is the Blender add-on package itself and its
+__init__.py imports bpy, so pytest must not collect the root as a package
+(it would import that __init__.py). Tests load the modules they need by path.
+"""
+import pytest
+
+
+class _AddonRootAsDirectory:
+    """Collect the add-on package directory as a plain directory."""
+
+    def __init__(self, root):
+        self.root = root
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collect_directory(self, path, parent):
+        if path == self.root:
+            return pytest.Dir.from_parent(parent, path=path)
+        return None
+
+
+def pytest_configure(config):
+    root = config.rootpath
+    if (root / "__init__.py").is_file():
+        config.pluginmanager.register(_AddonRootAsDirectory(root), "artistant-addon-root")
@@ -0,0 +1,70 @@
+import importlib.util
+import os
+import unittest
+
+
+def _load_rect_pack():
+    # Loaded by path: the add-on package itself needs bpy, this module does not
+    path = os.path.join(os.path.dirname(__file__), os.pardir, "ops", "export", "rect_pack.py")
+    spec = importlib.util.spec_from_file_location("rect_pack", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+pack_rects = _load_rect_pack().pack_rects
+
+
+def _padded_rect(size, placement, padding):
+    (w, h), (_b, x, y) = size, placement
+    return x - padding, y - padding, x + w + padding, y + h + padding
+
+
+class PackRectsTest(unittest.TestCase):
+    def assert_valid(self, sizes, max_size, padding):
+        placements, bins = pack_rects(sizes, max_size, padding)
+        self.assertEqual(len(placements), len(sizes))
+        for bin_w, bin_h in bins:
+            self.assertLessEqual(bin_w, max_size)
+            self.assertLessEqual(bin_h, max_size)
+            self.assertEqual(bin_w & (bin_w - 1), 0)
+            self.assertEqual(bin_h & (bin_h - 1), 0)
+        rects = [_padded_rect(s, p, padding) for s, p in zip(sizes, placements)]
+        for i, (x0, y0, x1, y1) in enumerate(rects):
+            bin_w, bin_h = bins[placements[i][0]]
+            self.assertGreaterEqual(x0, 0)
+            self.assertGreaterEqual(y0, 0)
+            self.assertLessEqual(x1, bin_w)
+            self.assertLessEqual(y1, bin_h)
+            for j in range(i + 1, len(rects)):
+                if placements[i][0] != placements[j][0]:
+                    continue
+                a0, b0, a1, b1 = rects[j]
+                overlap = x0 < a1 and a0 < x1 and y0 < b1 and b0 < y1
+                self.assertFalse(overlap, f"rects {i} and {j} overlap")
+        return placements, bins
+
+    def test_single_rect_shrinks_bin_to_power_of_two(self):
+        placements, bins = self.assert_valid([(100, 60)], 1024, 4)
+        self.assertEqual(placements, [(0, 4, 4)])
+        self.assertEqual(bins, [(128, 128)])
+
+    def test_mixed_sizes_do_not_overlap(self):
+        sizes = [(256, 256), (128, 64), (4, 4), (512, 128), (64, 300), (4, 4), (200, 200)] * 3
+        self.assert_valid(sizes, 1024, 4)
+
+    def test_overflow_opens_new_bins(self):
+        placements, bins = self.assert_valid([(500, 500)] * 5, 1024, 2)
+        self.assertEqual(len(bins), 2)
+        self.assertEqual(sorted(b for b, _x, _y in placements), [0, 0, 0, 0, 1])
+
+    def test_rect_larger_than_bin_raises(self):
+        with self.assertRaises(ValueError):
+            pack_rects([(1020, 10)], 1024, 4)
+
+    def test_empty_input(self):
+        self.assertEqual(pack_rects([], 1024, 4), ([], []))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,11 @@
+import re
+
 import bpy
+from ..ops.selection.name_index import find_names
+
+
+# Matching names listed under the Select By Name query
+NAME_PREVIEW_COUNT = 8
 
 
 class ARTISTANT_PT_panel(bpy.types.Panel):
@@ -12,6 +19,24 @@ class ARTISTANT_PT_panel(bpy.types.Panel):
     bl_region_type = 'UI'
     bl_category = 'Artistant'
 
+    @staticmethod
+    def _draw_name_preview(layout, scene):
+        query = scene.select_by_name_query.strip()
+        if not query:
+            return
+        try:
+            names = find_names(query, scene.select_by_name_match)
+        except re.error:
+            layout.label(text="Invalid pattern", icon='ERROR')
+            return
+        layout.label(text=f"{len(names)} match(es)", icon='VIEWZOOM')
+        preview = layout.column(align=True)
+        preview.scale_y = 0.8
+        for name in names[:NAME_PREVIEW_COUNT]:
+            preview.label(text=name, icon='OBJECT_DATA')
+        if len(names) > NAME_PREVIEW_COUNT:
+            preview.label(text=f"... and {len(names) - NAME_PREVIEW_COUNT} more")
+
     def draw(self, context):
         # Draw the panel UI with four main sections: Tools, Export, Select, Utilities."""
         layout = self.layout
@@ -22,10 +47,11 @@ class ARTISTANT_PT_panel(bpy.types.Panel):
         col = tools_box.column(align=True)
         in_object_mode = (context.mode == 'OBJECT')
 
-        # Smart Group: Object mode only
+        # Smart Group and Auto Smart Group: Object mode only
         row = col.row(align=True)
         row.enabled = in_object_mode
         row.operator("artistant.smart_group_operator", text="Smart Group", icon='GROUP')
+        row.operator("artistant.auto_smart_group", text="Auto Group", icon='STICKY_UVS_LOC')
 
         col.separator()
         # Floor Pivot: works in Object mode and Edit Mesh mode
@@ -36,6 +62,14 @@ class ARTISTANT_PT_panel(bpy.types.Panel):
         row = col.row(align=True)
         row.enabled = in_object_mode
         row.operator("artistant.floor_object", text="Floor Object", icon='SORT_ASC')
+        # Drop to Surface: Floor Object onto the Ground collection
+        row = col.row(align=True)
+        row.enabled = in_object_mode
+        row.prop(context.scene, "floor_ground_collection", text="")
+        surface_row = row.row(align=True)
+        surface_row.enabled = context.scene.floor_ground_collection is not None
+        op = surface_row.operator("artistant.floor_object", text="Drop", icon='SNAP_FACE')
+        op.mode = 'SURFACE'
 
         col.separator()
         # Select Orphans: Object mode only
@@ -62,8 +96,84 @@ class ARTISTANT_PT_panel(bpy.types.Panel):
         orphan_row = col.row(align=True)
         orphan_row.enabled = context.scene.export_individual
         orphan_row.prop(context.scene, "export_only_orphans", text="Only Orphans (Root at 0,0,0)")
-        # Main export operator
+        # Instance-aware export: shared meshes / collection instances written once
+        instance_row = col.row(align=True)
+        instance_row.enabled = context.scene.export_individual
+        instance_row.prop(context.scene, "export_instance_aware")
+        # Parallel export: background worker processes for individual files
+        parallel_row = col.row(align=True)
+        parallel_row.enabled = context.scene.export_individual
+        parallel_row.prop(context.scene, "export_parallel")
+        workers_row = parallel_row.row(align=True)
+        workers_row.enabled = context.scene.export_parallel
+        workers_row.prop(context.scene, "export_workers")
+        # Zero-duplicate pipeline: shared-data copies instead of operator duplicates
+        col.prop(context.scene, "export_zero_duplicate")
+        # Fast static FBX writer with automatic fallback to the stock exporter
+        col.prop(context.scene, "export_native_fbx")
+        # Incremental export: skip files whose content hash is unchanged
+        col.prop(context.scene, "export_skip_unchanged")
+        # Shared texture store: each texture written once per export folder
+        col.prop(context.scene, "export_texture_store")
+        # Mesh validation of the export copies; failing is only meaningful when validating
+        validate_row = col.row(align=True)
+        validate_row.prop(context.scene, "export_validate")
+        fail_row = validate_row.row(align=True)
+        fail_row.enabled = context.scene.export_validate != 'OFF'
+        fail_row.prop(context.scene, "export_validate_fail")
+        # Texture atlas: size only matters when enabled
+        atlas_row = col.row(align=True)
+        atlas_row.prop(context.scene, "export_atlas")
+        atlas_size_row = atlas_row.row(align=True)
+        atlas_size_row.enabled = context.scene.export_atlas
+        atlas_size_row.prop(context.scene, "export_atlas_size", text="")
+        # Merge by material only applies to batch (non-individual) export
+        merge_row = col.row(align=True)
+        merge_row.enabled = not context.scene.export_individual
+        merge_row.prop(context.scene, "export_merge_by_material")
+        merge_limit_row = merge_row.row(align=True)
+        merge_limit_row.enabled = context.scene.export_merge_by_material
+        merge_limit_row.prop(context.scene, "export_merge_max_verts")
+        # LOD chain: levels field only matters when LODs are on
+        lod_row = col.row(align=True)
+        lod_row.prop(context.scene, "export_lods")
+        levels_row = lod_row.row(align=True)
+        levels_row.enabled = context.scene.export_lods
+        levels_row.prop(context.scene, "export_lod_ratios", text="")
+        # Vertex cache reordering of the export copies
+        col.prop(context.scene, "export_vertex_cache")
+        # Animation export with keyframe reduction tolerances
+        col.prop(context.scene, "export_animation")
+        anim_col = col.column(align=True)
+        anim_col.enabled = context.scene.export_animation
+        anim_col.prop(context.scene, "export_anim_reduce")
+        tolerance_col = anim_col.column(align=True)
+        tolerance_col.enabled = context.scene.export_anim_reduce
+        tolerance_col.prop(context.scene, "export_anim_position_tolerance")
+        tolerance_col.prop(context.scene, "export_anim_rotation_tolerance")
+        tolerance_col.prop(context.scene, "export_anim_scale_tolerance")
+        # Skin weight budget for skinned meshes
+        col.prop(context.scene, "export_skin_optimize")
+        skin_row = col.row(align=True)
+        skin_row.enabled = context.scene.export_skin_optimize
+        skin_row.prop(context.scene, "export_skin_max_influences")
+        skin_row.prop(context.scene, "export_skin_prune_threshold")
+        # Convex collision hulls: count and vertex cap only matter when enabled
+        col.prop(context.scene, "export_collision")
+        hull_row = col.row(align=True)
+        hull_row.enabled = context.scene.export_collision
+        hull_row.prop(context.scene, "export_collision_hulls")
+        hull_row.prop(context.scene, "export_collision_max_verts")
+        # Per-phase profiling of the export pipeline
+        col.prop(context.scene, "export_profile")
+        # Main export operator, or the running export's progress while the queue is busy
+        wm = context.window_manager
+        if wm.artistant_export_status:
+            export_box.progress(factor=wm.artistant_export_progress, type='BAR', text=wm.artistant_export_status)
         col.operator("artistant.export_unity_fbx", text="Export to FBX", icon='FILE_FOLDER')
+        # Same export, ignoring the manifest and rewriting every file
+        op = col.operator("artistant.export_unity_fbx", text="Force Re-export All", icon='FILE_REFRESH')
+        op.force_export = True
 
         # --- Selection Section: Find and Select by Name ---
         select_box = layout.box()
@@ -72,12 +182,16 @@ class ARTISTANT_PT_panel(bpy.types.Panel):
         col.enabled = (context.mode == 'OBJECT')
         # Name query input field
         col.prop(context.scene, "select_by_name_query", text="Name")
-        # Exact match vs contains match toggle
-        col.prop(context.scene, "select_by_name_exact", text="Exact")
+        # Match mode (contains, exact, glob, regex) and selection action
+        col.row(align=True).prop(context.scene, "select_by_name_match", expand=True)
+        col.row(align=True).prop(context.scene, "select_by_name_action", expand=True)
+        # Live match count and preview of the first matching names
+        self._draw_name_preview(col, context.scene)
         # Perform the selection
         op = col.operator("artistant.select_by_name", text="Select", icon='RESTRICT_SELECT_OFF')
         op.query = context.scene.select_by_name_query
-        op.exact = context.scene.select_by_name_exact
+        op.match = context.scene.select_by_name_match
+        op.action = context.scene.select_by_name_action
 
         # --- Utilities Section: Image and Asset Management ---
         util_box = layout.box()